@@ -2,7 +2,11 @@
 extract_symbols.py
 
 This script fetches NSE and BSE stock symbols and saves a combined list to a CSV file
-with duplicates removed.
+with duplicates removed. Every symbol is saved with its exchange and Yahoo Finance
+ticker (`.NS` for NSE, `.BO` for BSE) so the scanner never guesses the suffix.
+Companies listed on both exchanges are collapsed to one listing per ISIN,
+preferring NSE for its liquidity. A BSE-only company whose Security Id is taken by
+another company's NSE symbol keeps its Yahoo ticker (e.g. `XYZ.BO`) as its symbol.
 
 Usage:
     python extract_symbols.py
@@ -22,6 +26,7 @@ import pandas as pd
 from selenium import webdriver
 from splinter import Browser
 from utils.cleaner import cleanup_generated_files
+from utils.config import EXCHANGE_SUFFIXES, UNIVERSE_COLUMNS
 
 # -------------------------
 # Variables and Paths
@@ -48,11 +53,14 @@ def fetch_nse_symbols(url: str):
         session.close()
 
         df_nse = pd.read_csv(io.BytesIO(response.content))
+        df_nse.columns = df_nse.columns.str.strip()  # The file pads " ISIN NUMBER"
         print(f"✅ NSE symbols Extracted. Total: {len(df_nse)}")
-        return df_nse["SYMBOL"].tolist()
+        return df_nse.rename(columns={"SYMBOL": "symbol", "ISIN NUMBER": "isin"})[
+            ["symbol", "isin"]
+        ]
     except Exception as e:
         print(f"❌ Failed to fetch NSE symbols: {e}")
-        return []
+        return pd.DataFrame(columns=["symbol", "isin"])
 
 
 def fetch_bse_security_ids(data_dir: str):
@@ -81,28 +89,72 @@ def fetch_bse_security_ids(data_dir: str):
         if os.path.exists(csv_file_path):
             df_bse = pd.read_csv(csv_file_path)
             print(f"✅ BSE Symbols Extracted. Total: {len(df_bse)}")
-            return df_bse["Security Id"].tolist()
+            return df_bse.rename(columns={"Security Id": "symbol", "ISIN No": "isin"})[
+                ["symbol", "isin"]
+            ]
         else:
             print("❌ BSE download failed. File not found.")
-            return []
+            return pd.DataFrame(columns=["symbol", "isin"])
     except Exception as e:
         print(f"❌ Failed to fetch BSE Security Ids: {e}")
-        return []
+        return pd.DataFrame(columns=["symbol", "isin"])
     finally:
         browser.quit()
 
 
-def merge_and_save_unique(list1, list2, output_file):
-    combined = sorted(set(list1 + list2))
-    pd.Series(combined).to_csv(output_file, index=False, header=False)
-    print(f"✅ Combined symbols saved to {output_file}. Total unique: {len(combined)}")
+def merge_and_save_unique(nse_listings, bse_listings, output_file):
+    # NSE listings come first so they win on ISIN and ticker clashes (more liquid)
+    combined = pd.concat(
+        [nse_listings.assign(exchange="NSE"), bse_listings.assign(exchange="BSE")],
+        ignore_index=True,
+    )
+    combined["symbol"] = combined["symbol"].astype(str).str.strip()
+    combined["isin"] = combined["isin"].astype(str).str.strip().str.upper()
+    total = len(combined)
+
+    # One primary listing per company; listings without an ISIN are kept
+    has_isin = combined["isin"].str.match(r"^[A-Z]{2}[A-Z0-9]{9}[0-9]$")
+    combined = combined[~(has_isin & combined.duplicated(subset="isin"))].copy()
+    has_isin = has_isin[combined.index]
+    isin_duplicates = total - len(combined)
+    combined["yahoo_symbol"] = combined["symbol"] + combined["exchange"].map(
+        EXCHANGE_SUFFIXES
+    )
+
+    # A BSE Security Id can match an unrelated NSE symbol; both ISINs being known
+    # (and different, after the collapse) tells them apart, so the later company
+    # is kept under its Yahoo ticker instead of being dropped
+    first_has_isin = has_isin.groupby(combined["symbol"]).transform("first")
+    distinct = combined.duplicated(subset="symbol") & has_isin & first_has_isin
+    combined.loc[distinct, "symbol"] = combined.loc[distinct, "yahoo_symbol"]
+    renamed = combined.loc[distinct, "symbol"].tolist()
+    clashes = combined.duplicated(subset="symbol")
+    dropped = combined.loc[clashes, "yahoo_symbol"].tolist()
+    combined = combined[~clashes].copy()
+    combined["isin"] = combined["isin"].where(has_isin[combined.index])
+    combined = combined.sort_values("symbol")[UNIVERSE_COLUMNS]
+    combined.to_csv(output_file, index=False)
+    counts = combined["exchange"].value_counts()
+    print(
+        f"✅ Combined symbols saved to {output_file}. Total unique: {len(combined)} "
+        f"(NSE: {counts.get('NSE', 0)}, BSE only: {counts.get('BSE', 0)})"
+    )
+    print(
+        f"🧹 Removed {isin_duplicates} dual-listed duplicate(s) by ISIN and "
+        f"{len(dropped)} by ticker{': ' + ', '.join(dropped) if dropped else ''}."
+    )
+    if renamed:
+        print(
+            f"🔀 Kept {len(renamed)} listing(s) whose ticker belongs to another "
+            f"company under their Yahoo ticker: {', '.join(renamed)}"
+        )
 
 
 # -------------------------
 # Main Execution
 # -------------------------
 if __name__ == "__main__":
-    nse_symbols = fetch_nse_symbols(NSE_URL)
-    bse_symbols = fetch_bse_security_ids(DATA_DIR)
-    merge_and_save_unique(nse_symbols, bse_symbols, COMBINED_OUTPUT)
+    nse_listings = fetch_nse_symbols(NSE_URL)
+    bse_listings = fetch_bse_security_ids(DATA_DIR)
+    merge_and_save_unique(nse_listings, bse_listings, COMBINED_OUTPUT)
     cleanup_generated_files()
@@ -13,8 +13,11 @@ import sys
 import os
 import time
 import argparse
+import threading
 import logging  # Import the logging module
-from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from datetime import timedelta
+from typing import Tuple
 
 # Suppress yfinance logs
 logging.getLogger("yfinance").setLevel(logging.ERROR)
@@ -24,10 +27,65 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from yfinance import Ticker
 from utils.logger import log_info, log_success, log_error, log_warn
-from utils.config import load_config, load_credentials, read_symbols
-from utils.scoring import compute_scores_for_ticker
-from utils.messaging import compose_message, send_telegram_message
+from utils.config import (
+    load_config,
+    load_credentials,
+    read_universe,
+    yahoo_symbol_for,
+    DEFAULT_SUFFIX,
+)
+from utils.scoring import (
+    collect_technicals,
+    collect_fundamentals,
+    finalize_scores,
+    fundamentals_cutoff,
+    FUND_SCORE_MAX,
+)
+from utils.indicator_registry import compile_plan, history_window
+from utils.messaging import (
+    compose_message,
+    compose_intraday_message,
+    send_telegram_message,
+)
 from utils.cleaner import cleanup_generated_files
+from utils.cache import ScanCache
+from utils.http_session import get_session, session_stats
+from utils.market_data import fetch_history
+from utils.daemon import run_daemon
+from utils.intraday import run_intraday
+from utils.checkpoint import (
+    CheckpointWriter,
+    checkpoint_path,
+    load_checkpoint,
+    latest_checkpoint_before,
+)
+from utils.deadline import (
+    Deadline,
+    parse_deadline,
+    prioritize_symbols,
+    map_until_deadline,
+)
+from utils.scheduler import market_now
+from utils.profiling import ScanProfiler, PROFILE_MODES
+from utils.sharding import (
+    parse_shard,
+    select_shard,
+    shard_results_path,
+    write_shard_results,
+    merge_shard_results,
+)
+from utils.profiles import (
+    DEFAULT_PROFILE,
+    resolve_profiles,
+    profile_tech_scores,
+    eligibility,
+    rescore_for_profiles,
+    profile_config,
+    signal_config,
+    subscribers,
+)
+from utils.bot import ScoreIndex, run_bot
+from utils.diversification import select_diversified, DEFAULT_LOOKBACK_DAYS
 from utils.exceptions import ConfigError, DataFetchError
 
 # Variables
@@ -37,11 +95,20 @@ CONFIG_PATH = os.path.join(
 CREDENTIALS_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), "../configs/credentials.json"
 )
+SYMBOLS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data/symbols.csv"
+)
 SLEEP_BETWEEN_CALLS = 0.5  # seconds
+MAX_WORKERS = 5
 
 
 def validate_symbol(
-    symbol: str, cfg: dict, retries: int = None, delisted_symbols: list = None
+    symbol: str,
+    cfg: dict,
+    retries: int = None,
+    delisted_symbols: list = None,
+    cache: ScanCache = None,
+    yahoo_symbol: str = None,
 ) -> bool:
     """
     Validates if a stock symbol exists on Yahoo Finance.
@@ -51,18 +118,22 @@ def validate_symbol(
         cfg (dict): Configuration dictionary.
         retries (int): Number of retries for validation (default: from config).
         delisted_symbols (list): List to store delisted symbols.
+        cache (ScanCache): Optional cache that keeps the fetched history for scoring.
+        yahoo_symbol (str): The Yahoo Finance ticker (default: symbol + `universe.suffix`).
 
     Returns:
         bool: True if the symbol is valid, False otherwise.
     """
     retries = retries or cfg["validation"]["retries"]
-    symbol_with_suffix = f"{symbol}.NS"  # Append .NS for NSE symbols
+    symbol_with_suffix = yahoo_symbol or yahoo_symbol_for(symbol, cfg)
     error_message = None  # To store the final error message
 
     for attempt in range(1, retries + 1):
         try:
-            ticker = Ticker(symbol_with_suffix)
-            history = ticker.history(period="6mo")
+            ticker = Ticker(symbol_with_suffix, session=get_session(cfg))
+            history = fetch_history(
+                ticker, cache, window=history_window(signal_config(cfg))
+            )
             if history is None or history.empty:
                 if "delisted" in str(history).lower():
                     if delisted_symbols is not None:
@@ -89,7 +160,14 @@ def validate_symbol(
     return False
 
 
-def process_symbol(symbol: str, cfg: dict, skipped_symbols: list) -> dict:
+def process_symbol(
+    symbol: str,
+    cfg: dict,
+    skipped_symbols: list,
+    cache: ScanCache = None,
+    fresh_since: float = None,
+    yahoo_symbol: str = None,
+) -> dict:
     """
     Processes a single stock symbol.
 
@@ -97,21 +175,441 @@ def process_symbol(symbol: str, cfg: dict, skipped_symbols: list) -> dict:
         symbol (str): The stock symbol to process.
         cfg (dict): Configuration dictionary.
         skipped_symbols (list): List to store skipped symbols.
+        cache (ScanCache): Optional cache of prices and fundamentals.
+        fresh_since (float): Epoch start of the scan; histories fetched since are reused.
+        yahoo_symbol (str): The symbol's Yahoo Finance ticker from the universe file.
 
     Returns:
-        dict: The result of processing the symbol.
+        dict: The symbol's technicals; fundamentals are fetched later only if needed.
     """
-    if not validate_symbol(symbol, cfg):
+    if not validate_symbol(symbol, cfg, cache=cache, yahoo_symbol=yahoo_symbol):
         skipped_symbols.append(symbol)
         return None
     try:
-        return compute_scores_for_ticker(symbol, cfg)
+        return collect_technicals(symbol, cfg, cache, fresh_since, yahoo_symbol)
     except Exception as e:
         log_error(f"❌ Unexpected error for {symbol}: {type(e).__name__}: {e}")
         skipped_symbols.append(symbol)
         return None
 
 
+def fetch_fundamentals_lazily(
+    rows: list,
+    cfg: dict,
+    cache: ScanCache = None,
+    checkpoint=None,
+    deadline: Deadline = None,
+) -> Tuple[list, bool]:
+    """
+    Fetches fundamentals only for stocks that can still clear the buy threshold and
+    reach the top-N of at least one profile, best technical scores first. With
+    `diversification` configured, the top-N is the correlation-aware pick list.
+
+    Args:
+        rows (list): Rows from the technical phase.
+        cfg (dict): Configuration dictionary.
+        cache (ScanCache): Optional cache of prices and fundamentals.
+        checkpoint (CheckpointWriter): Optional checkpoint recording fetched rows.
+        deadline (Deadline): Optional time by which fetching stops.
+
+    Returns:
+        Tuple[list, bool]: The rows with the fetched fundamentals merged in, and
+            whether the deadline cut the fetches short.
+    """
+    deadline = deadline or Deadline()
+    profiles = resolve_profiles(cfg)
+    thresholds = np.array([p["buy_threshold"] for p in profiles.values()], dtype=float)
+    top_n = np.array([p["top_n"] for p in profiles.values()])
+    pending = [row for row in rows if row.get("fund_status") == "pending"]
+
+    # Technical scores of every pending stock under every profile, in one pass
+    tech = profile_tech_scores(pending, profiles).to_numpy() if pending else None
+    if tech is None:
+        tech = np.empty((0, len(profiles)))
+    # Sectors are not known before the fundamentals, so only prices filter here
+    reachable = np.where(
+        (tech >= fundamentals_cutoff(thresholds))
+        & eligibility(pending, profiles, known_sectors=False).to_numpy(),
+        tech,
+        -np.inf,
+    )
+    order = np.argsort(-reachable.max(axis=1, initial=-np.inf), kind="stable")
+    order = [i for i in order if np.isfinite(reachable[i]).any()]
+    candidates = [pending[i] for i in order]
+    # Best technical score still to come per profile, for the early stop below
+    best_remaining = np.maximum.accumulate(reachable[order][::-1])[::-1]
+
+    # Closes of the stocks, already cached, when the picks skip correlated names
+    diversification = cfg.get("diversification", {})
+    closes = {}
+    if cache is not None and diversification.get("max_correlation") is not None:
+        closes = cache.closes(
+            {
+                row["symbol"]: row.get("yahoo_symbol")
+                or yahoo_symbol_for(row["symbol"], cfg)
+                for row in rows
+            }
+        )
+
+    qualified = [[] for _ in profiles]  # Results above the threshold, best first
+    known = [row for row in rows if row.get("fund_status") != "pending"]
+
+    def add_qualified(scored_rows: list) -> None:
+        rescored = rescore_for_profiles(finalize_scores(scored_rows, cfg), profiles)
+        for i, results in enumerate(rescored.values()):
+            qualified[i] += [
+                r
+                for r in results
+                if r["final_score"] is not None and r["final_score"] >= thresholds[i]
+            ]
+            qualified[i].sort(key=lambda r: r["final_score"], reverse=True)
+
+    def displaceable(i: int, best_possible: float) -> bool:
+        # A stock ranked below the last pick never changes a greedy pick list
+        picks = qualified[i][: top_n[i]]
+        if len(picks) < top_n[i] or best_possible >= picks[-1]["final_score"]:
+            return True
+        if not closes:
+            return False
+        # Passing over correlated names only lowers the last pick
+        picks, _ = select_diversified(
+            qualified[i],
+            closes,
+            top_n[i],
+            diversification["max_correlation"],
+            diversification.get("lookback_days", DEFAULT_LOOKBACK_DAYS),
+        )
+        return len(picks) < top_n[i] or best_possible >= picks[-1]["final_score"]
+
+    def settled(position: int) -> bool:
+        # Every profile has its top-N and no remaining stock could displace them
+        for i in range(len(profiles)):
+            best_possible = (best_remaining[position, i] + FUND_SCORE_MAX) / 2
+            if np.isfinite(best_possible) and displaceable(i, best_possible):
+                return False
+        return True
+
+    def fetch_and_record(row: dict) -> dict:
+        row = collect_fundamentals(row, cfg, cache)
+        if checkpoint is not None:
+            checkpoint.record(row["symbol"], "ok", row)
+        return row
+
+    # One pool for all fetches; after each one, stop if the rest cannot matter
+    completed = set()
+    frontier = 0  # First candidate whose fetch has not completed
+
+    def stop_when(position: int, row: dict) -> bool:
+        nonlocal frontier
+        completed.add(position)
+        add_qualified([row])
+        while frontier in completed:
+            frontier += 1
+        return frontier < len(candidates) and settled(frontier)
+
+    add_qualified(known)
+    fetched, timed_out = [], False
+    if candidates and not settled(0):
+        fetched, timed_out = map_until_deadline(
+            fetch_and_record,
+            candidates,
+            deadline,
+            MAX_WORKERS,
+            "fundamentals",
+            stop_when=stop_when,
+        )
+
+    skipped = len(pending) - len(fetched)
+    log_info(
+        f"💤 Skipped {skipped} of {len(pending)} fundamental fetch(es) for stocks that "
+        f"cannot reach the buy threshold or the top-N of any of {len(profiles)} profile(s)."
+    )
+    # Only fetches that finished in time count; ones a deadline left running are ignored
+    by_symbol = {row["symbol"]: row for row in fetched}
+    return [by_symbol.get(row["symbol"], row) for row in rows], timed_out
+
+
+def load_previous_results(day, suffix: str, cfg: dict) -> dict:
+    """
+    Loads the results of the latest earlier scan, used to prioritise symbols.
+
+    Args:
+        day (date): The current trading day.
+        suffix (str): The checkpoint suffix of this scan (e.g. for shards).
+        cfg (dict): Configuration dictionary.
+
+    Returns:
+        dict: Symbol -> previous result with its average volume.
+    """
+    path = latest_checkpoint_before(day, suffix=suffix)
+    if path is None:
+        return {}
+    rows = [r["row"] for r in load_checkpoint(path).values() if r["row"]]
+    return {
+        result["symbol"]: {**result, "avg_volume": row.get("avg_volume")}
+        for row, result in zip(rows, finalize_scores(rows, cfg))
+    }
+
+
+def latest_scan_refresher(index: ScoreIndex, cfg: dict):
+    """
+    Returns a callable that loads the latest scan checkpoint into the bot's index
+    whenever a newer or updated checkpoint appears.
+
+    Args:
+        index (ScoreIndex): The bot's index.
+        cfg (dict): Configuration dictionary.
+
+    Returns:
+        Callable: Checks the checkpoints and reloads when needed.
+    """
+    loaded = {"path": None, "mtime": None}
+
+    def refresh() -> None:
+        tomorrow = market_now(cfg.get("daemon", {})).date() + timedelta(days=1)
+        path = latest_checkpoint_before(tomorrow)
+        try:
+            mtime = os.path.getmtime(path) if path else None
+        except OSError:
+            return
+        if mtime is None or (path, mtime) == (loaded["path"], loaded["mtime"]):
+            return
+        rows = [r["row"] for r in load_checkpoint(path).values() if r["row"]]
+        index.update(finalize_scores(rows, cfg), cfg)
+        loaded["path"], loaded["mtime"] = path, mtime
+
+    return refresh
+
+
+def send_alert(msg: str, creds: dict, args, chat_ids: list = None) -> None:
+    """
+    Prints an alert and, in PROD mode, sends it to every configured chat.
+
+    Args:
+        msg (str): The message to send.
+        creds (dict): Credentials dictionary.
+        args: Parsed command-line arguments.
+        chat_ids (list): Chats to send to (default: all of `telegram.chat_ids`).
+
+    Returns:
+        None
+    """
+    print(msg)
+
+    if args.mode == "PROD":
+        unique_chat_ids = set(chat_ids or creds["telegram"]["chat_ids"])
+        for chat_id in unique_chat_ids:
+            send_telegram_message(creds["telegram"]["bot_token"], chat_id, msg)
+        log_success("✅ Telegram messages sent successfully.")
+    else:
+        log_info("🛑 TEST mode: Telegram messages were not sent.")
+
+
+def send_profile_alerts(
+    results: list,
+    cfg: dict,
+    creds: dict,
+    args,
+    skipped_symbols: list,
+    partial: dict = None,
+    closes: dict = None,
+) -> None:
+    """
+    Ranks the scored results once per subscriber profile and sends each profile's
+    alert to its chats.
+
+    Args:
+        results (list): The scored results.
+        cfg (dict): Configuration dictionary.
+        creds (dict): Credentials dictionary.
+        args: Parsed command-line arguments.
+        skipped_symbols (list): Symbols that could not be scored.
+        partial (dict): Optional coverage when a deadline cut the scan short.
+        closes (dict): Optional symbol -> daily closes for correlation-aware picks.
+
+    Returns:
+        None
+    """
+    profiles = resolve_profiles(cfg)
+    audiences = subscribers(creds, profiles) or {DEFAULT_PROFILE: None}
+    rescored = rescore_for_profiles(results, profiles)
+    for name, chat_ids in audiences.items():
+        log_info(f"👥 Alert for profile '{name}'.")
+        msg = compose_message(
+            rescored[name],
+            profile_config(cfg, profiles[name]),
+            skipped_symbols,
+            partial,
+            closes,
+        )
+        send_alert(msg, creds, args, chat_ids)
+
+
+def run_scan(
+    cfg: dict,
+    creds: dict,
+    symbols: dict,
+    args,
+    cache: ScanCache = None,
+    profiler: ScanProfiler = None,
+) -> list:
+    """
+    Scores every symbol and sends the alert.
+
+    Args:
+        cfg (dict): Configuration dictionary.
+        creds (dict): Credentials dictionary.
+        symbols (dict): Stock symbols to process -> their Yahoo Finance tickers.
+        args: Parsed command-line arguments.
+        cache (ScanCache): Optional cache of prices and fundamentals kept between scans.
+        profiler (ScanProfiler): Optional profiler attributing time to scan stages.
+
+    Returns:
+        list: The scored results.
+    """
+    profiler = profiler or ScanProfiler()
+    # Ensure 'validation' key exists in cfg
+    if "validation" not in cfg or "retries" not in cfg["validation"]:
+        raise ConfigError("Missing 'validation' or 'retries' key in configuration.")
+
+    if not symbols:
+        log_warn("⚠️ No symbols found in symbols.csv. Exiting.")
+        return []
+    # Fail fast on an invalid scoring or profile config, or an unknown subscription
+    compile_plan(cfg)
+    subscribers(creds, resolve_profiles(cfg))
+    log_info(
+        f"📏 Fetching {history_window(signal_config(cfg)).days} days of history per symbol."
+    )
+
+    universe, symbols = symbols, list(symbols)
+    shard = getattr(args, "shard", None)
+    if shard:
+        symbols = select_shard(symbols, *shard)
+        log_info(f"🧩 Shard {shard[0]}/{shard[1]} owns {len(symbols)} symbol(s).")
+
+    log_info(f"📊 Found {len(symbols)} symbol(s) to process.")
+
+    # A per-scan cache lets scoring reuse the history fetched during validation
+    cache = cache or ScanCache()
+    scan_started = time.time()
+    now = market_now(cfg.get("daemon", {}))
+    deadline_cfg = cfg.get("deadline", {})
+    deadline = (
+        parse_deadline(args.deadline, now, deadline_cfg.get("reserve_seconds", 30))
+        if getattr(args, "deadline", None)
+        else Deadline()
+    )
+    results = []
+    skipped_symbols = []
+    delisted_symbols = []
+
+    # Symbols scored earlier on the same trading day are not fetched again on resume
+    trading_day = now.date()
+    suffix = f"_shard_{shard[0]}_of_{shard[1]}" if shard else ""
+    path = checkpoint_path(trading_day, suffix=suffix)
+    done = load_checkpoint(path) if args.resume else {}
+    scored = [s for s in symbols if done.get(s, {}).get("status") == "ok"]
+    rows = [done[s]["row"] for s in scored]
+    pending = [s for s in symbols if s not in set(scored)]
+    if args.resume:
+        log_info(
+            f"⏩ Resuming: {len(rows)} symbol(s) already scored, {len(pending)} left."
+        )
+
+    if deadline.at is not None:
+        # Under a deadline the most promising symbols go first
+        pending = prioritize_symbols(
+            pending, load_previous_results(trading_day, suffix, cfg)
+        )
+        log_info(f"⏰ Deadline in {deadline.remaining():.0f}s; scanning by priority.")
+
+    checkpoint = CheckpointWriter(path, resume=args.resume)
+
+    def process_and_record(symbol: str) -> Tuple[str, dict]:
+        # Skips are collected from the returned outcomes, not appended by workers
+        # a deadline may leave running
+        row = process_symbol(symbol, cfg, [], cache, scan_started, universe[symbol])
+        checkpoint.record(symbol, "ok" if row else "skipped", row)
+        return symbol, row
+
+    try:
+        # Keep part of the time budget for fetching fundamentals
+        with profiler.stage("technicals"):
+            outcomes, technicals_cut = map_until_deadline(
+                process_and_record,
+                pending,
+                deadline.split(deadline_cfg.get("fundamentals_share", 0.3)),
+                MAX_WORKERS,
+                "technicals",
+            )
+        rows += [row for _, row in outcomes if row]
+        skipped_symbols += [symbol for symbol, row in outcomes if not row]
+
+        # Fundamentals only for stocks whose technicals leave them a chance to qualify
+        with profiler.stage("fundamentals"):
+            rows, fundamentals_cut = fetch_fundamentals_lazily(
+                rows, cfg, cache, checkpoint, deadline
+            )
+    finally:
+        checkpoint.close()
+
+    # Score fundamentals for the whole universe in a single vectorized pass
+    with profiler.stage("scoring"):
+        results = finalize_scores(rows, cfg)
+    partial = None
+    if technicals_cut or fundamentals_cut:
+        scored = sum(1 for result in results if result["final_score"] is not None)
+        partial = {"scored": scored, "total": len(symbols)}
+
+    log_success("🎯 All stocks scored successfully!")
+    stats = session_stats()
+    if stats:
+        log_info(
+            f"🔌 HTTP: {stats['requests']} request(s), "
+            f"{stats['reused_connections']} over reused connections, "
+            f"{stats['new_connections']} new connection(s)."
+        )
+
+    if delisted_symbols:
+        log_warn(f"⚠️ Delisted symbols: {', '.join(delisted_symbols)}")
+
+    if skipped_symbols:
+        log_warn(f"⚠️ Skipped symbols: {', '.join(skipped_symbols)}")
+
+    if shard:
+        # Shards only write partial results; `--merge` ranks them and sends one alert
+        write_shard_results(
+            shard_results_path(*shard, trading_day),
+            *shard,
+            trading_day,
+            results,
+            skipped_symbols,
+            total=len(symbols),
+            partial=partial is not None,
+        )
+    elif results:
+        with profiler.stage("message"):
+            # Closes of the candidates, already fetched, for correlation-aware picks
+            tickers = {row["symbol"]: row.get("yahoo_symbol") for row in rows}
+            closes = cache.closes(
+                {
+                    result["symbol"]: tickers[result["symbol"]]
+                    or universe.get(result["symbol"])
+                    for result in results
+                    if result["final_score"] is not None
+                }
+            )
+            send_profile_alerts(
+                results, cfg, creds, args, skipped_symbols, partial, closes
+            )
+    else:
+        log_warn("⚠️ No valid results to process or send alerts for.")
+
+    log_success("✅ Quantastic run completed.")
+    return results
+
+
 def main(args) -> None:
     """
     Main function for running the Quantastic stock scanner.
@@ -126,53 +624,63 @@ def main(args) -> None:
         log_info("🚀 Starting Quantastic...")
         cfg = load_config(CONFIG_PATH)
         creds = load_credentials(CREDENTIALS_PATH)
+        index = ScoreIndex()
 
-        # Ensure 'validation' key exists in cfg
-        if "validation" not in cfg or "retries" not in cfg["validation"]:
-            raise ConfigError("Missing 'validation' or 'retries' key in configuration.")
-
-        symbols = read_symbols(
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), "data/symbols.csv")
-        )
-        if not symbols:
-            log_warn("⚠️ No symbols found in symbols.csv. Exiting.")
+        if args.bot:
+            run_bot(index, cfg, creds, refresh=latest_scan_refresher(index, cfg))
             return
 
-        log_info(f"📊 Found {len(symbols)} symbol(s) to process.")
-
-        results = []
-        skipped_symbols = []
-        delisted_symbols = []
+        if args.daemon:
+            if cfg.get("bot", {}).get("enabled"):
+                # Answer commands from the last checkpoint until the first scan ends
+                latest_scan_refresher(index, cfg)()
+                threading.Thread(
+                    target=run_bot, args=(index, cfg, creds), name="bot", daemon=True
+                ).start()
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            results = list(
-                executor.map(lambda s: process_symbol(s, cfg, skipped_symbols), symbols)
-            )
-        results = [res for res in results if res]  # Filter out None results
+            def scan_and_index(cfg, creds, symbols, cache):
+                results = run_scan(cfg, creds, symbols, args, cache)
+                index.update(results, cfg)
+                return results
 
-        log_success("🎯 All stocks scored successfully!")
-
-        if delisted_symbols:
-            log_warn(f"⚠️ Delisted symbols: {', '.join(delisted_symbols)}")
+            run_daemon(scan_and_index, CONFIG_PATH, CREDENTIALS_PATH, SYMBOLS_PATH)
+            return
 
-        if skipped_symbols:
-            log_warn(f"⚠️ Skipped symbols: {', '.join(skipped_symbols)}")
+        if args.merge:
+            results, skipped_symbols, partial = merge_shard_results(args.merge)
+            if results:
+                send_profile_alerts(results, cfg, creds, args, skipped_symbols, partial)
+            else:
+                log_warn("⚠️ No valid results to process or send alerts for.")
+            return
 
-        if results:
-            msg = compose_message(results, cfg, skipped_symbols)
-            print(msg)
+        symbols = read_universe(
+            SYMBOLS_PATH, cfg.get("universe", {}).get("suffix", DEFAULT_SUFFIX)
+        )
 
-            if args.mode == "PROD":
-                unique_chat_ids = set(creds["telegram"]["chat_ids"])
-                for chat_id in unique_chat_ids:
-                    send_telegram_message(creds["telegram"]["bot_token"], chat_id, msg)
-                log_success("✅ Telegram messages sent successfully.")
-            else:
-                log_info("🛑 TEST mode: Telegram messages were not sent.")
-        else:
-            log_warn("⚠️ No valid results to process or send alerts for.")
+        if args.intraday:
+            interval = args.interval or cfg.get("intraday", {}).get("interval", "5m")
+            run_intraday(
+                cfg,
+                symbols,
+                lambda crossings: send_alert(
+                    compose_intraday_message(crossings, cfg, interval), creds, args
+                ),
+                interval,
+            )
+            return
 
-        log_success("✅ Quantastic run completed.")
+        profiling_cfg = cfg.get("profiling", {})
+        profiler = ScanProfiler(
+            args.profile,
+            interval=profiling_cfg.get("interval_ms", 5) / 1000,
+            top_n=profiling_cfg.get("top_n", 20),
+        )
+        profiler.start()
+        try:
+            run_scan(cfg, creds, symbols, args, profiler=profiler)
+        finally:
+            profiler.stop()
     except ConfigError as e:
         log_error(f"❌ Configuration error: {e}")
     except DataFetchError as e:
@@ -193,6 +701,62 @@ if __name__ == "__main__":
         default="PROD",
         help="Run mode: TEST (no messages sent) or PROD (messages sent). Default is PROD.",
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay resident and run scans on the schedule in the 'daemon' config section.",
+    )
+    parser.add_argument(
+        "--bot",
+        action="store_true",
+        help="Answer /score, /top and /movers bot commands from the latest scan.",
+    )
+    parser.add_argument(
+        "--intraday",
+        action="store_true",
+        help="Poll intraday bars and alert on new crossings of thresholds.intraday_alert_score.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=str,
+        choices=["5m", "15m"],
+        default=None,
+        help="Intraday bar interval. Default is intraday.interval from the config.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip symbols already scored today according to the scan checkpoint.",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=None,
+        help="Scan only shard i of N (e.g. 2/4) and write its partial results for --merge.",
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        default=None,
+        metavar="SHARD_FILE",
+        help="Merge shard result files, rank them once and send a single alert.",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=str,
+        default=None,
+        help="Send the alert by this time (HH:MM market time, or a duration like 45m), "
+        "with partial results if the scan is not finished.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="sample",
+        choices=PROFILE_MODES,
+        default=None,
+        help="Profile the scan across all worker threads (sample, or cprofile for "
+        "deterministic per-function counts) and write a report and collapsed stacks.",
+    )
     args = parser.parse_args()
 
     main(args)
@@ -0,0 +1,315 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+"""
+Telegram bot answering questions between scans.
+
+The bot long-polls `getUpdates` and answers `/score SYMBOL`, `/top` and
+`/movers` from an in-memory index of the latest scan results, including the
+per-indicator signals stored with every result. Rankings are sorted once when
+the index is updated, so a reply is a dictionary lookup or a list slice and
+never downloads prices.
+"""
+
+# Import Dependencies
+import html
+import time
+import threading
+from typing import Any, Callable, Dict, List, Optional
+import requests
+from .logger import log_info, log_success, log_warn
+from .profiles import (
+    DEFAULT_PROFILE,
+    resolve_profiles,
+    rescore_for_profiles,
+    subscribers,
+)
+
+DEFAULT_API_URL = "https://api.telegram.org"
+POLL_TIMEOUT = 30  # seconds Telegram holds a getUpdates request open
+RETRY_SECONDS = 5  # wait after a failed poll
+MAX_LIST = 20  # longest /top or /movers list
+
+HELP_TEXT = (
+    "<b>🤖 Quantastic Bot</b>\n\n"
+    "/score SYMBOL — scores and signals of a stock from the latest scan\n"
+    "/top [N] — the best final scores\n"
+    "/movers [N] — the biggest moves of the last session\n"
+)
+
+
+class ScoreIndex:
+    """
+    Thread-safe, in-memory index of the latest scan results, ranked per profile.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: Dict[str, Dict[str, dict]] = {}  # profile -> symbol -> result
+        self._ranked: Dict[str, List[dict]] = {}
+        self._movers: List[dict] = []
+        self.top_n: Dict[str, int] = {}
+        self.updated_at = None
+
+    def update(self, results: List[dict], cfg: dict) -> None:
+        """
+        Replaces the indexed results and ranks them for every profile.
+
+        Args:
+            results (List[dict]): Results of `finalize_scores`.
+            cfg (dict): Configuration dictionary.
+
+        Returns:
+            None
+        """
+        profiles = resolve_profiles(cfg)
+        rescored = rescore_for_profiles(results, profiles)
+        by_symbol = {
+            name: {r["symbol"].upper(): r for r in profile_results}
+            for name, profile_results in rescored.items()
+        }
+        ranked = {
+            name: sorted(
+                (r for r in profile_results if r["final_score"] is not None),
+                key=lambda r: r["final_score"],
+                reverse=True,
+            )
+            for name, profile_results in rescored.items()
+        }
+        movers = sorted(
+            (r for r in results if r.get("change_pct") is not None),
+            key=lambda r: abs(r["change_pct"]),
+            reverse=True,
+        )
+
+        # Swap everything at once so a reply never mixes two scans
+        with self._lock:
+            self._results, self._ranked, self._movers = by_symbol, ranked, movers
+            self.top_n = {name: p["top_n"] for name, p in profiles.items()}
+            self.updated_at = time.time()
+        log_info(f"🤖 Bot index updated with {len(results)} result(s).")
+
+    def lookup(self, symbol: str, profile: str = DEFAULT_PROFILE) -> Optional[dict]:
+        with self._lock:
+            return self._results.get(profile, {}).get(symbol.upper())
+
+    def top(self, n: int, profile: str = DEFAULT_PROFILE) -> List[dict]:
+        with self._lock:
+            return self._ranked.get(profile, [])[:n]
+
+    def movers(self, n: int) -> List[dict]:
+        with self._lock:
+            return self._movers[:n]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._results.get(DEFAULT_PROFILE, {}))
+
+
+# -----------------------------
+# Commands
+# -----------------------------
+def _number(value: Any, digits: int = 1) -> str:
+    return str(round(value, digits)) if isinstance(value, (int, float)) else "N/A"
+
+
+def _change(result: dict) -> str:
+    change = result.get("change_pct")
+    if change is None:
+        return "N/A"
+    return f"{'▲' if change >= 0 else '▼'} {abs(change):.2f}%"
+
+
+def _score_reply(index: ScoreIndex, symbol: str, profile: str) -> str:
+    result = index.lookup(symbol.split(".")[0], profile)
+    if result is None:
+        return f"⚠️ <b>{html.escape(symbol.upper())}</b> was not scored in the latest scan."
+    signals = result.get("signals") or {}
+    reply = (
+        f"🏷️ <b>{html.escape(result['symbol'])}</b>\n"
+        f"   • 🏆 Final Score: <b>{_number(result['final_score'])}</b>\n"
+        f"   • 📈 Tech Score: {_number(result['tech_score'])}\n"
+        f"   • 💼 Fund Score: {_number(result['fund_score'])}\n"
+        f"   • 💰 Last Close: ₹{_number(result.get('last_close'))} ({_change(result)})\n"
+    )
+    if signals:
+        reply += "   • 🚦 Signals: " + ", ".join(
+            f"{name} {'✅' if value else '❌'}" for name, value in signals.items()
+        )
+    return reply
+
+
+def _top_reply(index: ScoreIndex, n: int, profile: str) -> str:
+    picks = index.top(n, profile)
+    if not picks:
+        return "⚠️ No scored stocks yet."
+    lines = [
+        f"{rank}. <b>{html.escape(r['symbol'])}</b> — {_number(r['final_score'])} "
+        f"(tech {_number(r['tech_score'])}, fund {_number(r['fund_score'])})"
+        for rank, r in enumerate(picks, 1)
+    ]
+    return "<b>🎯 Top Scores</b>\n\n" + "\n".join(lines)
+
+
+def _movers_reply(index: ScoreIndex, n: int) -> str:
+    movers = index.movers(n)
+    if not movers:
+        return "⚠️ No scored stocks yet."
+    lines = [
+        f"{rank}. <b>{html.escape(r['symbol'])}</b> {_change(r)} "
+        f"at ₹{_number(r.get('last_close'))}"
+        for rank, r in enumerate(movers, 1)
+    ]
+    return "<b>📊 Biggest Movers</b>\n\n" + "\n".join(lines)
+
+
+def handle_command(
+    text: str, index: ScoreIndex, profile: str = DEFAULT_PROFILE
+) -> Optional[str]:
+    """
+    Answers one bot command from the index.
+
+    Args:
+        text (str): The message text, e.g. "/score SBIN" or "/top@QuantasticBot 10".
+        index (ScoreIndex): The latest scan results.
+        profile (str): The chat's subscriber profile, used by `/score` and `/top`.
+
+    Returns:
+        Optional[str]: The HTML reply, or None for messages that are not commands.
+    """
+    parts = (text or "").split()
+    if not parts or not parts[0].startswith("/"):
+        return None
+    command, args = parts[0].split("@")[0].lower(), parts[1:]
+    count = (
+        min(int(args[0]), MAX_LIST)
+        if args and args[0].isdigit() and int(args[0]) > 0
+        else None
+    )
+
+    if command == "/score" and args:
+        return _score_reply(index, args[0], profile)
+    if command == "/top":
+        return _top_reply(index, count or index.top_n.get(profile, 5), profile)
+    if command == "/movers":
+        return _movers_reply(index, count or index.top_n.get(profile, 5))
+    return HELP_TEXT
+
+
+# -----------------------------
+# Long Polling
+# -----------------------------
+class TelegramClient:
+    """
+    Minimal Bot API client; `api_url` can point at a local or mock endpoint.
+    """
+
+    def __init__(
+        self,
+        bot_token: str,
+        api_url: str = DEFAULT_API_URL,
+        poll_timeout: int = POLL_TIMEOUT,
+    ):
+        self.base_url = f"{api_url.rstrip('/')}/bot{bot_token}"
+        self.poll_timeout = poll_timeout
+        self.session = requests.Session()
+
+    def _call(self, method: str, params: dict, timeout: float) -> Any:
+        response = self.session.post(
+            f"{self.base_url}/{method}", json=params, timeout=timeout
+        )
+        payload = response.json()
+        if not payload.get("ok"):
+            raise RuntimeError(payload.get("description", f"{method} failed"))
+        return payload["result"]
+
+    def get_updates(self, offset: Optional[int]) -> List[dict]:
+        """
+        Waits up to `poll_timeout` seconds for new updates.
+
+        Args:
+            offset (Optional[int]): The first update ID not yet handled.
+
+        Returns:
+            List[dict]: The new updates.
+        """
+        params = {"timeout": self.poll_timeout, "allowed_updates": ["message"]}
+        if offset is not None:
+            params["offset"] = offset
+        return self._call("getUpdates", params, timeout=self.poll_timeout + 10)
+
+    def send_message(self, chat_id: str, text: str) -> None:
+        params = {"chat_id": chat_id, "text": text, "parse_mode": "HTML"}
+        self._call("sendMessage", params, timeout=10)
+
+
+def run_bot(
+    index: ScoreIndex,
+    cfg: dict,
+    creds: dict,
+    refresh: Callable = None,
+    stop_event: threading.Event = None,
+) -> None:
+    """
+    Answers bot commands by long polling until stopped.
+
+    Args:
+        index (ScoreIndex): The results to answer from, updated by the caller.
+        cfg (dict): Configuration dictionary with an optional `bot` section.
+        creds (dict): Credentials dictionary; only configured chats get answers
+            unless `bot.public` is set.
+        refresh (Callable): Optional callable run before every poll, e.g. to reload
+            the index when a newer scan finished.
+        stop_event (threading.Event): Optional event that stops the bot when set.
+
+    Returns:
+        None
+    """
+    stop = stop_event or threading.Event()
+    bot_cfg = cfg.get("bot", {})
+    client = TelegramClient(
+        creds["telegram"]["bot_token"],
+        bot_cfg.get("api_url", DEFAULT_API_URL),
+        bot_cfg.get("poll_timeout", POLL_TIMEOUT),
+    )
+    chat_profiles = {
+        chat_id: name
+        for name, chat_ids in subscribers(creds, resolve_profiles(cfg)).items()
+        for chat_id in chat_ids
+    }
+    public = bot_cfg.get("public", False)
+    log_success(f"🤖 Bot listening for commands from {len(chat_profiles)} chat(s).")
+
+    offset = None
+    while not stop.is_set():
+        if refresh:
+            refresh()
+        try:
+            updates = client.get_updates(offset)
+        except Exception as e:
+            log_warn(f"⚠️ Polling Telegram failed: {e}")
+            stop.wait(RETRY_SECONDS)
+            continue
+
+        for update in updates:
+            offset = update["update_id"] + 1
+            message = update.get("message") or {}
+            chat_id = str(message.get("chat", {}).get("id"))
+            if chat_id not in chat_profiles and not public:
+                log_warn(f"⚠️ Ignoring a message from unknown chat {chat_id}.")
+                continue
+            reply = handle_command(
+                message.get("text"),
+                index,
+                chat_profiles.get(chat_id, DEFAULT_PROFILE),
+            )
+            if reply is None:
+                continue
+            try:
+                client.send_message(chat_id, reply)
+            except Exception as e:
+                log_warn(f"⚠️ Replying to chat {chat_id} failed: {e}")
+    log_info("🛑 Bot stopped.")
@@ -0,0 +1,133 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+# Import Dependencies
+import time
+import threading
+from typing import Any, Dict, Optional
+import pandas as pd
+
+
+class ScanCache:
+    """
+    Thread-safe store of price histories and fundamentals kept warm between scans.
+    """
+
+    def __init__(self, fundamentals_ttl: float = 24 * 3600):
+        """
+        Args:
+            fundamentals_ttl (float): Seconds a fetched fundamentals row stays valid.
+        """
+        self.fundamentals_ttl = fundamentals_ttl
+        self._lock = threading.Lock()
+        self._prices: Dict[str, Dict[str, Any]] = {}
+        self._fundamentals: Dict[str, Dict[str, Any]] = {}
+        self.stats = {
+            "price_hits": 0,
+            "price_misses": 0,
+            "fundamentals_hits": 0,
+            "fundamentals_misses": 0,
+        }
+
+    def get_history(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached history entry (`data`, `fetched_at`, `window`) of a symbol.
+
+        Args:
+            symbol (str): The Yahoo ticker symbol.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached entry or None.
+        """
+        with self._lock:
+            entry = self._prices.get(symbol)
+            self.stats["price_hits" if entry else "price_misses"] += 1
+            return entry
+
+    def set_history(
+        self, symbol: str, data: pd.DataFrame, window: pd.Timedelta = None
+    ) -> None:
+        """
+        Stores the price history of a symbol.
+
+        Args:
+            symbol (str): The Yahoo ticker symbol.
+            data (pd.DataFrame): The OHLCV history.
+            window (pd.Timedelta): The history window that was requested.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._prices[symbol] = {
+                "data": data,
+                "fetched_at": time.time(),
+                "window": window,
+            }
+
+    def closes(self, tickers: Dict[str, str]) -> Dict[str, pd.Series]:
+        """
+        Returns the cached daily closes of several symbols without counting cache hits.
+
+        Args:
+            tickers (Dict[str, str]): Symbol -> Yahoo ticker symbol.
+
+        Returns:
+            Dict[str, pd.Series]: Symbol -> closes, for the symbols that are cached.
+        """
+        with self._lock:
+            entries = {symbol: self._prices.get(t) for symbol, t in tickers.items()}
+        return {
+            symbol: entry["data"]["Close"]
+            for symbol, entry in entries.items()
+            if entry is not None and "Close" in entry["data"].columns
+        }
+
+    def get_fundamentals(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached raw fundamentals of a symbol while they are fresh.
+
+        Args:
+            symbol (str): The Yahoo ticker symbol.
+
+        Returns:
+            Optional[Dict[str, Any]]: The fundamentals row or None.
+        """
+        with self._lock:
+            entry = self._fundamentals.get(symbol)
+            if entry and time.time() - entry["fetched_at"] < self.fundamentals_ttl:
+                self.stats["fundamentals_hits"] += 1
+                return entry["data"]
+            self.stats["fundamentals_misses"] += 1
+            return None
+
+    def set_fundamentals(self, symbol: str, data: Dict[str, Any]) -> None:
+        """
+        Stores the raw fundamentals of a symbol.
+
+        Args:
+            symbol (str): The Yahoo ticker symbol.
+            data (Dict[str, Any]): The fundamentals row.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._fundamentals[symbol] = {"data": data, "fetched_at": time.time()}
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Returns the cache sizes and hit/miss counters.
+
+        Returns:
+            Dict[str, int]: Counters keyed by name.
+        """
+        with self._lock:
+            return {
+                "price_entries": len(self._prices),
+                "fundamentals_entries": len(self._fundamentals),
+                **self.stats,
+            }
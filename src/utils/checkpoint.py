@@ -0,0 +1,150 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+# Import Dependencies
+import os
+import re
+import json
+import threading
+from datetime import date
+from typing import Any, Dict, Optional
+from .logger import log_info, log_warn
+
+CHECKPOINT_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../data/checkpoints")
+)
+FSYNC_EVERY = 50  # records between fsyncs; every record is flushed to the OS
+
+
+def checkpoint_path(
+    day: date, directory: str = CHECKPOINT_DIR, suffix: str = ""
+) -> str:
+    """
+    Returns the checkpoint file of a trading day.
+
+    Args:
+        day (date): The trading day.
+        directory (str): The checkpoint directory.
+        suffix (str): Distinguishes checkpoints of scans sharing a day, e.g. shards.
+
+    Returns:
+        str: The path of the day's checkpoint file.
+    """
+    return os.path.join(directory, f"scan_{day.isoformat()}{suffix}.jsonl")
+
+
+def latest_checkpoint_before(
+    day: date, directory: str = CHECKPOINT_DIR, suffix: str = ""
+) -> Optional[str]:
+    """
+    Returns the most recent checkpoint file of an earlier trading day.
+
+    Args:
+        day (date): The current trading day.
+        directory (str): The checkpoint directory.
+        suffix (str): The suffix the checkpoint was written with.
+
+    Returns:
+        Optional[str]: The file path, or None when there is no earlier checkpoint.
+    """
+    pattern = re.compile(rf"scan_(\d{{4}}-\d{{2}}-\d{{2}}){re.escape(suffix)}\.jsonl")
+    earlier = [
+        name
+        for name in (os.listdir(directory) if os.path.isdir(directory) else [])
+        if (match := pattern.fullmatch(name)) and match.group(1) < day.isoformat()
+    ]
+    return os.path.join(directory, max(earlier)) if earlier else None
+
+
+def load_checkpoint(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Loads the per-symbol records of a checkpoint file; the latest record per symbol wins.
+
+    Args:
+        path (str): The checkpoint file.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Symbol -> record with `status` and `row`.
+    """
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, "r") as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A run killed mid-write leaves a truncated last line
+                log_warn(f"⚠️ Ignoring a corrupt checkpoint line in {path}.")
+                continue
+            records[record["symbol"]] = record
+    return records
+
+
+class CheckpointWriter:
+    """
+    Appends one JSON line per finished symbol so an interrupted scan can resume.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        """
+        Args:
+            path (str): The checkpoint file.
+            resume (bool): Append to an existing checkpoint instead of starting a new one.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._closed = False
+        self._file = open(path, "a" if resume else "w", buffering=1)
+        if resume and self._file.tell() > 0:
+            with open(path, "rb") as existing:
+                existing.seek(-1, os.SEEK_END)
+                if existing.read(1) != b"\n":
+                    # Terminate a line truncated by a killed run
+                    self._file.write("\n")
+        log_info(f"💾 Checkpointing scan progress to {path}")
+
+    def record(self, symbol: str, status: str, row: dict = None) -> None:
+        """
+        Appends the outcome of a symbol. Records arriving after `close`, e.g. from
+        fetches a deadline left running, are dropped.
+
+        Args:
+            symbol (str): The stock symbol.
+            status (str): "ok" when scored, otherwise the reason it was skipped.
+            row (dict): The collected data of the symbol, if any.
+
+        Returns:
+            None
+        """
+        line = json.dumps(
+            {"symbol": symbol, "status": status, "row": row}, default=float
+        )
+        with self._lock:
+            if self._closed:
+                return
+            self._file.write(line + "\n")
+            self._unsynced += 1
+            if self._unsynced >= FSYNC_EVERY:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+
+    def close(self) -> None:
+        """
+        Flushes and closes the checkpoint file.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._closed = True
@@ -7,9 +7,13 @@ __status__ = "DEV"
 import os
 import pandas as pd
 from typing import Any, Dict, List
-from .logger import log_error
+from .logger import log_error, log_warn
 from .helpers import load_json
 
+DEFAULT_SUFFIX = ".NS"
+EXCHANGE_SUFFIXES = {"NSE": ".NS", "BSE": ".BO"}
+UNIVERSE_COLUMNS = ["symbol", "exchange", "yahoo_symbol", "isin"]
+
 
 def load_config(path: str) -> Dict[str, Any]:
     """
@@ -41,19 +45,70 @@ def load_credentials(credentials_path: str) -> Dict[str, Any]:
     return creds
 
 
-def read_symbols(csv_path: str) -> List[str]:
+def read_universe(csv_path: str, suffix: str = DEFAULT_SUFFIX) -> Dict[str, str]:
     """
-    Reads stock symbols from a CSV file.
+    Reads the scan universe with the Yahoo Finance ticker of every symbol.
+
+    The file has a `symbol,exchange,yahoo_symbol,isin` header; a missing Yahoo ticker is
+    derived from the exchange. Legacy headerless files list bare symbols, which all
+    get `suffix`.
 
     Args:
         csv_path (str): The path to the CSV file containing stock symbols.
+        suffix (str): Yahoo suffix for symbols without a known exchange.
 
     Returns:
-        List[str]: A list of stock symbols.
+        Dict[str, str]: Symbol -> Yahoo Finance ticker, in file order.
     """
     try:
-        df = pd.read_csv(csv_path, header=None, names=["symbol"])
-        return df["symbol"].dropna().astype(str).str.strip().tolist()
+        with open(csv_path, "r") as file:
+            has_header = file.readline().strip().lower().split(",")[0] == "symbol"
+        if has_header:
+            df = pd.read_csv(csv_path, dtype=str)
+        else:
+            df = pd.read_csv(csv_path, header=None, names=["symbol"], dtype=str)
+            log_warn(
+                f"⚠️ {os.path.basename(csv_path)} has no exchange column; every symbol "
+                f"gets '{suffix}'. Rebuild it with extract_symbols.py."
+            )
+        df = df.reindex(columns=UNIVERSE_COLUMNS)
+        df["symbol"] = df["symbol"].str.strip()
+        df = df.dropna(subset=["symbol"])
+
+        suffixes = (
+            df["exchange"].fillna("").str.strip().str.upper().map(EXCHANGE_SUFFIXES)
+        )
+        yahoo_symbols = df["yahoo_symbol"].fillna(
+            df["symbol"] + suffixes.fillna(suffix)
+        )
+        return dict(zip(df["symbol"], yahoo_symbols.str.strip()))
     except Exception as e:
         log_error(f"Failed to read symbols: {e}")
-        return []
+        return {}
+
+
+def read_symbols(csv_path: str) -> List[str]:
+    """
+    Reads stock symbols from a CSV file.
+
+    Args:
+        csv_path (str): The path to the CSV file containing stock symbols.
+
+    Returns:
+        List[str]: A list of stock symbols.
+    """
+    return list(read_universe(csv_path))
+
+
+def yahoo_symbol_for(symbol: str, cfg: dict) -> str:
+    """
+    Returns the Yahoo Finance ticker of a symbol whose exchange is unknown.
+
+    Args:
+        symbol (str): The stock symbol.
+        cfg (dict): Configuration dictionary.
+
+    Returns:
+        str: The symbol with the `universe.suffix` from the config.
+    """
+    return f"{symbol}{cfg.get('universe', {}).get('suffix', DEFAULT_SUFFIX)}"
@@ -0,0 +1,243 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+"""
+Long-running scanner: keeps caches warm, schedules scans on trading days,
+hot-reloads its configuration and serves a local health/metrics endpoint.
+"""
+
+# Import Dependencies
+import os
+import json
+import time
+import signal
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict
+from .cache import ScanCache
+from .http_session import session_stats
+from .config import load_config, load_credentials, read_universe, DEFAULT_SUFFIX
+from .logger import log_info, log_success, log_error, log_warn
+from .scheduler import parse_cron, next_run, market_now
+
+DEFAULT_SCHEDULE = "0 10 * * 1-5"
+POLL_INTERVAL = 30  # seconds between config checks while idle
+
+
+class DaemonState:
+    """
+    Counters and timestamps reported by the health/metrics endpoint.
+    """
+
+    def __init__(self, cache: ScanCache):
+        self.cache = cache
+        self.started_at = time.time()
+        self.scanning = False
+        self.next_scan = None
+        self.last_scan = None
+        self.metrics = {
+            "scans_total": 0,
+            "scan_failures_total": 0,
+            "config_reloads_total": 0,
+            "last_scan_duration_seconds": 0.0,
+            "last_scan_timestamp_seconds": 0.0,
+            "last_scan_symbols": 0,
+            "last_scan_results": 0,
+        }
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "scanning": self.scanning,
+            "last_scan": self.last_scan,
+            "next_scan": self.next_scan,
+        }
+
+    def prometheus(self) -> str:
+        counters = {
+            **self.metrics,
+            **{f"cache_{k}": v for k, v in self.cache.summary().items()},
+            **{f"http_{k}_total": v for k, v in session_stats().items()},
+        }
+        return "".join(
+            f"quantastic_{name} {value}\n" for name, value in counters.items()
+        )
+
+
+def _make_handler(state: DaemonState):
+    class HealthHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/health":
+                body, content_type = json.dumps(state.health()), "application/json"
+            elif self.path == "/metrics":
+                body, content_type = state.prometheus(), "text/plain; version=0.0.4"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass  # Keep the scan log free of request lines
+
+    return HealthHandler
+
+
+def start_health_server(
+    state: DaemonState, host: str, port: int
+) -> ThreadingHTTPServer:
+    """
+    Serves `/health` (JSON) and `/metrics` (Prometheus text) on a background thread.
+
+    Args:
+        state (DaemonState): The daemon state to report.
+        host (str): Interface to bind, normally 127.0.0.1.
+        port (int): Port to bind.
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+    """
+    server = ThreadingHTTPServer((host, port), _make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    log_info(
+        f"🩺 Health endpoint listening on http://{host}:{server.server_port}/health"
+    )
+    return server
+
+
+def _mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+def run_daemon(
+    scan: Callable,
+    config_path: str,
+    credentials_path: str,
+    symbols_path: str,
+    stop_event: threading.Event = None,
+) -> None:
+    """
+    Runs scheduled scans until stopped, reusing warm caches between scans.
+
+    Args:
+        scan (Callable): Called as `scan(cfg, creds, universe, cache)` for every scheduled scan,
+            where the universe maps symbols to Yahoo Finance tickers.
+        config_path (str): Path to config.json, reloaded when it changes.
+        credentials_path (str): Path to credentials.json, reloaded when it changes.
+        symbols_path (str): Path to symbols.csv, reloaded when it changes.
+        stop_event (threading.Event): Optional event that stops the daemon when set.
+
+    Returns:
+        None
+    """
+    stop = stop_event or threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    watched = [config_path, credentials_path, symbols_path]
+    mtimes = {path: _mtime(path) for path in watched}
+    cfg = load_config(config_path)
+    creds = load_credentials(credentials_path)
+    symbols = read_universe(
+        symbols_path, cfg.get("universe", {}).get("suffix", DEFAULT_SUFFIX)
+    )
+    daemon_cfg = cfg.get("daemon", {})
+    cron = parse_cron(daemon_cfg.get("schedule", DEFAULT_SCHEDULE))
+
+    cache = ScanCache(
+        fundamentals_ttl=daemon_cfg.get("fundamentals_ttl_hours", 24) * 3600
+    )
+    state = DaemonState(cache)
+    server = start_health_server(
+        state,
+        daemon_cfg.get("health_host", "127.0.0.1"),
+        daemon_cfg.get("health_port", 8765),
+    )
+    log_success(f"👂 Daemon started with {len(symbols)} symbol(s).")
+
+    pending = None
+    try:
+        while not stop.is_set():
+            # Hot-reload config, credentials and symbols when they change on disk
+            changed = [path for path in watched if _mtime(path) != mtimes[path]]
+            if changed:
+                try:
+                    new_cfg = load_config(config_path)
+                    new_daemon_cfg = new_cfg.get("daemon", {})
+                    new_cron = parse_cron(
+                        new_daemon_cfg.get("schedule", DEFAULT_SCHEDULE)
+                    )
+                    creds = load_credentials(credentials_path)
+                    symbols = (
+                        read_universe(
+                            symbols_path,
+                            new_cfg.get("universe", {}).get("suffix", DEFAULT_SUFFIX),
+                        )
+                        or symbols
+                    )
+                    cfg, daemon_cfg, cron = new_cfg, new_daemon_cfg, new_cron
+                    state.metrics["config_reloads_total"] += 1
+                    pending = None
+                    log_info(
+                        f"🔄 Reloaded {', '.join(os.path.basename(p) for p in changed)}."
+                    )
+                except Exception as e:
+                    log_error(f"❌ Reload failed, keeping previous configuration: {e}")
+                mtimes = {path: _mtime(path) for path in watched}
+
+            now = market_now(daemon_cfg)
+            if pending is None:
+                pending = next_run(cron, now, daemon_cfg)
+                state.next_scan = pending.isoformat() if pending else None
+                if pending:
+                    log_info(f"⏰ Next scan scheduled at {pending.isoformat()}.")
+                else:
+                    log_warn("⚠️ Schedule never matches a trading session.")
+
+            if pending is None or now < pending:
+                wait = (
+                    POLL_INTERVAL
+                    if pending is None
+                    else (pending - now).total_seconds()
+                )
+                stop.wait(min(POLL_INTERVAL, max(wait, 0)))
+                continue
+
+            state.scanning = True
+            started = time.time()
+            try:
+                results = scan(cfg, creds, symbols, cache) or []
+                state.metrics["last_scan_results"] = len(results)
+            except Exception as e:
+                state.metrics["scan_failures_total"] += 1
+                log_error(f"❌ Scheduled scan failed: {e}")
+            finally:
+                state.scanning = False
+                state.metrics["scans_total"] += 1
+                state.metrics["last_scan_symbols"] = len(symbols)
+                state.metrics["last_scan_duration_seconds"] = round(
+                    time.time() - started, 3
+                )
+                state.metrics["last_scan_timestamp_seconds"] = round(started, 3)
+                state.last_scan = datetime.fromtimestamp(
+                    started, now.tzinfo
+                ).isoformat()
+                pending = None
+    except KeyboardInterrupt:
+        log_info("🛑 Daemon interrupted.")
+    finally:
+        server.shutdown()
+        server.server_close()
+        log_success("✅ Daemon stopped.")
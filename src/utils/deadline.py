@@ -0,0 +1,201 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+# Import Dependencies
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, time as dt_time
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Tuple
+from .logger import log_info, log_warn
+from .exceptions import ConfigError
+
+PROGRESS_STEP = 0.1  # log progress every 10% of the items
+MIN_BUDGET_SECONDS = 5  # scan time left when the deadline has already passed
+
+
+class Deadline:
+    """
+    A point in time (epoch seconds) by which work has to stop; None means no deadline.
+    """
+
+    def __init__(self, at: Optional[float] = None):
+        self.at = at
+
+    def remaining(self) -> float:
+        return math.inf if self.at is None else self.at - time.time()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def split(self, share: float) -> "Deadline":
+        """
+        Returns an earlier deadline leaving `share` of the remaining time for later phases.
+
+        Args:
+            share (float): Fraction (0–1) of the remaining time to keep in reserve.
+
+        Returns:
+            Deadline: The earlier deadline.
+        """
+        if self.at is None:
+            return self
+        return Deadline(time.time() + max(self.remaining(), 0) * (1 - share))
+
+
+def parse_deadline(value: str, now: datetime, reserve_seconds: float = 0) -> Deadline:
+    """
+    Parses a `--deadline` value: a wall-clock "HH:MM" today in the market timezone,
+    or a duration such as "45m" or "90s" from now.
+
+    Args:
+        value (str): The argument value.
+        now (datetime): The current timezone-aware time in the market timezone.
+        reserve_seconds (float): Time kept back for ranking and sending the alert.
+
+    Returns:
+        Deadline: The deadline for the scan itself; `MIN_BUDGET_SECONDS` from now
+            when it leaves no time to scan, so the alert still goes out.
+    """
+    try:
+        if value[-1] in "smh" and value[:-1].replace(".", "", 1).isdigit():
+            seconds = float(value[:-1]) * {"s": 1, "m": 60, "h": 3600}[value[-1]]
+            at = now.timestamp() + seconds
+        else:
+            at = datetime.combine(
+                now.date(), dt_time.fromisoformat(value), now.tzinfo
+            ).timestamp()
+    except (ValueError, IndexError):
+        raise ConfigError(f"Deadline '{value}' must be HH:MM or a duration like 45m.")
+    if at - reserve_seconds <= now.timestamp():
+        log_warn(
+            f"⚠️ Deadline '{value}' leaves no time to scan; "
+            f"scanning for {MIN_BUDGET_SECONDS}s and sending what is ready."
+        )
+        return Deadline(now.timestamp() + MIN_BUDGET_SECONDS)
+    return Deadline(at - reserve_seconds)
+
+
+def prioritize_symbols(symbols: List[str], previous: Dict[str, dict]) -> List[str]:
+    """
+    Orders symbols by their previous final score, then technical score, then volume;
+    symbols without history keep their order at the end.
+
+    Args:
+        symbols (List[str]): The symbols to scan.
+        previous (Dict[str, dict]): Symbol -> previous result (final_score, tech_score, avg_volume).
+
+    Returns:
+        List[str]: The symbols, highest priority first.
+    """
+
+    def key(symbol: str) -> Tuple:
+        result = previous.get(symbol)
+        if not result:
+            return (1, 0, 0, 0)
+        final_score = result.get("final_score")
+        return (
+            0,
+            -(final_score if final_score is not None else -math.inf),
+            -(result.get("tech_score") or 0),
+            -(result.get("avg_volume") or 0),
+        )
+
+    return sorted(symbols, key=key)  # sorted() is stable
+
+
+def map_until_deadline(
+    func: Callable,
+    items: list,
+    deadline: Deadline,
+    max_workers: int,
+    label: str,
+    report_progress: bool = True,
+    stop_when: Optional[Callable[[int, object], bool]] = None,
+) -> Tuple[list, bool]:
+    """
+    Runs `func` over items on a thread pool, logging progress against the deadline and
+    cancelling outstanding work once it passes or `stop_when` asks to stop.
+
+    Args:
+        func (Callable): Function applied to every item.
+        items (list): The items, highest priority first.
+        deadline (Deadline): When to stop waiting for results.
+        max_workers (int): Thread pool size.
+        label (str): Stage name used in progress logs.
+        report_progress (bool): Whether to log progress and ETA under a deadline.
+        stop_when (Callable): Optional check called with (item index, result) as each
+            item completes; returning True submits no further items and keeps the
+            results of those already running.
+
+    Returns:
+        Tuple[list, bool]: Results of the completed items in input order, and whether
+            the deadline cut the work short.
+    """
+    if not items:
+        return [], False
+
+    started = time.time()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    # With a stop check, items are submitted as workers free up, so a stop (however
+    # late the check runs) wastes at most the items already running
+    window = max_workers if stop_when is not None else len(items)
+    queued = iter(enumerate(items))
+    futures: Dict[object, int] = {}
+    outstanding = set()
+    results: Dict[int, object] = {}
+    next_report = PROGRESS_STEP
+    timed_out = stopped = False
+    try:
+        while not stopped:
+            for i, item in islice(queued, window - len(outstanding)):
+                future = executor.submit(func, item)
+                futures[future] = i
+                outstanding.add(future)
+            if not outstanding:
+                break
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                timed_out = True
+                break
+            done, outstanding = wait(
+                outstanding,
+                timeout=None if math.isinf(remaining) else remaining,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                results[futures[future]] = future.result()
+                if stop_when is not None and not stopped:
+                    stopped = stop_when(futures[future], results[futures[future]])
+
+            progress = len(results) / len(items)
+            if report_progress and deadline.at is not None and progress >= next_report:
+                elapsed = time.time() - started
+                eta = elapsed / progress - elapsed
+                log_info(
+                    f"⏳ {label}: {progress:.0%} ({len(results)}/{len(items)}), "
+                    f"ETA {eta:.0f}s, {deadline.remaining():.0f}s to the deadline."
+                )
+                if eta > deadline.remaining():
+                    log_warn(f"⚠️ {label} is projected to miss the deadline.")
+                next_report = (math.floor(progress / PROGRESS_STEP) + 1) * PROGRESS_STEP
+    finally:
+        # Queued work is cancelled; requests already in flight finish in the background
+        executor.shutdown(wait=not timed_out, cancel_futures=True)
+
+    if stopped:
+        # Items already running when the stop came still count
+        for future in outstanding:
+            if future.done() and not future.cancelled():
+                results[futures[future]] = future.result()
+
+    if timed_out:
+        log_warn(
+            f"⚠️ Deadline reached during {label}: {len(results)} of {len(items)} done, "
+            f"{len(items) - len(results)} cancelled."
+        )
+    return [results[i] for i in sorted(results)], timed_out
@@ -0,0 +1,126 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+"""
+Correlation-aware selection of the top picks.
+
+The highest scores of a day often move together (several PSU banks, say), so
+the picks are chosen greedily in score order and a candidate is passed over
+when its daily returns correlate too strongly with a pick already taken. The
+returns come from the closes fetched during the scan; nothing is downloaded.
+"""
+
+# Import Dependencies
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+DEFAULT_LOOKBACK_DAYS = 60
+MIN_OVERLAP_DAYS = 20  # fewer shared returns than this leave a pair unchecked
+
+
+def return_matrix(
+    closes: Dict[str, pd.Series], symbols: List[str], lookback: int
+) -> pd.DataFrame:
+    """
+    Builds the daily returns of the symbols on their shared trading days.
+
+    Args:
+        closes (Dict[str, pd.Series]): Symbol -> daily closes on a DatetimeIndex.
+        symbols (List[str]): The symbols to include, in column order.
+        lookback (int): Number of most recent daily returns to keep.
+
+    Returns:
+        pd.DataFrame: One column per symbol, NaN where a symbol did not trade.
+    """
+    # Align the tails on their dates in numpy; a pandas join of a few hundred
+    # series costs tens of milliseconds
+    size = lookback + 1
+    stamps = [closes[symbol].index.values[-size:] for symbol in symbols]
+    days = np.unique(np.concatenate(stamps))[-size:]
+    prices = np.full((len(days), len(symbols)), np.nan)
+    for column, symbol in enumerate(symbols):
+        keep = stamps[column] >= days[0]
+        rows = np.searchsorted(days, stamps[column][keep])
+        prices[rows, column] = closes[symbol].to_numpy()[-size:][keep]
+    returns = prices[1:] / prices[:-1] - 1
+
+    index = pd.DatetimeIndex(days[1:])
+    timezone = closes[symbols[0]].index.tz if symbols else None
+    if timezone is not None:
+        index = index.tz_localize("UTC").tz_convert(timezone)
+    return pd.DataFrame(returns, index=index, columns=symbols)
+
+
+def correlation_matrix(returns: pd.DataFrame) -> np.ndarray:
+    """
+    Correlates all columns at once. Missing returns count as the column's mean,
+    and pairs sharing fewer than `MIN_OVERLAP_DAYS` returns (or a flat series) get 0.
+
+    Args:
+        returns (pd.DataFrame): Daily returns, one column per symbol.
+
+    Returns:
+        np.ndarray: The symmetric correlation matrix.
+    """
+    values = returns.to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    filled = np.where(present, values, 0.0)
+    means = filled.sum(axis=0) / np.maximum(present.sum(axis=0), 1)
+    centered = np.where(present, filled - means, 0.0)
+    norms = np.sqrt((centered**2).sum(axis=0))
+    standardized = centered / np.where(norms > 0, norms, np.inf)
+    correlations = standardized.T @ standardized
+
+    overlap = present.T.astype(float) @ present.astype(float)
+    correlations[overlap < MIN_OVERLAP_DAYS] = 0.0
+    return correlations
+
+
+def select_diversified(
+    candidates: List[dict],
+    closes: Dict[str, pd.Series],
+    top_n: int,
+    max_correlation: float,
+    lookback: int = DEFAULT_LOOKBACK_DAYS,
+) -> Tuple[List[dict], Dict[str, Tuple[str, float]]]:
+    """
+    Picks up to `top_n` candidates in rank order, skipping any whose correlation with
+    an earlier pick exceeds `max_correlation`. Candidates without closes are never skipped.
+
+    Args:
+        candidates (List[dict]): Results sorted best first.
+        closes (Dict[str, pd.Series]): Symbol -> daily closes fetched during the scan.
+        top_n (int): Number of picks.
+        max_correlation (float): Highest correlation allowed between two picks.
+        lookback (int): Number of daily returns to correlate.
+
+    Returns:
+        Tuple: The picks, and skipped symbol -> (the pick it tracks, correlation).
+    """
+    symbols = [c["symbol"] for c in candidates if c["symbol"] in closes]
+    column = {symbol: i for i, symbol in enumerate(symbols)}
+    correlations = (
+        correlation_matrix(return_matrix(closes, symbols, lookback))
+        if len(symbols) > 1
+        else np.zeros((len(symbols), len(symbols)))
+    )
+
+    picks, taken, skipped = [], [], {}
+    for candidate in candidates:
+        if len(picks) == top_n:
+            break
+        i = column.get(candidate["symbol"])
+        if i is not None and taken:
+            row = correlations[i, taken]
+            worst = int(np.argmax(row))
+            if row[worst] > max_correlation:
+                skipped[candidate["symbol"]] = (symbols[taken[worst]], row[worst])
+                continue
+        picks.append(candidate)
+        if i is not None:
+            taken.append(i)
+    return picks, skipped
@@ -0,0 +1,108 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+"""
+One pooled, keep-alive HTTP session shared by every yfinance call in the process.
+
+yfinance keeps a single process-wide session (and the Yahoo cookie/crumb bound to
+it), so the session is created once per process; curl_cffi gives every worker
+thread its own curl handle with a persistent connection cache of `pool_size`.
+yfinance passes its own timeout with every request, which would override the
+session default, so `timeout` caps the per-request value instead.
+"""
+
+# Import Dependencies
+import threading
+from typing import Dict
+from curl_cffi import CurlInfo, CurlOpt
+from curl_cffi import requests as curl_requests
+
+HTTP_DEFAULTS = {"pool_size": 10, "timeout": 10, "impersonate": "chrome"}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class CountingSession(curl_requests.Session):
+    """
+    curl_cffi session that counts requests and how many reused a pooled connection.
+    """
+
+    def __init__(self, max_timeout: float = None, **kwargs):
+        """
+        Args:
+            max_timeout (float): Upper bound in seconds for every request's timeout.
+        """
+        super().__init__(curl_infos=[CurlInfo.NUM_CONNECTS], **kwargs)
+        self.max_timeout = max_timeout
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "new_connections": 0,
+            "reused_connections": 0,
+            "errors": 0,
+        }
+
+    def _capped_timeout(self, timeout):
+        if isinstance(timeout, tuple):  # (connect, read)
+            return tuple(self._capped_timeout(part) for part in timeout)
+        if isinstance(timeout, (int, float)):
+            return min(timeout, self.max_timeout)
+        return self.max_timeout  # None or unset: no limit of its own
+
+    def request(self, *args, **kwargs):
+        if self.max_timeout is not None:
+            kwargs["timeout"] = self._capped_timeout(kwargs.get("timeout"))
+        try:
+            response = super().request(*args, **kwargs)
+        except Exception:
+            with self._stats_lock:
+                self.stats["requests"] += 1
+                self.stats["errors"] += 1
+            raise
+        # NUM_CONNECTS is 0 when curl served the request over a cached connection
+        new_connections = response.infos.get(CurlInfo.NUM_CONNECTS, 0)
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["new_connections"] += new_connections
+            self.stats["reused_connections"] += int(new_connections == 0)
+        return response
+
+
+def get_session(cfg: dict = None) -> CountingSession:
+    """
+    Returns the process-wide pooled session, creating it from `cfg["http"]` on first use.
+
+    Args:
+        cfg (dict): Configuration dictionary (only read on first use).
+
+    Returns:
+        CountingSession: The shared session to pass to yfinance.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            params = {**HTTP_DEFAULTS, **(cfg or {}).get("http", {})}
+            _session = CountingSession(
+                max_timeout=params["timeout"],
+                impersonate=params["impersonate"],
+                timeout=params["timeout"],
+                curl_options={CurlOpt.MAXCONNECTS: params["pool_size"]},
+            )
+        return _session
+
+
+def session_stats() -> Dict[str, int]:
+    """
+    Returns the request and connection-reuse counters of the shared session.
+
+    Returns:
+        Dict[str, int]: Counters keyed by name (empty before the first request).
+    """
+    if _session is None:
+        return {}
+    with _session._stats_lock:
+        return dict(_session.stats)
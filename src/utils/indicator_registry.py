@@ -0,0 +1,386 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+"""
+Declarative indicator registry.
+
+Every indicator declares the config parameters it reads and the intermediate
+series it consumes. The scoring config is compiled once into an execution plan
+that only contains indicators with a non-zero weight and that computes every
+shared intermediate series (EMAs, price differences, ...) exactly once.
+
+Indicators can run on weekly or monthly bars (`scoring.timeframes`). Those bars
+are resampled locally from the daily history, so they cost no extra requests.
+
+Every series also declares how many bars of history it needs (EMAs until the
+weight of their seed has decayed), from which the plan derives the shortest
+history window worth downloading.
+"""
+
+# Import Dependencies
+import json
+import math
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
+import numpy as np
+import pandas as pd
+from .indicators import sma, ema, rsi_from_delta
+from .exceptions import ConfigError
+
+# Registries
+SERIES_REGISTRY: Dict[str, Dict[str, Callable]] = {}
+INDICATOR_REGISTRY: Dict[str, Dict[str, Any]] = {}
+
+# Series keys are tuples of (kind, *args) so identical intermediates share a key
+CLOSE = ("field", "Close")
+
+# Pandas resample rules of the timeframes derived from daily bars
+TIMEFRAMES = {"daily": None, "weekly": "W-FRI", "monthly": "ME"}
+RESAMPLERS = {
+    "Open": lambda bars: bars.first(),
+    "High": lambda bars: bars.max(),
+    "Low": lambda bars: bars.min(),
+    "Close": lambda bars: bars.last(),
+    "Volume": lambda bars: bars.sum(min_count=1),
+}
+
+# Calendar days per bar of each timeframe, and slack for exchange holidays
+DAYS_PER_BAR = {"daily": 7 / 5, "weekly": 7, "monthly": 31}
+HOLIDAY_MARGIN_DAYS = 10
+
+
+def register_series(
+    kind: str, deps: Callable = None, lookback: Callable = None
+) -> Callable:
+    """
+    Registers a builder for an intermediate series.
+
+    Args:
+        kind (str): The series kind, used as the first element of its key.
+        deps (Callable): Maps the key arguments to the keys of the input series.
+        lookback (Callable): Maps the key arguments (and the EMA `tolerance`) to the
+            bars needed on top of the inputs' history (default: none).
+
+    Returns:
+        Callable: The decorator registering the builder.
+    """
+
+    def decorator(build: Callable) -> Callable:
+        SERIES_REGISTRY[kind] = {
+            "build": build,
+            "deps": deps or (lambda *args: []),
+            "lookback": lookback or (lambda *args, **kwargs: 0),
+        }
+        return build
+
+    return decorator
+
+
+def register_indicator(name: str, params: Dict[str, Tuple[str, Any]], inputs: Callable):
+    """
+    Registers a scored indicator.
+
+    Args:
+        name (str): The indicator name, matching its key in `scoring.weights`.
+        params (Dict[str, Tuple[str, Any]]): Parameter name -> (config key, default).
+        inputs (Callable): Maps the resolved parameters to the input series keys.
+
+    Returns:
+        Callable: The decorator registering the signal function.
+    """
+
+    def decorator(signal: Callable) -> Callable:
+        INDICATOR_REGISTRY[name] = {
+            "params": params,
+            "inputs": inputs,
+            "signal": signal,
+        }
+        return signal
+
+    return decorator
+
+
+# -----------------------------
+# Intermediate Series
+# -----------------------------
+@register_series("field")
+def _field(data: pd.DataFrame, inputs: list, name: str, timeframe: str = "daily"):
+    rule = TIMEFRAMES[timeframe]
+    if rule is None:
+        return data[name]
+    # The latest bar is the still-forming week or month, like a chart would show
+    bars = RESAMPLERS[name](data[name].resample(rule))
+    # Drop periods without any trading (e.g. a week of holidays)
+    return bars.dropna(how="all") if isinstance(bars, pd.DataFrame) else bars.dropna()
+
+
+def ema_warmup(span: int, tolerance: float) -> int:
+    """
+    Returns the bars after which an EMA's seed weighs less than `tolerance`.
+
+    Args:
+        span (int): The EMA span.
+        tolerance (float): The acceptable residual weight of the first value.
+
+    Returns:
+        int: The number of bars.
+    """
+    return math.ceil(math.log(tolerance) / math.log(1 - 2 / (span + 1)))
+
+
+@register_series("diff", deps=lambda src: [src], lookback=lambda src, **_: 1)
+def _diff(data: pd.DataFrame, inputs: list, src: tuple):
+    return inputs[0].diff()
+
+
+@register_series(
+    "sma", deps=lambda src, period: [src], lookback=lambda src, period, **_: period - 1
+)
+def _sma(data: pd.DataFrame, inputs: list, src: tuple, period: int):
+    return sma(inputs[0], period)
+
+
+@register_series(
+    "ema",
+    deps=lambda src, span: [src],
+    lookback=lambda src, span, tolerance: ema_warmup(span, tolerance) - 1,
+)
+def _ema(data: pd.DataFrame, inputs: list, src: tuple, span: int):
+    return ema(inputs[0], span)
+
+
+@register_series("sub", deps=lambda left, right: [left, right])
+def _sub(data: pd.DataFrame, inputs: list, left: tuple, right: tuple):
+    return inputs[0] - inputs[1]
+
+
+@register_series(
+    "rsi",
+    deps=lambda src, period: [("diff", src)],
+    lookback=lambda src, period, **_: period - 1,
+)
+def _rsi(data: pd.DataFrame, inputs: list, src: tuple, period: int):
+    return rsi_from_delta(inputs[0], period)
+
+
+def macd_keys(fast: int, slow: int, signal: int) -> Tuple[tuple, tuple]:
+    """
+    Returns the series keys of the MACD line and its signal line.
+
+    Args:
+        fast (int): Fast EMA span.
+        slow (int): Slow EMA span.
+        signal (int): Signal EMA span.
+
+    Returns:
+        Tuple[tuple, tuple]: The MACD line key and the signal line key.
+    """
+    macd_line = ("sub", ("ema", CLOSE, fast), ("ema", CLOSE, slow))
+    return macd_line, ("ema", macd_line, signal)
+
+
+# -----------------------------
+# Indicators
+# -----------------------------
+def _last(series):
+    # Works for a single price series and for a date x symbol frame alike
+    return series.iloc[-1]
+
+
+@register_indicator(
+    "momentum",
+    params={"period": ("sma_period", 20)},
+    inputs=lambda period: [CLOSE, ("sma", CLOSE, period)],
+)
+def _momentum_signal(close, sma_line):
+    return _last(close) > _last(sma_line)
+
+
+@register_indicator(
+    "rsi",
+    params={"period": ("rsi_period", 14)},
+    inputs=lambda period: [("rsi", CLOSE, period)],
+)
+def _rsi_signal(rsi_line):
+    value = _last(rsi_line)
+    return (value > 30) & (value < 70)
+
+
+@register_indicator(
+    "macd",
+    params={
+        "fast": ("macd_fast_period", 12),
+        "slow": ("macd_slow_period", 26),
+        "signal": ("macd_signal_period", 9),
+    },
+    inputs=lambda fast, slow, signal: list(macd_keys(fast, slow, signal)),
+)
+def _macd_signal(macd_line, signal_line):
+    return _last(macd_line) > _last(signal_line)
+
+
+# -----------------------------
+# Execution Plan
+# -----------------------------
+def _on_timeframe(key: tuple, timeframe: str) -> tuple:
+    # Rewrites a series key so all of its price fields come from `timeframe` bars
+    if timeframe == "daily":
+        return key
+    if key[0] == "field":
+        return key + (timeframe,)
+    return (key[0],) + tuple(
+        _on_timeframe(arg, timeframe) if isinstance(arg, tuple) else arg
+        for arg in key[1:]
+    )
+
+
+def _resolve_order(keys: List[tuple], order: Dict[tuple, None]) -> None:
+    # Depth-first post-order so every series is built after its inputs
+    for key in keys:
+        if key in order:
+            continue
+        _resolve_order(SERIES_REGISTRY[key[0]]["deps"](*key[1:]), order)
+        order[key] = None
+
+
+@lru_cache(maxsize=32)
+def _compile(scoring_json: str) -> Dict[str, Any]:
+    scoring = json.loads(scoring_json)
+    weights = scoring.get("weights", {})
+    timeframes = scoring.get("timeframes", {})
+
+    indicators = []
+    for name, spec in INDICATOR_REGISTRY.items():
+        weight = weights.get(name, 0)
+        if not weight:
+            continue  # Zero-weight indicators never cost a pass over the data
+        params = {
+            param: scoring.get(cfg_key, default)
+            for param, (cfg_key, default) in spec["params"].items()
+        }
+        timeframe = timeframes.get(name, "daily")
+        if timeframe not in TIMEFRAMES:
+            raise ConfigError(
+                f"Unknown timeframe '{timeframe}' for {name}; "
+                f"use one of {', '.join(TIMEFRAMES)}."
+            )
+        indicators.append(
+            {
+                "name": name,
+                "weight": weight,
+                "timeframe": timeframe,
+                "inputs": [
+                    _on_timeframe(key, timeframe) for key in spec["inputs"](**params)
+                ],
+                "signal": spec["signal"],
+            }
+        )
+
+    order: Dict[tuple, None] = {}
+    for indicator in indicators:
+        _resolve_order(indicator["inputs"], order)
+
+    return {"indicators": indicators, "series": list(order)}
+
+
+def compile_plan(cfg: dict) -> Dict[str, Any]:
+    """
+    Compiles the scoring config into an execution plan (cached per config).
+
+    Args:
+        cfg (dict): Configuration dictionary.
+
+    Returns:
+        Dict[str, Any]: The plan with active indicators, ordered series keys and total weight.
+    """
+    return _compile(json.dumps(cfg["scoring"], sort_keys=True))
+
+
+def evaluate_plan(plan: Dict[str, Any], data: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Computes each intermediate series once and evaluates every active indicator.
+
+    Args:
+        plan (Dict[str, Any]): A plan returned by `compile_plan`.
+        data (pd.DataFrame): Daily stock data (a DatetimeIndex is needed for weekly
+            or monthly indicators).
+
+    Returns:
+        Dict[str, Any]: Indicator name -> signal in [0, 1] (a float, or a Series per symbol).
+    """
+    series: Dict[tuple, Any] = {}
+    for key in plan["series"]:
+        spec = SERIES_REGISTRY[key[0]]
+        inputs = [series[dep] for dep in spec["deps"](*key[1:])]
+        series[key] = spec["build"](data, inputs, *key[1:])
+
+    signals = {}
+    for indicator in plan["indicators"]:
+        value = indicator["signal"](*[series[key] for key in indicator["inputs"]])
+        signals[indicator["name"]] = (
+            value.astype(float)
+            if isinstance(value, pd.Series)
+            else float(np.bool_(value))
+        )
+    return signals
+
+
+# -----------------------------
+# Lookback Planner
+# -----------------------------
+def _bars_needed(key: tuple, tolerance: float) -> int:
+    # Bars of the key's timeframe needed before its latest value is valid
+    spec = SERIES_REGISTRY[key[0]]
+    inputs = [_bars_needed(dep, tolerance) for dep in spec["deps"](*key[1:])]
+    return max(inputs, default=1) + spec["lookback"](*key[1:], tolerance=tolerance)
+
+
+@lru_cache(maxsize=32)
+def _history_days(scoring_json: str) -> int:
+    scoring = json.loads(scoring_json)
+    plan = _compile(scoring_json)
+    tolerance = scoring.get("ema_warmup_tolerance", 0.01)
+
+    # Price averages reported with every stock use the daily bars too
+    days = math.ceil(scoring.get("avg_price_duration", 30) * DAYS_PER_BAR["daily"])
+    for indicator in plan["indicators"]:
+        bars = max(_bars_needed(key, tolerance) for key in indicator["inputs"])
+        if indicator["timeframe"] != "daily":
+            bars += 1  # The latest week or month is still forming
+        days = max(days, math.ceil(bars * DAYS_PER_BAR[indicator["timeframe"]]))
+    return days + HOLIDAY_MARGIN_DAYS
+
+
+def history_window(cfg: dict) -> pd.Timedelta:
+    """
+    Returns the shortest daily history that every active indicator needs, including
+    EMA warm-up (cached per config).
+
+    Args:
+        cfg (dict): Configuration dictionary.
+
+    Returns:
+        pd.Timedelta: The calendar window to download.
+    """
+    return pd.Timedelta(days=_history_days(json.dumps(cfg["scoring"], sort_keys=True)))
+
+
+def technical_score(signals: Dict[str, Any], weights: Dict[str, Any]):
+    """
+    Combines indicator signals into a technical score (0–100). Weights without a
+    signal, e.g. of unregistered indicators, still count towards the total.
+
+    Args:
+        signals (Dict[str, Any]): Indicator name -> 0/1 signal, or an array or
+            Series of signals per symbol.
+        weights (Dict[str, Any]): Indicator name -> weight, or an array of weights
+            per profile.
+
+    Returns:
+        The score rounded to 2 decimals, broadcast over symbols and profiles.
+    """
+    total = sum(weight * signals.get(name, 0) for name, weight in weights.items())
+    return np.round(total / sum(weights.values()) * 100, 2)
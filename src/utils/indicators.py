@@ -23,6 +23,20 @@ def sma(series: pd.Series, period: int) -> pd.Series:
     return series.rolling(window=period).mean()
 
 
+def ema(series: pd.Series, span: int) -> pd.Series:
+    """
+    Calculates the Exponential Moving Average (EMA) for a given series.
+
+    Args:
+        series (pd.Series): The input series (e.g., stock prices).
+        span (int): The span of the EMA.
+
+    Returns:
+        pd.Series: A series containing the EMA values.
+    """
+    return series.ewm(span=span, adjust=False).mean()
+
+
 def rsi(series: pd.Series, period: int) -> pd.Series:
     """
     Calculates the Relative Strength Index (RSI) for a given series.
@@ -34,7 +48,20 @@ def rsi(series: pd.Series, period: int) -> pd.Series:
     Returns:
         pd.Series: A series containing the RSI values.
     """
-    delta = series.diff()
+    return rsi_from_delta(series.diff(), period)
+
+
+def rsi_from_delta(delta: pd.Series, period: int) -> pd.Series:
+    """
+    Calculates the RSI from an already differenced series.
+
+    Args:
+        delta (pd.Series): Period-over-period changes of the input series.
+        period (int): The period over which to calculate the RSI.
+
+    Returns:
+        pd.Series: A series containing the RSI values.
+    """
     gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
     loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
     rs = gain / loss
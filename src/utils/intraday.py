@@ -0,0 +1,325 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+"""
+Intraday scan mode: polls intraday bars, updates indicators incrementally and
+alerts on symbols that newly cross `thresholds.intraday_alert_score`.
+"""
+
+# Import Dependencies
+import math
+import time
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional
+import pandas as pd
+from .logger import log_info, log_success, log_warn, log_error
+from .market_data import fetch_intraday_bars
+from .http_session import get_session
+from .scheduler import is_market_open, market_now, session_opens_later
+from .indicator_registry import compile_plan, technical_score
+
+INTERVAL_MINUTES = {"5m": 5, "15m": 15}
+COLD_RETRY_MINUTES = 30  # wait before asking again for a symbol that had no bars
+# Registry indicators with an incremental counterpart below
+INCREMENTAL_INDICATORS = ["momentum", "rsi", "macd"]
+
+
+class _IncrementalEMA:
+    # Matches pandas ewm(span=span, adjust=False): seeded with the first value
+    def __init__(self, span: int):
+        self.alpha = 2 / (span + 1)
+        self.value = None
+
+    def update(self, x: float) -> float:
+        self.value = (
+            x if self.value is None else self.alpha * x + (1 - self.alpha) * self.value
+        )
+        return self.value
+
+
+class IncrementalIndicators:
+    """
+    State of the `momentum`, `rsi` and `macd` indicators of one symbol, updated in
+    O(1)-ish per new bar. Their signals match `evaluate_plan` on the same closes,
+    including the warm-up: like `rsi_from_delta`, which fills the missing change of
+    the first close with 0, RSI is defined from `rsi_period` closes on. Other
+    registry indicators are not supported.
+    """
+
+    def __init__(self, scoring_cfg: dict):
+        self.sma_period = scoring_cfg.get("sma_period", 20)
+        self.rsi_period = scoring_cfg.get("rsi_period", 14)
+        self.closes = deque(maxlen=self.sma_period)
+        self.gains = deque(maxlen=self.rsi_period)
+        self.losses = deque(maxlen=self.rsi_period)
+        self.ema_fast = _IncrementalEMA(scoring_cfg.get("macd_fast_period", 12))
+        self.ema_slow = _IncrementalEMA(scoring_cfg.get("macd_slow_period", 26))
+        self.ema_signal = _IncrementalEMA(scoring_cfg.get("macd_signal_period", 9))
+        self.last_close = None
+        self.macd = None
+        self.last_bar = None
+
+    def update(self, close: float, bar_time: pd.Timestamp = None) -> None:
+        """
+        Consumes one completed bar.
+
+        Args:
+            close (float): The bar's close.
+            bar_time (pd.Timestamp): The bar's start time.
+
+        Returns:
+            None
+        """
+        # The first bar has no change; `rsi_from_delta` counts it as 0 as well
+        delta = 0.0 if self.last_close is None else close - self.last_close
+        self.gains.append(max(delta, 0.0))
+        self.losses.append(max(-delta, 0.0))
+        self.closes.append(close)
+        self.macd = self.ema_fast.update(close) - self.ema_slow.update(close)
+        self.ema_signal.update(self.macd)
+        self.last_close = close
+        self.last_bar = bar_time
+
+    def signals(self) -> Dict[str, float]:
+        """
+        Returns the momentum, RSI and MACD signals for the latest bar.
+
+        Returns:
+            Dict[str, float]: Indicator name -> 0 or 1.
+        """
+        momentum = (
+            len(self.closes) == self.sma_period
+            and self.last_close > sum(self.closes) / self.sma_period
+        )
+
+        rsi_ok = False
+        if len(self.gains) == self.rsi_period:
+            gain, loss = sum(self.gains), sum(self.losses)
+            if loss > 0:
+                rsi_value = 100 - 100 / (1 + gain / loss)
+                rsi_ok = 30 < rsi_value < 70
+
+        macd = self.macd is not None and self.macd > self.ema_signal.value
+        return {"momentum": float(momentum), "rsi": float(rsi_ok), "macd": float(macd)}
+
+    def score(self, weights: Dict[str, float]) -> float:
+        """
+        Returns the technical score (0–100) for the latest bar.
+
+        Args:
+            weights (Dict[str, float]): The `scoring.weights` config.
+
+        Returns:
+            float: The weighted score, scaled like `compute_technical_score`.
+        """
+        return technical_score(self.signals(), weights)
+
+
+class IntradayScanner:
+    """
+    Keeps incremental indicator state per symbol and de-duplicates alerts per day.
+    """
+
+    def __init__(self, cfg: dict, tickers: Dict[str, str], interval: str):
+        """
+        Args:
+            cfg (dict): Configuration dictionary.
+            tickers (Dict[str, str]): Symbol -> Yahoo ticker.
+            interval (str): Bar interval, "5m" or "15m".
+        """
+        self.cfg = cfg
+        self.tickers = tickers
+        self.interval = interval
+        self.bar_length = pd.Timedelta(minutes=INTERVAL_MINUTES[interval])
+        self.state: Dict[str, IncrementalIndicators] = {}
+        self.above: Dict[str, bool] = {}
+        self.alerted = set()
+        self.session_day = None
+        # Symbols whose warm-up returned no bars, and when to ask for them again
+        self.retry_at: Dict[str, pd.Timestamp] = {}
+
+        # Say which configured indicators intraday mode cannot score
+        indicators = compile_plan(cfg)["indicators"]
+        ignored = [
+            i["name"] for i in indicators if i["name"] not in INCREMENTAL_INDICATORS
+        ]
+        if ignored:
+            log_warn(
+                f"⚠️ Intraday mode only scores {', '.join(INCREMENTAL_INDICATORS)}; "
+                f"{', '.join(ignored)} count as 0."
+            )
+        resampled = [i["name"] for i in indicators if i["timeframe"] != "daily"]
+        if resampled:
+            log_warn(
+                f"⚠️ scoring.timeframes do not apply intraday; "
+                f"{', '.join(resampled)} use {interval} bars."
+            )
+
+    def _completed(self, bars: pd.DataFrame, now: pd.Timestamp) -> pd.DataFrame:
+        # The most recent bar is still forming until its interval has elapsed
+        return bars[bars.index + self.bar_length <= now]
+
+    def poll(self, now: pd.Timestamp) -> List[dict]:
+        """
+        Fetches the bars since the last poll, updates indicators and returns new crossings.
+
+        Args:
+            now (pd.Timestamp): The current timezone-aware time.
+
+        Returns:
+            List[dict]: Symbols that newly crossed the intraday alert score.
+        """
+        if self.session_day != now.date():
+            # Alerts are de-duplicated per trading day
+            self.session_day = now.date()
+            self.alerted.clear()
+
+        intraday_cfg = self.cfg.get("intraday", {})
+        threshold = self.cfg["thresholds"]["intraday_alert_score"]
+        weights = self.cfg["scoring"]["weights"]
+        batch_size = intraday_cfg.get("batch_size", 200)
+        warmup_period = intraday_cfg.get("warmup_period", "5d")
+        cold_retry = pd.Timedelta(
+            minutes=intraday_cfg.get("cold_retry_minutes", COLD_RETRY_MINUTES)
+        )
+
+        symbols = list(self.tickers)
+        crossings = []
+        for i in range(0, len(symbols), batch_size):
+            batch = symbols[i : i + batch_size]
+            cold = [
+                s
+                for s in batch
+                if s not in self.state and self.retry_at.get(s, now) <= now
+            ]
+            warm = [s for s in batch if s in self.state]
+
+            fetches = []
+            if cold:
+                fetches.append((cold, None))
+            if warm:
+                # Only ask for bars after the oldest last-seen bar in the batch
+                fetches.append((warm, min(self.state[s].last_bar for s in warm)))
+
+            for group, start in fetches:
+                try:
+                    bars = fetch_intraday_bars(
+                        [self.tickers[s] for s in group],
+                        self.interval,
+                        start=start,
+                        period=warmup_period,
+                        session=get_session(self.cfg),
+                    )
+                except Exception as e:
+                    log_error(
+                        f"❌ Intraday fetch failed for {len(group)} symbol(s): {e}"
+                    )
+                    continue
+
+                for symbol in group:
+                    frame = bars.get(self.tickers[symbol])
+                    if frame is None:
+                        if symbol not in self.state:
+                            # Not another full warm-up download every cycle
+                            self.retry_at[symbol] = now + cold_retry
+                        continue
+                    frame = self._completed(frame, now)
+                    indicators = self.state.get(symbol)
+                    if indicators is not None:
+                        frame = frame[frame.index > indicators.last_bar]
+                    if frame.empty:
+                        continue
+                    is_new = indicators is None
+                    if is_new:
+                        indicators = IncrementalIndicators(self.cfg["scoring"])
+                        self.state[symbol] = indicators
+                    for bar_time, close in frame["Close"].items():
+                        indicators.update(float(close), bar_time)
+
+                    score = indicators.score(weights)
+                    above = score >= threshold
+                    # The warm-up establishes the baseline; only later crossings alert
+                    if above and not is_new and not self.above.get(symbol, False):
+                        if symbol not in self.alerted:
+                            self.alerted.add(symbol)
+                            crossings.append(
+                                {
+                                    "symbol": symbol,
+                                    "tech_score": score,
+                                    "last_close": round(indicators.last_close, 2),
+                                    "bar_time": indicators.last_bar,
+                                }
+                            )
+                    self.above[symbol] = above
+        return crossings
+
+
+def run_intraday(
+    cfg: dict,
+    tickers: Dict[str, str],
+    notify: Callable,
+    interval: Optional[str] = None,
+    stop_event: threading.Event = None,
+) -> None:
+    """
+    Polls intraday bars during market hours and notifies on new threshold crossings.
+    Started before the open of a trading day, it waits for the session.
+
+    Args:
+        cfg (dict): Configuration dictionary.
+        tickers (Dict[str, str]): Symbol -> Yahoo ticker.
+        notify (Callable): Called with the list of crossings of each cycle.
+        interval (Optional[str]): Bar interval overriding `intraday.interval`.
+        stop_event (threading.Event): Optional event that stops polling when set.
+
+    Returns:
+        None
+    """
+    stop = stop_event or threading.Event()
+    intraday_cfg = cfg.get("intraday", {})
+    daemon_cfg = cfg.get("daemon", {})
+    interval = interval or intraday_cfg.get("interval", "5m")
+    if interval not in INTERVAL_MINUTES:
+        raise ValueError(f"Unsupported intraday interval '{interval}'.")
+    poll_seconds = intraday_cfg.get("poll_seconds", INTERVAL_MINUTES[interval] * 60)
+    bar_delay = intraday_cfg.get("bar_delay_seconds", 10)
+
+    scanner = IntradayScanner(cfg, tickers, interval)
+    log_info(
+        f"⏱️ Intraday scan of {len(tickers)} symbol(s) every {poll_seconds}s ({interval} bars)."
+    )
+
+    while not stop.is_set():
+        now = market_now(daemon_cfg)
+        if not is_market_open(now, daemon_cfg):
+            opens_at = session_opens_later(now, daemon_cfg)
+            if opens_at is None:
+                log_info("🔔 Market is closed. Stopping intraday scan.")
+                break
+            # Launched before the open, e.g. by cron: wait for the session
+            log_info(f"⏳ Waiting for the market to open at {opens_at:%H:%M}.")
+            stop.wait((opens_at - now).total_seconds())
+            continue
+
+        started = time.time()
+        crossings = scanner.poll(pd.Timestamp(now))
+        elapsed = time.time() - started
+        if crossings:
+            log_success(
+                f"📈 {len(crossings)} symbol(s) crossed the intraday alert score."
+            )
+            notify(crossings)
+        if elapsed > poll_seconds:
+            log_warn(
+                f"⚠️ Intraday cycle took {elapsed:.1f}s, longer than the {poll_seconds}s interval."
+            )
+
+        # Wake up just after the next bar boundary so the new bar is complete
+        next_poll = (
+            math.ceil((time.time() + 1) / poll_seconds) * poll_seconds + bar_delay
+        )
+        stop.wait(max(next_poll - time.time(), 0))
@@ -0,0 +1,103 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+# Import Dependencies
+from datetime import datetime
+from typing import Dict, List
+import pandas as pd
+import yfinance as yf
+from yfinance import Ticker
+from .cache import ScanCache
+from .scheduler import MARKET_TIMEZONE
+
+HISTORY_WINDOW = pd.Timedelta(days=183)  # about 6 months, when no window is planned
+
+
+def fetch_history(
+    ticker: Ticker,
+    cache: ScanCache = None,
+    fresh_since: float = None,
+    window: pd.Timedelta = None,
+) -> pd.DataFrame:
+    """
+    Fetches the daily price history of a ticker, only requesting new bars when cached.
+
+    Args:
+        ticker (Ticker): The Ticker object for the stock.
+        cache (ScanCache): Optional cache of previously fetched histories.
+        fresh_since (float): Epoch time after which a cached history is reused as is.
+        window (pd.Timedelta): History to keep, normally `history_window(cfg)`.
+
+    Returns:
+        pd.DataFrame: The OHLCV history.
+    """
+    window = window or HISTORY_WINDOW
+    entry = cache.get_history(ticker.ticker) if cache is not None else None
+    if (
+        entry is None
+        or entry["data"].empty
+        # A longer window than cached (e.g. after a config change) needs a full fetch
+        or (entry.get("window") or HISTORY_WINDOW) < window
+    ):
+        start = pd.Timestamp.now(tz=MARKET_TIMEZONE).normalize() - window
+        data = ticker.history(start=start.date())
+    elif fresh_since is not None and entry["fetched_at"] >= fresh_since:
+        return entry["data"]
+    else:
+        # Refetch from the last cached bar, which may have been incomplete
+        cached = entry["data"]
+        new_bars = ticker.history(start=cached.index[-1].date())
+        if new_bars is None or new_bars.empty:
+            data = cached
+        else:
+            data = pd.concat([cached[cached.index < new_bars.index[0]], new_bars])
+            data = data[data.index >= data.index[-1] - window]
+
+    if cache is not None and data is not None and not data.empty:
+        cache.set_history(ticker.ticker, data, window)
+    return data
+
+
+def fetch_intraday_bars(
+    tickers: List[str],
+    interval: str,
+    start: datetime = None,
+    period: str = None,
+    session=None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Fetches intraday bars for many tickers in a single batched request.
+
+    Args:
+        tickers (List[str]): Yahoo ticker symbols.
+        interval (str): Bar interval, e.g. "5m" or "15m".
+        start (datetime): Only return bars from this moment on.
+        period (str): Period to fetch instead of `start`, e.g. "5d" for warm-up.
+        session: Optional pooled HTTP session shared with other yfinance calls.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Ticker -> OHLCV bars (tickers without data are omitted).
+    """
+    data = yf.download(
+        tickers,
+        start=start,
+        period=None if start else period,
+        interval=interval,
+        group_by="ticker",
+        threads=True,
+        progress=False,
+        session=session,
+    )
+    bars = {}
+    if data is None or data.empty:
+        return bars
+    for ticker in tickers:
+        if ticker not in data.columns.get_level_values(0):
+            continue
+        frame = data[ticker].dropna(subset=["Close"])
+        if not frame.empty:
+            bars[ticker] = frame
+    return bars
@@ -7,12 +7,19 @@ __status__ = "DEV"
 from typing import Any, Dict, List
 from telegram import Bot
 from src.utils.logger import log_success, log_error, log_warn
+from src.utils.diversification import select_diversified, DEFAULT_LOOKBACK_DAYS
 from datetime import datetime
 import pandas as pd
 import html  # For escaping HTML content
 
 
-def compose_message(results: list, cfg: dict, skipped_symbols: list) -> str:
+def compose_message(
+    results: list,
+    cfg: dict,
+    skipped_symbols: list,
+    partial: dict = None,
+    closes: Dict[str, pd.Series] = None,
+) -> str:
     """
     Composes a message summarizing the stock analysis results in a message format with enhanced recommendations.
 
@@ -20,36 +27,66 @@ def compose_message(results: list, cfg: dict, skipped_symbols: list) -> str:
         results (list): List of dictionaries containing stock scores.
         cfg (dict): Configuration dictionary.
         skipped_symbols (list): List of skipped symbols.
+        partial (dict): Optional {"scored", "total"} coverage when a deadline cut the scan short.
+        closes (Dict[str, pd.Series]): Optional symbol -> daily closes, used to skip picks
+            that move with a better-ranked pick (see `diversification` in the config).
 
     Returns:
         str: The composed message.
     """
     try:
+        coverage = (
+            f"⏱️ Partial results: scored <b>{partial['scored']}</b> of "
+            f"<b>{partial['total']}</b> stocks before the deadline.\n\n"
+            if partial
+            else ""
+        )
         if not results:
             raise ValueError("No results to compose a message.")
 
         # Filter stocks above the buy_threshold
         buy_threshold = cfg["thresholds"]["buy_threshold"]
         filtered_results = [
-            res for res in results if res["final_score"] >= buy_threshold
+            res
+            for res in results
+            if res["final_score"] is not None and res["final_score"] >= buy_threshold
         ]
 
         if not filtered_results:
-            return "<b>🚀 Quantastic — Stock Analysis Results</b>\n\n⚠️ No stocks met the buy threshold.\n"
+            return (
+                "<b>🚀 Quantastic — Stock Analysis Results</b>\n\n"
+                + coverage
+                + "⚠️ No stocks met the buy threshold.\n"
+            )
 
         # Sort results by final score in descending order
         filtered_results = sorted(
             filtered_results, key=lambda x: x["final_score"], reverse=True
         )
 
+        # Pick the top N, passing over names that track an earlier pick
+        top_n = cfg["scoring"]["top_n_watch"]
+        diversification = cfg.get("diversification", {})
+        correlated = {}
+        if closes and diversification.get("max_correlation") is not None:
+            picks, correlated = select_diversified(
+                filtered_results,
+                closes,
+                top_n,
+                diversification["max_correlation"],
+                diversification.get("lookback_days", DEFAULT_LOOKBACK_DAYS),
+            )
+        else:
+            picks = filtered_results[:top_n]
+
         # Prepare the message header
-        message = "<b>🚀 Quantastic — Stock Analysis Results</b>\n\n"
-        message += f"📊 Processed <b>{len(results)}</b> stocks from NSE.\n\n"
+        message = "<b>🚀 Quantastic — Stock Analysis Results</b>\n\n" + coverage
+        message += f"📊 Processed <b>{len(results)}</b> stocks from NSE and BSE.\n\n"
         message += "<b>🎯 Quantastic Recommends to Check these Stocks: </b>\n\n"
 
         # Add stock details
         avg_price_duration = cfg["scoring"].get("avg_price_duration", 30)
-        for result in filtered_results[: cfg["scoring"]["top_n_watch"]]:
+        for result in picks:
             try:
                 message += (
                     f"🏷️ <b>{result['symbol']}</b>\n"
@@ -65,6 +102,16 @@ def compose_message(results: list, cfg: dict, skipped_symbols: list) -> str:
                 )
                 continue
 
+        if correlated:
+            message += (
+                "🔗 Passed over as they move with a pick above: "
+                + ", ".join(
+                    f"{symbol} ({correlation:.2f} with {peer})"
+                    for symbol, (peer, correlation) in correlated.items()
+                )
+                + "\n\n"
+            )
+
         # Add explanatory information
         message += (
             "<i>• 🏆 <b>Final Score (0–100)</b>: Average of Technical and Fundamental scores (more is better).</i>\n"
@@ -78,6 +125,33 @@ def compose_message(results: list, cfg: dict, skipped_symbols: list) -> str:
         raise
 
 
+def compose_intraday_message(crossings: list, cfg: dict, interval: str) -> str:
+    """
+    Composes an alert for symbols that newly crossed the intraday alert score.
+
+    Args:
+        crossings (list): Crossings returned by the intraday scanner.
+        cfg (dict): Configuration dictionary.
+        interval (str): The polled bar interval.
+
+    Returns:
+        str: The composed message.
+    """
+    threshold = cfg["thresholds"]["intraday_alert_score"]
+    message = "<b>⚡ Quantastic — Intraday Alert</b>\n\n"
+    message += (
+        f"📈 Crossed the intraday score of <b>{threshold}</b> on {interval} bars:\n\n"
+    )
+    for crossing in sorted(crossings, key=lambda x: x["tech_score"], reverse=True):
+        message += (
+            f"🏷️ <b>{crossing['symbol']}</b>\n"
+            f"   • 📈 Tech Score: {round(crossing['tech_score'], 1)}\n"
+            f"   • 💰 Last Close: ₹{round(crossing['last_close'], 1)}\n"
+            f"   • 🕒 Bar: {crossing['bar_time'].strftime('%H:%M')}\n\n"
+        )
+    return message
+
+
 def send_telegram_message(bot_token: str, chat_id: str, text: str) -> None:
     """
     Sends a Telegram message using the Bot API.
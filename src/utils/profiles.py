@@ -0,0 +1,232 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+"""
+Subscriber alert profiles.
+
+A profile overrides the buy threshold, top-N, indicator weights and adds sector
+or price filters. The scan evaluates every indicator any profile weights once
+per stock and keeps the 0/1 signals, so the technical scores of all profiles
+are one vectorized pass over the whole scored universe.
+"""
+
+# Import Dependencies
+from typing import Any, Dict, List
+import numpy as np
+import pandas as pd
+from .exceptions import ConfigError
+from .indicator_registry import technical_score
+
+DEFAULT_PROFILE = "default"
+PROFILE_KEYS = [
+    "buy_threshold",
+    "top_n",
+    "weights",
+    "sectors",
+    "min_price",
+    "max_price",
+]
+
+
+def resolve_profiles(cfg: dict) -> Dict[str, Dict[str, Any]]:
+    """
+    Returns every profile with the global settings filled in.
+
+    Args:
+        cfg (dict): Configuration dictionary with an optional `profiles` section.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Profile name -> settings; "default" is the global setup.
+    """
+    base = {
+        "buy_threshold": cfg["thresholds"]["buy_threshold"],
+        "top_n": cfg["scoring"]["top_n_watch"],
+        "weights": cfg["scoring"]["weights"],
+        "sectors": None,
+        "min_price": None,
+        "max_price": None,
+    }
+    profiles = {DEFAULT_PROFILE: base}
+    for name, overrides in cfg.get("profiles", {}).items():
+        unknown = set(overrides) - set(PROFILE_KEYS)
+        if unknown:
+            raise ConfigError(
+                f"Profile '{name}' has unknown setting(s): {', '.join(sorted(unknown))}"
+            )
+        profiles[name] = {**base, **overrides}
+    for name, profile in profiles.items():
+        if not sum(profile["weights"].values()) > 0:
+            raise ConfigError(
+                f"Profile '{name}' needs weights adding up to more than 0."
+            )
+    return profiles
+
+
+def signal_config(cfg: dict) -> dict:
+    """
+    Returns a config whose scoring plan evaluates every indicator weighted by any profile.
+
+    Args:
+        cfg (dict): Configuration dictionary.
+
+    Returns:
+        dict: The config with the union of all profile weights.
+    """
+    weights = dict(cfg["scoring"]["weights"])
+    for profile in cfg.get("profiles", {}).values():
+        for name, weight in profile.get("weights", {}).items():
+            if weight and not weights.get(name):
+                weights[name] = weight
+    return {**cfg, "scoring": {**cfg["scoring"], "weights": weights}}
+
+
+def profile_tech_scores(
+    rows: List[dict], profiles: Dict[str, Dict[str, Any]]
+) -> pd.DataFrame:
+    """
+    Re-weights the stored signals of all stocks for all profiles in one vectorized pass.
+
+    Args:
+        rows (List[dict]): Rows or results carrying `signals` and `tech_score`.
+        profiles (Dict[str, Dict[str, Any]]): Profiles from `resolve_profiles`.
+
+    Returns:
+        pd.DataFrame: One row per stock and one column per profile.
+    """
+    weights = pd.DataFrame(
+        {name: profile["weights"] for name, profile in profiles.items()}
+    ).fillna(0)
+    signals = pd.DataFrame(
+        [row.get("signals") or {} for row in rows], columns=weights.index
+    ).fillna(0)
+    # Signal columns (stocks x 1) broadcast against weight rows (1 x profiles)
+    scores = technical_score(
+        {name: signals[name].to_numpy()[:, None] for name in weights.index},
+        {name: weights.loc[name].to_numpy() for name in weights.index},
+    )
+    scores = pd.DataFrame(scores, columns=weights.columns)
+
+    # Rows checkpointed before signals were stored keep their original score
+    missing = np.array([not row.get("signals") for row in rows], dtype=bool)
+    if missing.any():
+        tech = np.array([row["tech_score"] for row in rows], dtype=float)
+        scores.loc[missing] = np.repeat(tech[missing, None], len(profiles), axis=1)
+    return scores
+
+
+def eligibility(
+    rows: List[dict], profiles: Dict[str, Dict[str, Any]], known_sectors: bool = True
+) -> pd.DataFrame:
+    """
+    Applies each profile's price and sector filters.
+
+    Args:
+        rows (List[dict]): Rows or results with `last_close` (and `sector` once known).
+        profiles (Dict[str, Dict[str, Any]]): Profiles from `resolve_profiles`.
+        known_sectors (bool): False before fundamentals (and sectors) are fetched.
+
+    Returns:
+        pd.DataFrame: Booleans, one row per stock and one column per profile.
+    """
+    prices = pd.to_numeric(
+        pd.Series([row.get("last_close") for row in rows]), errors="coerce"
+    )
+    sectors = pd.Series([row.get("sector") for row in rows], dtype=object)
+    columns = {}
+    for name, profile in profiles.items():
+        mask = pd.Series(True, index=prices.index)
+        if profile["min_price"] is not None:
+            mask &= prices >= profile["min_price"]
+        if profile["max_price"] is not None:
+            mask &= prices <= profile["max_price"]
+        if profile["sectors"] and known_sectors:
+            mask &= sectors.isin(profile["sectors"])
+        columns[name] = mask
+    return pd.DataFrame(columns)
+
+
+def rescore_for_profiles(
+    results: List[dict], profiles: Dict[str, Dict[str, Any]]
+) -> Dict[str, List[dict]]:
+    """
+    Scores the results for every profile; stocks a profile filters out get no final score.
+
+    Args:
+        results (List[dict]): Results of `finalize_scores`.
+        profiles (Dict[str, Dict[str, Any]]): Profiles from `resolve_profiles`.
+
+    Returns:
+        Dict[str, List[dict]]: Profile name -> results with the profile's scores.
+    """
+    if not results:
+        return {name: [] for name in profiles}
+    tech = profile_tech_scores(results, profiles)
+    eligible = eligibility(results, profiles)
+    rescored = {}
+    for name in profiles:
+        rescored[name] = [
+            {
+                **result,
+                "tech_score": tech_score,
+                "final_score": (
+                    (tech_score + result["fund_score"]) / 2
+                    if ok and result["fund_score"] is not None
+                    else None
+                ),
+            }
+            for result, tech_score, ok in zip(results, tech[name], eligible[name])
+        ]
+    return rescored
+
+
+def profile_config(cfg: dict, profile: Dict[str, Any]) -> dict:
+    """
+    Returns the config a profile's alert is composed with.
+
+    Args:
+        cfg (dict): Configuration dictionary.
+        profile (Dict[str, Any]): One resolved profile.
+
+    Returns:
+        dict: The config with the profile's threshold, top-N and weights.
+    """
+    return {
+        **cfg,
+        "thresholds": {**cfg["thresholds"], "buy_threshold": profile["buy_threshold"]},
+        "scoring": {
+            **cfg["scoring"],
+            "top_n_watch": profile["top_n"],
+            "weights": profile["weights"],
+        },
+    }
+
+
+def subscribers(
+    creds: dict, profiles: Dict[str, Dict[str, Any]]
+) -> Dict[str, List[str]]:
+    """
+    Groups the Telegram chats by profile. Chats listed in `telegram.chat_ids` without
+    an entry in `telegram.subscribers` get the default profile.
+
+    Args:
+        creds (dict): Credentials dictionary.
+        profiles (Dict[str, Dict[str, Any]]): Profiles from `resolve_profiles`.
+
+    Returns:
+        Dict[str, List[str]]: Profile name -> chat IDs (profiles without chats are omitted).
+    """
+    telegram = creds.get("telegram", {})
+    assigned = {
+        str(chat): name for chat, name in telegram.get("subscribers", {}).items()
+    }
+    audiences: Dict[str, List[str]] = {}
+    chats = [str(chat) for chat in telegram.get("chat_ids", [])] + list(assigned)
+    for chat_id in dict.fromkeys(chats):
+        name = assigned.get(chat_id, DEFAULT_PROFILE)
+        if name not in profiles:
+            raise ConfigError(f"Chat {chat_id} subscribes to unknown profile '{name}'.")
+        audiences.setdefault(name, []).append(chat_id)
+    return audiences
@@ -0,0 +1,279 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+"""
+Profiling of a scan across the main thread and every worker thread.
+
+A sampling thread snapshots the stacks of all threads every few milliseconds
+and tags each sample with the scan stage that was running. In `cprofile` mode
+every thread additionally runs under its own deterministic cProfile profiler
+and the profiles are merged per stage. Worker pools are created inside a
+stage, so each worker thread belongs to the stage that started it.
+
+From Python 3.12 cProfile is built on `sys.monitoring` and only one profiler
+can be active per process, but it sees every thread. There, one profiler per
+stage is enabled from the main thread instead.
+"""
+
+# Import Dependencies
+import io
+import os
+import sys
+import pstats
+import cProfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Tuple
+from .logger import log_info, log_success
+
+PROFILE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../data/profiles")
+)
+PROFILE_MODES = ["sample", "cprofile"]
+# One cProfile profiler covers all threads, and a second one cannot be enabled
+PROCESS_WIDE_CPROFILE = sys.version_info >= (3, 12)
+
+# Leaf frames of threads that are blocked waiting for work, not spending time
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("deadline.py", "map_until_deadline"),
+}
+
+
+def _frame_label(code) -> str:
+    return (
+        f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    )
+
+
+class _Snapshot:
+    # Lets pstats read a profile of another thread without disabling this thread's
+    def __init__(self, profile: cProfile.Profile):
+        profile.snapshot_stats()
+        self.stats = profile.stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class ScanProfiler:
+    """
+    Profiles a scan by stage; a profiler without a mode does nothing.
+    """
+
+    def __init__(
+        self,
+        mode: str = None,
+        output_dir: str = PROFILE_DIR,
+        interval: float = 0.005,
+        top_n: int = 20,
+    ):
+        self.mode = mode
+        self.output_dir = output_dir
+        self.interval = interval
+        self.top_n = top_n
+        self.current_stage = "setup"
+        self.samples: Counter = Counter()  # (stage, collapsed stack) -> samples
+        self.idle_samples = 0
+        self.profiles: Dict[str, List[cProfile.Profile]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = None
+
+    # -----------------------------
+    # Lifecycle
+    # -----------------------------
+    def start(self) -> None:
+        """
+        Starts sampling and, in cprofile mode, profiling of new threads.
+
+        Returns:
+            None
+        """
+        if not self.mode:
+            return
+        if self.mode == "cprofile":
+            if not PROCESS_WIDE_CPROFILE:
+                threading.setprofile(self._profile_new_thread)
+            self._enable_main()
+        self._sampler = threading.Thread(
+            target=self._sample, name="profiler-sampler", daemon=True
+        )
+        self._sampler.start()
+        log_info(f"🔬 Profiling the scan ({self.mode}).")
+
+    def stop(self) -> str:
+        """
+        Stops profiling and writes the report and the collapsed stacks.
+
+        Returns:
+            str: The directory holding the profile output (None when inactive).
+        """
+        if not self.mode:
+            return None
+        self._stop.set()
+        self._sampler.join()
+        if self.mode == "cprofile":
+            if not PROCESS_WIDE_CPROFILE:
+                threading.setprofile(None)
+            self._main_profile.disable()
+
+        directory = os.path.join(
+            self.output_dir, datetime.now().strftime("%Y%m%d-%H%M%S")
+        )
+        os.makedirs(directory, exist_ok=True)
+        self._write_collapsed(os.path.join(directory, "stacks.collapsed"))
+        report = self._report()
+        if self.mode == "cprofile":
+            report += self._cprofile_report(directory)
+        with open(os.path.join(directory, "report.txt"), "w") as file:
+            file.write(report)
+        log_success(f"🔬 Profile written to {directory}")
+        return directory
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Attributes everything profiled inside the block to a named stage.
+
+        Args:
+            name (str): The stage name, e.g. "technicals".
+        """
+        if not self.mode:
+            yield
+            return
+        previous = self.current_stage
+        self._switch(name)
+        try:
+            yield
+        finally:
+            self._switch(previous)
+
+    def _switch(self, name: str) -> None:
+        if self.mode == "cprofile":
+            self._main_profile.disable()
+        self.current_stage = name
+        if self.mode == "cprofile":
+            self._enable_main()
+
+    # -----------------------------
+    # Deterministic Profiling
+    # -----------------------------
+    def _register(self, profile: cProfile.Profile) -> None:
+        with self._lock:
+            self.profiles.setdefault(self.current_stage, []).append(profile)
+
+    def _enable_main(self) -> None:
+        # On Python 3.12+ this profiler also records the worker threads
+        self._main_profile = cProfile.Profile()
+        self._register(self._main_profile)
+        self._main_profile.enable()
+
+    def _profile_new_thread(self, frame, event, arg) -> None:
+        # Called once on a new thread's first event: swap in a cProfile profiler
+        sys.setprofile(None)
+        if threading.current_thread() is self._sampler:
+            return
+        profile = cProfile.Profile()
+        self._register(profile)
+        profile.enable()
+
+    def _cprofile_report(self, directory: str) -> str:
+        report = ""
+        for stage, profiles in self.profiles.items():
+            stats = pstats.Stats(*[_Snapshot(profile) for profile in profiles])
+            stats.dump_stats(os.path.join(directory, f"{stage}.pstats"))
+            stream = io.StringIO()
+            stats.stream = stream
+            stats.sort_stats("tottime").print_stats(self.top_n)
+            report += f"\n=== cProfile: {stage} ===\n{stream.getvalue()}"
+        return report
+
+    # -----------------------------
+    # Sampling
+    # -----------------------------
+    def _sample(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            stage = self.current_stage
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                code = frame.f_code
+                if (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                    self.idle_samples += 1
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                self.samples[(stage, ";".join(reversed(stack)))] += 1
+
+    def _write_collapsed(self, path: str) -> None:
+        # One "stage;outer;...;leaf count" line per stack, as read by flamegraph.pl
+        with open(path, "w") as file:
+            for (stage, stack), count in sorted(self.samples.items()):
+                file.write(f"{stage};{stack} {count}\n")
+
+    def hottest(self, stage: str = None) -> List[Tuple[str, int, int]]:
+        """
+        Ranks functions by samples spent in their own code.
+
+        Args:
+            stage (str): Only count samples of this stage (all stages if None).
+
+        Returns:
+            List[Tuple[str, int, int]]: (function, self samples, total samples), hottest first.
+        """
+        own, total = Counter(), Counter()
+        for (sample_stage, stack), count in self.samples.items():
+            if stage is not None and sample_stage != stage:
+                continue
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for function in set(frames):
+                total[function] += count
+        return sorted(
+            ((f, own[f], total[f]) for f in total), key=lambda r: (-r[1], -r[2])
+        )
+
+    def _table(self, title: str, rows: List[Tuple[str, int, int]], samples: int) -> str:
+        lines = [
+            f"\n=== {title}: {samples} sample(s), ~{samples * self.interval:.2f}s ===",
+            f"{'self %':>7} {'total %':>8} {'self s':>8}  function",
+        ]
+        for function, own, total in rows:
+            lines.append(
+                f"{own / samples:>7.1%} {total / samples:>8.1%} "
+                f"{own * self.interval:>8.3f}  {function}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def _report(self) -> str:
+        stages = Counter()
+        for (stage, _), count in self.samples.items():
+            stages[stage] += count
+        busy = sum(stages.values())
+        if not busy:
+            return "No busy samples were taken.\n"
+
+        report = (
+            f"Sampling profile every {self.interval * 1000:.0f} ms across all threads "
+            f"({self.idle_samples} idle sample(s) excluded).\n"
+        )
+        report += self._table("All functions", self.hottest(), busy)
+        for stage, samples in stages.most_common():
+            top = self.hottest(stage)[: self.top_n]
+            report += self._table(f"Stage {stage}", top, samples)
+            log_info(
+                f"🔥 {stage}: {samples / busy:.0%} of samples, hottest "
+                + ", ".join(f"{function} ({own})" for function, own, _ in top[:3])
+            )
+        return report
@@ -0,0 +1,192 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+# Import Dependencies
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Optional, Set
+from zoneinfo import ZoneInfo
+from .exceptions import ConfigError
+
+# Cron fields: minute, hour, day of month, month, day of week (0 and 7 = Sunday)
+CRON_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+MARKET_TIMEZONE = "Asia/Kolkata"
+MARKET_OPEN = "09:15"
+MARKET_CLOSE = "15:30"
+
+
+def _parse_cron_field(field: str, low: int, high: int) -> Set[int]:
+    values = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            step = int(step_str)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start, end = (int(v) for v in part.split("-", 1))
+        else:
+            start = end = int(part)
+        if start < low or end > high or start > end or step < 1:
+            raise ConfigError(f"Cron field '{field}' is out of range {low}-{high}.")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def parse_cron(expression: str) -> List[Set[int]]:
+    """
+    Parses a five-field cron expression (`*`, `a-b`, `a,b` and `*/n` are supported).
+
+    Args:
+        expression (str): The cron expression, e.g. "0 10 * * 1-5".
+
+    Returns:
+        List[Set[int]]: The allowed values of each field.
+    """
+    fields = expression.split()
+    if len(fields) != 5:
+        raise ConfigError(f"Cron expression '{expression}' must have 5 fields.")
+    try:
+        parsed = [
+            _parse_cron_field(field, low, high)
+            for field, (low, high) in zip(fields, CRON_RANGES)
+        ]
+    except ValueError as e:
+        raise ConfigError(f"Invalid cron expression '{expression}': {e}")
+    # Cron allows 7 as an alias for Sunday, also inside ranges such as 5-7
+    if 7 in parsed[4]:
+        parsed[4] = (parsed[4] - {7}) | {0}
+    return parsed
+
+
+def cron_matches(cron: List[Set[int]], moment: datetime) -> bool:
+    """
+    Checks whether a moment (to the minute) matches a parsed cron expression.
+
+    As in standard cron, a day that matches either the day of month or the day of
+    week matches when both are restricted, so "0 10 1 * 1" runs on the 1st and on
+    every Monday. A field counts as restricted unless it allows every value.
+
+    Args:
+        cron (List[Set[int]]): The output of `parse_cron`.
+        moment (datetime): The moment to check.
+
+    Returns:
+        bool: True if every field matches.
+    """
+    minute, hour, day, month, weekday = cron
+    day_matches = moment.day in day
+    weekday_matches = (moment.isoweekday() % 7) in weekday
+    if len(day) < 31 and len(weekday) < 7:
+        day_ok = day_matches or weekday_matches
+    else:
+        day_ok = day_matches and weekday_matches
+    return (
+        moment.minute in minute
+        and moment.hour in hour
+        and moment.month in month
+        and day_ok
+    )
+
+
+def is_trading_day(day: date, holidays: Iterable[str] = ()) -> bool:
+    """
+    Checks whether the exchange is open on a given day.
+
+    Args:
+        day (date): The day to check.
+        holidays (Iterable[str]): Exchange holidays as ISO dates (YYYY-MM-DD).
+
+    Returns:
+        bool: True on weekdays that are not exchange holidays.
+    """
+    return day.weekday() < 5 and day.isoformat() not in set(holidays)
+
+
+def is_market_open(moment: datetime, daemon_cfg: dict) -> bool:
+    """
+    Checks whether a moment falls inside the exchange's trading session.
+
+    Args:
+        moment (datetime): A timezone-aware moment in the market timezone.
+        daemon_cfg (dict): The `daemon` configuration section.
+
+    Returns:
+        bool: True during trading hours of a trading day.
+    """
+    if not is_trading_day(moment.date(), daemon_cfg.get("holidays", [])):
+        return False
+    market_open = time.fromisoformat(daemon_cfg.get("market_open", MARKET_OPEN))
+    market_close = time.fromisoformat(daemon_cfg.get("market_close", MARKET_CLOSE))
+    return market_open <= moment.time() <= market_close
+
+
+def session_opens_later(moment: datetime, daemon_cfg: dict) -> Optional[datetime]:
+    """
+    Returns today's session open if the market has not opened yet on a trading day.
+
+    Args:
+        moment (datetime): A timezone-aware moment in the market timezone.
+        daemon_cfg (dict): The `daemon` configuration section.
+
+    Returns:
+        Optional[datetime]: The session open, or None once it has passed or on a closed day.
+    """
+    if not is_trading_day(moment.date(), daemon_cfg.get("holidays", [])):
+        return None
+    market_open = datetime.combine(
+        moment.date(),
+        time.fromisoformat(daemon_cfg.get("market_open", MARKET_OPEN)),
+        moment.tzinfo,
+    )
+    return market_open if moment < market_open else None
+
+
+def next_run(
+    cron: List[Set[int]], after: datetime, daemon_cfg: dict
+) -> Optional[datetime]:
+    """
+    Finds the next scheduled scan after a moment, skipping non-trading days and,
+    unless disabled, moments outside trading hours.
+
+    Args:
+        cron (List[Set[int]]): The output of `parse_cron`.
+        after (datetime): A timezone-aware moment in the market timezone.
+        daemon_cfg (dict): The `daemon` configuration section.
+
+    Returns:
+        Optional[datetime]: The next run, or None if nothing matches within 31 days.
+    """
+    holidays = daemon_cfg.get("holidays", [])
+    hours_only = daemon_cfg.get("market_hours_only", True)
+    candidate = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    limit = candidate + timedelta(days=31)
+    while candidate < limit:
+        if not is_trading_day(candidate.date(), holidays):
+            # Jump straight to the next day
+            candidate = datetime.combine(
+                candidate.date() + timedelta(days=1), time(0, 0), candidate.tzinfo
+            )
+            continue
+        if cron_matches(cron, candidate) and (
+            not hours_only or is_market_open(candidate, daemon_cfg)
+        ):
+            return candidate
+        candidate += timedelta(minutes=1)
+    return None
+
+
+def market_now(daemon_cfg: dict) -> datetime:
+    """
+    Returns the current time in the market timezone.
+
+    Args:
+        daemon_cfg (dict): The `daemon` configuration section.
+
+    Returns:
+        datetime: The timezone-aware current time.
+    """
+    return datetime.now(ZoneInfo(daemon_cfg.get("timezone", MARKET_TIMEZONE)))
@@ -4,12 +4,21 @@ __maintainer__ = "Adnan Karol"
 __email__ = "adnanmushtaq5@gmail.com"
 __status__ = "DEV"
 
-import yfinance as yf
 import numpy as np
 import pandas as pd
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from src.utils.logger import log_info, log_warn, log_error
-from utils.indicators import sma, rsi, clamp
+from utils.indicator_registry import (
+    compile_plan,
+    evaluate_plan,
+    technical_score,
+    history_window,
+)
+from utils.cache import ScanCache
+from utils.market_data import fetch_history
+from utils.http_session import get_session
+from utils.config import yahoo_symbol_for
+from utils.profiles import signal_config
 from yfinance import Ticker  # Import the Ticker class
 
 
@@ -67,63 +76,108 @@ def compute_macd(data: pd.DataFrame, cfg: dict) -> float:
 # -----------------------------
 # Fundamental Score
 # -----------------------------
-def compute_fundamentals(ticker: str) -> float:
+# Thresholds and missing-value defaults, overridable via cfg["fundamentals"]
+FUNDAMENTAL_DEFAULTS = {
+    "pe_good_below": 25,
+    "pe_bad_above": 60,
+    "roe_max": 0.3,
+    "debt_to_equity_max": 2,
+    "default_pe": 50,
+    "default_roe": 0.15,
+    "default_debt_to_equity": 0.5,
+}
+FUNDAMENTAL_COLUMNS = [
+    "pe",
+    "roe",
+    "debt_to_equity",
+    "revenue_latest",
+    "revenue_previous",
+    "net_income_latest",
+    "net_income_previous",
+]
+FUND_SCORE_MAX = 100
+REVENUE_KEYS = ["Total Revenue", "Revenue", "TotalRevenue"]
+NET_INCOME_KEYS = ["Net Income", "NetIncome"]
+
+
+def _latest_two(q_fin: pd.DataFrame, keys: list) -> tuple:
+    row = next((q_fin.loc[k] for k in keys if k in q_fin.index), None)
+    if row is None or len(row) < 2:
+        return np.nan, np.nan
+    return row.iloc[0], row.iloc[1]
+
+
+def fetch_fundamentals(ticker: Ticker) -> Dict[str, Any]:
     """
-    Computes the fundamental score for a stock.
+    Fetches the raw fundamentals needed for scoring a stock.
 
     Args:
-        ticker (str): Stock ticker symbol.
+        ticker (Ticker): The Ticker object for the stock.
 
     Returns:
-        float: The fundamental score.
+        Dict[str, Any]: Raw metrics, NaN where Yahoo has no value.
     """
-    try:
-        t = yf.Ticker(ticker)
-        info = t.info or {}
-        pe = info.get("trailingPE", 50)
-        roe = info.get("returnOnEquity", 0.15)
-        debt_eq = info.get("debtToEquity", 0.5)
-
-        # Normalize metrics 0–1
-        pe_score = 1 if pe < 25 else (0 if pe > 60 else 0.5)
-        roe_score = normalize_0_1(roe, 0, 0.3)
-        debt_score = 1 - normalize_0_1(debt_eq, 0, 2)
-
-        # Revenue/Net income growth (latest two quarters)
-        q_fin = t.quarterly_financials
-        rev_score = net_score = 0
-        if q_fin is not None and not q_fin.empty:
-            rev_series = next(
-                (
-                    q_fin.loc[k]
-                    for k in ["Total Revenue", "Revenue", "TotalRevenue"]
-                    if k in q_fin.index
-                ),
-                None,
-            )
-            net_series = next(
-                (q_fin.loc[k] for k in ["Net Income", "NetIncome"] if k in q_fin.index),
-                None,
-            )
-            if rev_series is not None and len(rev_series) >= 2:
-                rev_score = np.tanh(
-                    (rev_series.iloc[0] - rev_series.iloc[1]) / abs(rev_series.iloc[1])
-                )
-            if net_series is not None and len(net_series) >= 2:
-                net_score = np.tanh(
-                    (net_series.iloc[0] - net_series.iloc[1]) / abs(net_series.iloc[1])
-                )
-
-        fund_score = np.mean([pe_score, roe_score, debt_score, rev_score, net_score])
-        return clamp(fund_score)
-    except Exception as e:
-        log_warn(f"Fundamental calculation failed for {ticker}: {e}")
-        return 0
+    info = ticker.info or {}
+    row = dict.fromkeys(FUNDAMENTAL_COLUMNS, np.nan)
+    row["pe"] = info.get("trailingPE", np.nan)
+    row["roe"] = info.get("returnOnEquity", np.nan)
+    row["debt_to_equity"] = info.get("debtToEquity", np.nan)
+    row["sector"] = info.get("sector")  # Used by profile filters, not scored
+
+    # Revenue/Net income of the latest two quarters
+    q_fin = ticker.quarterly_financials
+    if q_fin is not None and not q_fin.empty:
+        row["revenue_latest"], row["revenue_previous"] = _latest_two(
+            q_fin, REVENUE_KEYS
+        )
+        row["net_income_latest"], row["net_income_previous"] = _latest_two(
+            q_fin, NET_INCOME_KEYS
+        )
+    return row
+
+
+def score_fundamentals(fundamentals: pd.DataFrame, cfg: dict) -> pd.DataFrame:
+    """
+    Scores the fundamentals of many stocks at once.
+
+    Args:
+        fundamentals (pd.DataFrame): One row per stock with the columns of `fetch_fundamentals`.
+        cfg (dict): Configuration dictionary.
+
+    Returns:
+        pd.DataFrame: The component scores and `fund_score` (0–100) per stock.
+    """
+    params = {**FUNDAMENTAL_DEFAULTS, **cfg.get("fundamentals", {})}
+    numeric = fundamentals.apply(pd.to_numeric, errors="coerce")
+    pe = numeric["pe"].fillna(params["default_pe"])
+    roe = numeric["roe"].fillna(params["default_roe"])
+    debt_eq = numeric["debt_to_equity"].fillna(params["default_debt_to_equity"])
+
+    # Normalize metrics 0–1
+    scores = pd.DataFrame(index=fundamentals.index)
+    scores["pe_score"] = np.select(
+        [pe < params["pe_good_below"], pe > params["pe_bad_above"]], [1.0, 0.0], 0.5
+    )
+    scores["roe_score"] = (roe / params["roe_max"]).clip(0, 1)
+    scores["debt_score"] = 1 - (debt_eq / params["debt_to_equity_max"]).clip(0, 1)
+
+    # Quarter-over-quarter growth squashed to -1..1, 0 when unavailable
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for name, latest, previous in [
+            ("rev_score", "revenue_latest", "revenue_previous"),
+            ("net_score", "net_income_latest", "net_income_previous"),
+        ]:
+            growth = (numeric[latest] - numeric[previous]) / numeric[previous].abs()
+            scores[name] = np.tanh(growth).fillna(0)
+
+    # Combine scores into a final fundamental score
+    scores["fund_score"] = (scores.mean(axis=1).clip(0, 1) * 100).round(2)
+    return scores
 
 
 def compute_fundamental_score(ticker: Ticker, cfg: dict) -> float:
     """
-    Computes the fundamental score for a stock.
+    Computes the fundamental score for a single stock.
 
     Args:
         ticker (Ticker): The Ticker object for the stock.
@@ -133,44 +187,8 @@ def compute_fundamental_score(ticker: Ticker, cfg: dict) -> float:
         float: The fundamental score (0–100).
     """
     try:
-        info = ticker.info or {}
-        pe = info.get("trailingPE", 50)
-        roe = info.get("returnOnEquity", 0.15)
-        debt_eq = info.get("debtToEquity", 0.5)
-
-        # Normalize metrics 0–1
-        pe_score = 1 if pe < 25 else (0 if pe > 60 else 0.5)
-        roe_score = normalize_0_1(roe, 0, 0.3)
-        debt_score = 1 - normalize_0_1(debt_eq, 0, 2)
-
-        # Revenue/Net income growth (latest two quarters)
-        q_fin = ticker.quarterly_financials
-        rev_score = net_score = 0
-        if q_fin is not None and not q_fin.empty:
-            rev_series = next(
-                (
-                    q_fin.loc[k]
-                    for k in ["Total Revenue", "Revenue", "TotalRevenue"]
-                    if k in q_fin.index
-                ),
-                None,
-            )
-            net_series = next(
-                (q_fin.loc[k] for k in ["Net Income", "NetIncome"] if k in q_fin.index),
-                None,
-            )
-            if rev_series is not None and len(rev_series) >= 2:
-                rev_score = np.tanh(
-                    (rev_series.iloc[0] - rev_series.iloc[1]) / abs(rev_series.iloc[1])
-                )
-            if net_series is not None and len(net_series) >= 2:
-                net_score = np.tanh(
-                    (net_series.iloc[0] - net_series.iloc[1]) / abs(net_series.iloc[1])
-                )
-
-        # Combine scores into a final fundamental score
-        fund_score = np.mean([pe_score, roe_score, debt_score, rev_score, net_score])
-        return round(clamp(fund_score) * 100, 2)  # Scale to 0–100
+        fundamentals = pd.DataFrame([fetch_fundamentals(ticker)])
+        return float(score_fundamentals(fundamentals, cfg)["fund_score"].iloc[0])
     except Exception as e:
         log_warn(f"⚠️ Fundamental calculation failed for {ticker.ticker}: {e}")
         return 0
@@ -191,28 +209,9 @@ def compute_technical_score(data: pd.DataFrame, cfg: dict) -> float:
         float: The technical score (0–100).
     """
     try:
-        # Compute SMA signal
-        sma_period = cfg["scoring"].get("sma_period", 20)
-        sma_signal = sma(data["Close"], sma_period)
-        sma_score = 1 if data["Close"].iloc[-1] > sma_signal.iloc[-1] else 0
-
-        # Compute RSI signal
-        rsi_period = cfg["scoring"].get("rsi_period", 14)
-        rsi_signal = rsi(data["Close"], rsi_period)
-        rsi_score = 1 if 30 < rsi_signal.iloc[-1] < 70 else 0
-
-        # Compute MACD signal
-        macd_score = compute_macd(data, cfg)
-
-        # Combine scores using weights
-        weights = cfg["scoring"]["weights"]
-        tech_score = (
-            weights["momentum"] * sma_score
-            + weights["rsi"] * rsi_score
-            + weights["macd"] * macd_score
-        ) / sum(weights.values())
-
-        return round(tech_score * 100, 2)  # Scale to 0–100
+        # Only indicators with a non-zero weight are evaluated, sharing intermediates
+        signals = evaluate_plan(compile_plan(cfg), data)
+        return technical_score(signals, cfg["scoring"]["weights"])
     except Exception as e:
         log_warn(f"⚠️ Technical calculation failed: {e}")
         return 0
@@ -221,31 +220,54 @@ def compute_technical_score(data: pd.DataFrame, cfg: dict) -> float:
 # -----------------------------
 # Main Scoring Function
 # -----------------------------
-def compute_scores_for_ticker(symbol: str, cfg: dict) -> dict:
+def fundamentals_cutoff(buy_threshold):
     """
-    Computes technical and fundamental scores for a given stock symbol.
+    Returns the lowest technical score that can still reach a buy threshold.
 
     Args:
-        symbol (str): The stock symbol to compute scores for.
+        buy_threshold: The threshold, or an array of thresholds (one per profile).
+
+    Returns:
+        Stocks below this technical score cannot qualify, whatever their fundamentals.
+    """
+    # final = (tech + fund) / 2 with fund <= FUND_SCORE_MAX
+    return 2 * buy_threshold - FUND_SCORE_MAX
+
+
+def collect_technicals(
+    symbol: str,
+    cfg: dict,
+    cache: ScanCache = None,
+    fresh_since: float = None,
+    yahoo_symbol: str = None,
+) -> dict:
+    """
+    Fetches a stock's price history and scores its technicals.
+
+    Args:
+        symbol (str): The stock symbol to collect data for.
         cfg (dict): Configuration dictionary.
+        cache (ScanCache): Optional cache of prices and fundamentals kept between scans.
+        fresh_since (float): Epoch time after which a cached history is reused as is.
+        yahoo_symbol (str): The Yahoo Finance ticker (default: symbol + `universe.suffix`).
 
     Returns:
-        dict: A dictionary containing the computed scores, last close, and average price.
+        dict: Technical score, last close and average price, with fundamentals pending.
     """
+    yahoo_symbol = yahoo_symbol or yahoo_symbol_for(symbol, cfg)
     try:
         # Fetch data for the symbol
-        ticker = Ticker(f"{symbol}.NS")
-        data = ticker.history(period="6mo")
+        # Signals of every indicator any profile weights, for re-weighting per profile,
+        # so the history has to cover the warm-up of all of them
+        scan_cfg = signal_config(cfg)
+        ticker = Ticker(yahoo_symbol, session=get_session(cfg))
+        data = fetch_history(ticker, cache, fresh_since, history_window(scan_cfg))
 
         if data is None or data.empty:
             raise ValueError(f"No data available for {symbol}")
 
-        # Compute technical and fundamental scores
-        tech_score = compute_technical_score(data, cfg)
-        fund_score = compute_fundamental_score(ticker, cfg)
-
-        if tech_score is None or fund_score is None:
-            raise ValueError(f"Failed to compute scores for {symbol}")
+        signals = evaluate_plan(compile_plan(scan_cfg), data)
+        tech_score = technical_score(signals, cfg["scoring"]["weights"])
 
         # Calculate last close price
         last_close = data["Close"].iloc[-1] if "Close" in data.columns else None
@@ -258,16 +280,151 @@ def compute_scores_for_ticker(symbol: str, cfg: dict) -> dict:
             else None
         )
 
-        # Combine scores into a final score
-        final_score = (tech_score + fund_score) / 2
+        # Change over the last session, answered by the bot's /movers command
+        change_pct = (
+            (data["Close"].iloc[-1] / data["Close"].iloc[-2] - 1) * 100
+            if len(data["Close"]) >= 2
+            else None
+        )
+
+        # Average traded volume, used to prioritise liquid names under a deadline
+        avg_volume = (
+            data["Volume"].iloc[-avg_price_duration:].mean()
+            if "Volume" in data.columns
+            else None
+        )
+
         return {
             "symbol": symbol,
+            "yahoo_symbol": yahoo_symbol,
             "tech_score": tech_score,
-            "fund_score": fund_score,
-            "final_score": final_score,
             "last_close": round(last_close, 2) if last_close else "N/A",
             "avg_price": round(avg_price, 2) if avg_price else "N/A",
+            "avg_volume": float(avg_volume) if pd.notna(avg_volume) else None,
+            "change_pct": round(change_pct, 2) if pd.notna(change_pct) else None,
+            "signals": signals,
+            "fundamentals": None,
+            "fund_status": "pending",
         }
     except Exception as e:
-        log_warn(f"⚠️ Fundamental calculation failed for {symbol}: {e}")
+        log_warn(f"⚠️ Technical calculation failed for {symbol}: {e}")
         return None
+
+
+def collect_fundamentals(row: dict, cfg: dict, cache: ScanCache = None) -> dict:
+    """
+    Fetches the raw fundamentals of a stock collected by `collect_technicals`.
+
+    Args:
+        row (dict): The stock's row; left unchanged, since a fetch cut off by a
+            deadline may still finish while the scan reads the rows.
+        cfg (dict): Configuration dictionary.
+        cache (ScanCache): Optional cache of prices and fundamentals kept between scans.
+
+    Returns:
+        dict: A copy of the row with `fundamentals` and `fund_status` ("ok" or
+            "failed") set.
+    """
+    symbol = row["symbol"]
+    try:
+        yahoo_symbol = row.get("yahoo_symbol") or yahoo_symbol_for(symbol, cfg)
+        ticker = Ticker(yahoo_symbol, session=get_session(cfg))
+        fundamentals = cache.get_fundamentals(ticker.ticker) if cache else None
+        if fundamentals is None:
+            fundamentals = fetch_fundamentals(ticker)
+            if cache is not None:
+                cache.set_fundamentals(ticker.ticker, fundamentals)
+        return {**row, "fundamentals": fundamentals, "fund_status": "ok"}
+    except Exception as e:
+        log_warn(f"⚠️ Fundamental calculation failed for {symbol}: {e}")
+        return {**row, "fundamentals": None, "fund_status": "failed"}
+
+
+def collect_ticker_data(
+    symbol: str,
+    cfg: dict,
+    cache: ScanCache = None,
+    fresh_since: float = None,
+    yahoo_symbol: str = None,
+) -> dict:
+    """
+    Fetches a stock's data, scores its technicals and collects its raw fundamentals.
+
+    Args:
+        symbol (str): The stock symbol to collect data for.
+        cfg (dict): Configuration dictionary.
+        cache (ScanCache): Optional cache of prices and fundamentals kept between scans.
+        fresh_since (float): Epoch time after which a cached history is reused as is.
+        yahoo_symbol (str): The Yahoo Finance ticker (default: symbol + `universe.suffix`).
+
+    Returns:
+        dict: Technical score, last close, average price and raw fundamentals.
+    """
+    row = collect_technicals(symbol, cfg, cache, fresh_since, yahoo_symbol)
+    return collect_fundamentals(row, cfg, cache) if row else None
+
+
+def finalize_scores(rows: List[dict], cfg: dict) -> List[dict]:
+    """
+    Scores the fundamentals of all collected stocks in one pass and combines the scores.
+
+    Args:
+        rows (List[dict]): Rows returned by `collect_technicals`/`collect_fundamentals`.
+        cfg (dict): Configuration dictionary.
+
+    Returns:
+        List[dict]: One result per stock with technical, fundamental and final scores.
+            Stocks whose fundamentals were never fetched have no fund or final score.
+    """
+    if not rows:
+        return []
+
+    fundamentals = pd.DataFrame(
+        [row["fundamentals"] or {} for row in rows],
+        columns=FUNDAMENTAL_COLUMNS,
+    )
+    scored = score_fundamentals(fundamentals, cfg)["fund_score"].tolist()
+
+    results = []
+    for row, fund_score in zip(rows, scored):
+        status = row.get("fund_status", "ok")
+        if status == "failed":
+            fund_score = (
+                0.0  # Fundamentals that could not be fetched score 0, as before
+            )
+        elif status != "ok":
+            fund_score = None  # Never fetched: the stock could not qualify anyway
+        results.append(
+            {
+                "symbol": row["symbol"],
+                "tech_score": row["tech_score"],
+                "fund_score": fund_score,
+                # Combine scores into a final score
+                "final_score": (
+                    (row["tech_score"] + fund_score) / 2
+                    if fund_score is not None
+                    else None
+                ),
+                "last_close": row["last_close"],
+                "avg_price": row["avg_price"],
+                "change_pct": row.get("change_pct"),
+                "signals": row.get("signals"),
+                "sector": (row["fundamentals"] or {}).get("sector"),
+            }
+        )
+    return results
+
+
+def compute_scores_for_ticker(symbol: str, cfg: dict) -> dict:
+    """
+    Computes technical and fundamental scores for a given stock symbol.
+
+    Args:
+        symbol (str): The stock symbol to compute scores for.
+        cfg (dict): Configuration dictionary.
+
+    Returns:
+        dict: A dictionary containing the computed scores, last close, and average price.
+    """
+    row = collect_ticker_data(symbol, cfg)
+    return finalize_scores([row], cfg)[0] if row else None
@@ -0,0 +1,172 @@
+__author__ = "Adnan Karol"
+__version__ = "1.0.0"
+__maintainer__ = "Adnan Karol"
+__email__ = "adnanmushtaq5@gmail.com"
+__status__ = "DEV"
+
+# Import Dependencies
+import os
+import json
+import zlib
+import argparse
+from typing import Any, Dict, List, Optional, Tuple
+from .logger import log_info, log_success, log_warn
+
+SHARD_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../data/shards"))
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parses a `--shard i/N` argument (1-based, e.g. "2/4").
+
+    Args:
+        value (str): The argument value.
+
+    Returns:
+        Tuple[int, int]: The shard index (1..N) and the shard count N.
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Shard '{value}' must look like i/N, e.g. 1/4."
+        )
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"Shard '{value}' needs 1 <= i <= N.")
+    return index, count
+
+
+def shard_of(symbol: str, count: int) -> int:
+    """
+    Returns the 1-based shard of a symbol. CRC32 is stable across hosts and Python
+    runs, unlike the built-in `hash`, so every host derives the same partition.
+
+    Args:
+        symbol (str): The stock symbol.
+        count (int): The shard count.
+
+    Returns:
+        int: The shard index (1..count).
+    """
+    return zlib.crc32(symbol.encode("utf-8")) % count + 1
+
+
+def select_shard(symbols: List[str], index: int, count: int) -> List[str]:
+    """
+    Keeps the symbols that belong to one shard, preserving their order.
+
+    Args:
+        symbols (List[str]): The full universe.
+        index (int): The shard index (1..count).
+        count (int): The shard count.
+
+    Returns:
+        List[str]: The shard's symbols.
+    """
+    return [symbol for symbol in symbols if shard_of(symbol, count) == index]
+
+
+def shard_results_path(index: int, count: int, day, directory: str = SHARD_DIR) -> str:
+    """
+    Returns the partial-results file of a shard for a trading day.
+
+    Args:
+        index (int): The shard index.
+        count (int): The shard count.
+        day (date): The trading day.
+        directory (str): The output directory.
+
+    Returns:
+        str: The file path.
+    """
+    return os.path.join(directory, f"shard_{index}_of_{count}_{day.isoformat()}.json")
+
+
+def write_shard_results(
+    path: str,
+    index: int,
+    count: int,
+    day,
+    results: list,
+    skipped_symbols: list,
+    total: int = None,
+    partial: bool = False,
+) -> None:
+    """
+    Writes a shard's scored results for the merge step.
+
+    Args:
+        path (str): The output file.
+        index (int): The shard index.
+        count (int): The shard count.
+        day (date): The trading day.
+        results (list): The shard's scored results.
+        skipped_symbols (list): Symbols the shard could not score.
+        total (int): The number of symbols the shard owns.
+        partial (bool): Whether a deadline cut the shard's scan short.
+
+    Returns:
+        None
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = {
+        "shard": index,
+        "count": count,
+        "trading_day": day.isoformat(),
+        "results": results,
+        "skipped": skipped_symbols,
+        "total": total if total is not None else len(results),
+        "partial": partial,
+    }
+    # Write then rename so the merge never reads a half-written file
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(payload, file, default=float)
+    os.replace(tmp_path, path)
+    log_success(f"🧩 Shard {index}/{count}: {len(results)} result(s) written to {path}")
+
+
+def merge_shard_results(
+    paths: List[str],
+) -> Tuple[List[Dict[str, Any]], List[str], Optional[Dict[str, int]]]:
+    """
+    Combines shard outputs, warning about missing shards and mixed trading days.
+
+    Args:
+        paths (List[str]): Shard result files.
+
+    Returns:
+        Tuple: The combined results, the skipped symbols, and the partial-coverage
+            summary (None unless a shard was cut short by its deadline).
+    """
+    results, skipped = {}, []
+    total, partial = 0, False
+    seen, counts, days = set(), set(), set()
+    for path in paths:
+        with open(path, "r") as file:
+            payload = json.load(file)
+        seen.add(payload["shard"])
+        counts.add(payload["count"])
+        days.add(payload["trading_day"])
+        for result in payload["results"]:
+            results[result["symbol"]] = result  # A symbol belongs to one shard only
+        skipped.extend(payload["skipped"])
+        total += payload.get("total", len(payload["results"]))
+        partial = partial or payload.get("partial", False)
+
+    if len(counts) > 1:
+        log_warn(f"⚠️ Shard files disagree on the shard count: {sorted(counts)}")
+    if len(days) > 1:
+        log_warn(f"⚠️ Shard files span several trading days: {sorted(days)}")
+    if counts:
+        missing = sorted(set(range(1, max(counts) + 1)) - seen)
+        if missing:
+            log_warn(f"⚠️ Missing shard(s): {', '.join(map(str, missing))}")
+            partial = True
+
+    log_info(f"🧩 Merged {len(paths)} shard file(s) into {len(results)} result(s).")
+    coverage = None
+    if partial:
+        scored = sum(1 for r in results.values() if r["final_score"] is not None)
+        coverage = {"scored": scored, "total": total}
+    return list(results.values()), skipped, coverage
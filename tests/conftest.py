@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the Quantastic test suite.
+"""
+
+# Import Dependencies
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+# The modules import each other both as `utils.*` (from src/) and `src.utils.*`
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+for path in (ROOT_DIR, os.path.join(ROOT_DIR, "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: timing regression checks against a stored baseline"
+    )
+
+
+@pytest.fixture
+def cfg() -> dict:
+    # A fixed scoring setup so tuning configs/config.json does not move the references
+    return {
+        "scoring": {
+            "weights": {"momentum": 50, "rsi": 30, "volume": 15, "macd": 20},
+            "rsi_period": 14,
+            "sma_period": 20,
+            "macd_fast_period": 12,
+            "macd_slow_period": 26,
+            "macd_signal_period": 9,
+            "top_n_watch": 5,
+            "avg_price_duration": 30,
+        },
+        "thresholds": {"buy_threshold": 20},
+    }
+
+
+def random_walk(length: int = 130, seed: int = 7) -> pd.Series:
+    """
+    A reproducible positive price series, about six months of daily closes.
+
+    Args:
+        length (int): Number of bars.
+        seed (int): Random seed.
+
+    Returns:
+        pd.Series: The closes.
+    """
+    steps = np.random.default_rng(seed).normal(0, 1, length)
+    return pd.Series(100 + steps.cumsum(), name="Close")
@@ -0,0 +1,135 @@
+"""
+Timing regression checks for the indicator hot path.
+
+Every indicator is timed at 1, 100 and 10,000 series of six months of daily
+closes and compared against tests/benchmarks/baseline.json. A test fails when
+it runs more than QUANTASTIC_BENCHMARK_TOLERANCE (default 3) times slower than
+its baseline. The correlation-aware pick selection is timed at 10 and 300
+candidates the same way. Refresh the baseline on the reference machine with:
+
+    QUANTASTIC_UPDATE_BENCHMARKS=1 python -m pytest tests/test_benchmarks.py
+"""
+
+# Import Dependencies
+import os
+import json
+import timeit
+import numpy as np
+import pandas as pd
+import pytest
+from utils.indicators import sma, ema, rsi, clamp
+from utils.scoring import compute_macd, normalize_0_1
+from utils.indicator_registry import compile_plan, evaluate_plan
+from utils.diversification import select_diversified
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "benchmarks", "baseline.json")
+TOLERANCE = float(os.environ.get("QUANTASTIC_BENCHMARK_TOLERANCE", 3))
+UPDATE = os.environ.get("QUANTASTIC_UPDATE_BENCHMARKS") == "1"
+SIZES = [1, 100, 10_000]
+HISTORY = 130  # about six months of daily bars
+
+pytestmark = pytest.mark.benchmark
+
+
+def closes(count: int) -> pd.DataFrame:
+    steps = np.random.default_rng(count).normal(0, 1, (HISTORY, count))
+    return pd.DataFrame(100 + steps.cumsum(axis=0))
+
+
+def best_time(func) -> float:
+    # Like `python -m timeit`: enough loops for ~0.2s, best of three repeats
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=loops)) / loops
+
+
+def check_against_baseline(name: str, seconds: float) -> None:
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r") as file:
+            baseline = json.load(file)
+
+    if UPDATE:
+        baseline[name] = float(f"{seconds:.4g}")
+        with open(BASELINE_PATH, "w") as file:
+            json.dump(dict(sorted(baseline.items())), file, indent=2)
+            file.write("\n")
+        return
+    if name not in baseline:
+        pytest.skip(f"No baseline for {name}; run with QUANTASTIC_UPDATE_BENCHMARKS=1.")
+    assert seconds <= baseline[name] * TOLERANCE, (
+        f"{name} took {seconds * 1000:.3f} ms, more than {TOLERANCE}x its "
+        f"baseline of {baseline[name] * 1000:.3f} ms"
+    )
+
+
+# -----------------------------
+# Vectorized Indicators
+# -----------------------------
+@pytest.mark.parametrize("count", SIZES)
+@pytest.mark.parametrize(
+    "name, indicator",
+    [
+        ("sma", lambda data: sma(data, 20)),
+        ("ema", lambda data: ema(data, 12)),
+        ("rsi", lambda data: rsi(data, 14)),
+    ],
+)
+def test_indicator_speed(name, indicator, count):
+    data = closes(count)
+    check_against_baseline(f"{name}[{count}]", best_time(lambda: indicator(data)))
+
+
+@pytest.mark.parametrize("count", SIZES)
+def test_macd_panel_speed(count):
+    # The scan scores MACD through the registry, which handles whole panels at once
+    plan = compile_plan({"scoring": {"weights": {"macd": 1}}})
+    data = pd.concat({"Close": closes(count)}, axis=1)
+    check_against_baseline(
+        f"macd_panel[{count}]", best_time(lambda: evaluate_plan(plan, data))
+    )
+
+
+# -----------------------------
+# Per-Series Helpers
+# -----------------------------
+@pytest.mark.parametrize("count", [1, 100])
+def test_compute_macd_speed(count):
+    # compute_macd scores one stock per call; 10,000 calls would take ~15s
+    data = closes(count)
+    frames = [pd.DataFrame({"Close": data[column]}) for column in data]
+    cfg = {"scoring": {}}
+    check_against_baseline(
+        f"compute_macd[{count}]",
+        best_time(lambda: [compute_macd(frame, cfg) for frame in frames]),
+    )
+
+
+@pytest.mark.parametrize("count", SIZES)
+@pytest.mark.parametrize(
+    "name, helper",
+    [
+        ("clamp", lambda value: clamp(value, -1, 1)),
+        ("normalize_0_1", lambda value: normalize_0_1(value, -3, 3)),
+    ],
+)
+def test_scalar_helper_speed(name, helper, count):
+    values = np.random.default_rng(count).normal(0, 2, count).tolist()
+    check_against_baseline(
+        f"{name}[{count}]", best_time(lambda: [helper(value) for value in values])
+    )
+
+
+# -----------------------------
+# Alert Composition
+# -----------------------------
+@pytest.mark.parametrize("count", [10, 300])
+def test_diversification_speed(count):
+    # Candidates are the stocks above the buy threshold, a few hundred at most
+    data = closes(count).set_index(pd.bdate_range("2026-01-01", periods=HISTORY))
+    prices = {f"S{column}": data[column] for column in data}
+    candidates = [{"symbol": symbol} for symbol in prices]
+    check_against_baseline(
+        f"diversify[{count}]",
+        best_time(lambda: select_diversified(candidates, prices, 5, 0.8)),
+    )
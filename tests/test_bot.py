@@ -0,0 +1,138 @@
+"""
+Bot commands and long polling of utils/bot.py.
+"""
+
+# Import Dependencies
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from utils.bot import ScoreIndex, handle_command, run_bot
+
+
+def result(symbol, final_score, change_pct=0.0, signals=None):
+    return {
+        "symbol": symbol,
+        "tech_score": final_score,
+        "fund_score": final_score,
+        "final_score": final_score,
+        "last_close": 100.0,
+        "avg_price": 100.0,
+        "change_pct": change_pct,
+        "signals": signals or {"momentum": 1, "rsi": 0, "volume": 1, "macd": 1},
+        "sector": "Financial Services",
+    }
+
+
+@pytest.fixture
+def index(cfg):
+    index = ScoreIndex()
+    index.update(
+        [
+            result("SBIN", 70.0, change_pct=-4.2),
+            result("TCS", 80.0, change_pct=1.0),
+            result("INFY", 60.0, change_pct=2.5),
+            result("M&M", 50.0, change_pct=None),
+        ],
+        cfg,
+    )
+    return index
+
+
+def test_score_replies_with_scores_and_signals(index):
+    reply = handle_command("/score sbin", index)
+    assert "<b>SBIN</b>" in reply and "▼ 4.20%" in reply
+    assert "momentum ✅" in reply and "rsi ❌" in reply
+    assert "<b>M&amp;M</b>" in handle_command("/score M&M.NS", index)
+
+
+def test_unknown_symbols_are_escaped_not_fetched(index):
+    reply = handle_command("/score <b>NOPE", index)
+    assert "&lt;B&gt;NOPE" in reply and "not scored" in reply
+
+
+def test_top_and_movers_are_ranked(index):
+    top = handle_command("/top@QuantasticBot 2", index)
+    assert top.index("TCS") < top.index("SBIN") and "INFY" not in top
+    movers = handle_command("/movers", index)
+    assert movers.index("SBIN") < movers.index("INFY") < movers.index("TCS")
+    assert "M&amp;M" not in movers
+
+
+def test_profiles_get_their_own_scores(cfg):
+    index = ScoreIndex()
+    cfg = {**cfg, "profiles": {"macd": {"weights": {"macd": 1}}}}
+    index.update([result("SBIN", 70.0, signals={"macd": 1})], cfg)
+    assert "Tech Score: 100" in handle_command("/score SBIN", index, "macd")
+    assert "Tech Score: 100" not in handle_command("/score SBIN", index)
+
+
+def test_non_commands_are_ignored_and_others_get_help(index):
+    assert handle_command("hello", index) is None
+    assert "/score SYMBOL" in handle_command("/start", index)
+
+
+def test_replies_take_well_under_100ms(cfg):
+    index = ScoreIndex()
+    index.update([result(f"S{i}", i % 100, i % 7 - 3) for i in range(5000)], cfg)
+    for command in ("/score S4321", "/top 20", "/movers 20"):
+        started = time.perf_counter()
+        handle_command(command, index)
+        assert time.perf_counter() - started < 0.1
+
+
+class MockTelegram(BaseHTTPRequestHandler):
+    updates = []
+    sent = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path.endswith("/getUpdates"):
+            offset = body.get("offset", 0)
+            payload = [u for u in self.updates if u["update_id"] >= offset]
+            if not payload:
+                time.sleep(0.05)  # A real server holds the request open
+        else:
+            self.sent.append(body)
+            payload = True
+        data = json.dumps({"ok": True, "result": payload}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_bot_answers_configured_chats_by_long_polling(index, cfg):
+    MockTelegram.updates = [
+        {"update_id": 1, "message": {"chat": {"id": 11}, "text": "/top 1"}},
+        {"update_id": 2, "message": {"chat": {"id": 99}, "text": "/top"}},
+        {"update_id": 3, "message": {"chat": {"id": 11}, "text": "/score TCS"}},
+    ]
+    MockTelegram.sent = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockTelegram)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    bot_cfg = {
+        **cfg,
+        "bot": {"api_url": f"http://127.0.0.1:{server.server_port}", "poll_timeout": 1},
+    }
+    creds = {"telegram": {"bot_token": "token", "chat_ids": ["11"]}}
+    stop = threading.Event()
+    bot = threading.Thread(target=run_bot, args=(index, bot_cfg, creds, None, stop))
+    bot.start()
+    try:
+        for _ in range(100):
+            if len(MockTelegram.sent) >= 2:
+                break
+            time.sleep(0.02)
+    finally:
+        stop.set()
+        bot.join(5)
+        server.shutdown()
+
+    assert [m["chat_id"] for m in MockTelegram.sent] == ["11", "11"]  # 99 is unknown
+    assert "TCS" in MockTelegram.sent[0]["text"]
+    assert "Final Score" in MockTelegram.sent[1]["text"]
@@ -0,0 +1,28 @@
+"""
+Scan cache of utils/cache.py.
+"""
+
+# Import Dependencies
+from types import SimpleNamespace
+import utils.cache
+from utils.cache import ScanCache
+
+
+def test_fundamentals_expire_after_the_ttl(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(utils.cache, "time", SimpleNamespace(time=lambda: clock.now))
+    cache = ScanCache(fundamentals_ttl=3600)
+    cache.set_fundamentals("SBIN.NS", {"pe": 9.5})
+
+    clock.now += 3599
+    assert cache.get_fundamentals("SBIN.NS") == {"pe": 9.5}
+    clock.now += 1
+    assert cache.get_fundamentals("SBIN.NS") is None
+    assert cache.get_fundamentals("TCS.NS") is None
+
+    # Refetching restarts the clock
+    cache.set_fundamentals("SBIN.NS", {"pe": 10.0})
+    assert cache.get_fundamentals("SBIN.NS") == {"pe": 10.0}
+    summary = cache.summary()
+    assert summary["fundamentals_entries"] == 1
+    assert (summary["fundamentals_hits"], summary["fundamentals_misses"]) == (2, 2)
@@ -0,0 +1,80 @@
+"""
+Scan checkpoints of utils/checkpoint.py.
+"""
+
+# Import Dependencies
+from datetime import date
+from utils.checkpoint import (
+    CheckpointWriter,
+    checkpoint_path,
+    latest_checkpoint_before,
+    load_checkpoint,
+)
+
+DAY = date(2026, 10, 19)
+
+
+def test_records_round_trip_and_the_latest_record_wins(tmp_path):
+    path = checkpoint_path(DAY, str(tmp_path))
+    writer = CheckpointWriter(path)
+    writer.record("SBIN", "skipped")
+    writer.record("SBIN", "ok", {"symbol": "SBIN", "tech_score": 61.5})
+    writer.record("TCS", "ok", {"symbol": "TCS", "tech_score": 40.0})
+    writer.close()
+
+    records = load_checkpoint(path)
+    assert list(records) == ["SBIN", "TCS"]
+    assert records["SBIN"]["status"] == "ok"
+    assert records["SBIN"]["row"]["tech_score"] == 61.5
+
+
+def test_resume_after_a_truncated_last_line(tmp_path):
+    path = checkpoint_path(DAY, str(tmp_path))
+    writer = CheckpointWriter(path)
+    writer.record("SBIN", "ok", {"symbol": "SBIN"})
+    writer.close()
+    with open(path, "a") as file:
+        file.write('{"symbol": "TCS", "sta')  # Killed mid-write
+
+    assert list(load_checkpoint(path)) == ["SBIN"]
+    writer = CheckpointWriter(path, resume=True)
+    writer.record("INFY", "ok", {"symbol": "INFY"})
+    writer.close()
+    assert list(load_checkpoint(path)) == ["SBIN", "INFY"]
+
+
+def test_a_new_scan_starts_a_fresh_checkpoint(tmp_path):
+    path = checkpoint_path(DAY, str(tmp_path))
+    CheckpointWriter(path).record("SBIN", "ok")
+    CheckpointWriter(path).close()
+    assert load_checkpoint(path) == {}
+    assert load_checkpoint(str(tmp_path / "missing.jsonl")) == {}
+
+
+def test_latest_checkpoint_before_matches_the_suffix(tmp_path):
+    for day, suffix in [
+        (date(2026, 10, 15), ""),
+        (date(2026, 10, 16), ""),
+        (date(2026, 10, 17), "_shard_1_of_2"),
+        (DAY, ""),
+    ]:
+        CheckpointWriter(checkpoint_path(day, str(tmp_path), suffix)).close()
+
+    assert latest_checkpoint_before(DAY, str(tmp_path)) == checkpoint_path(
+        date(2026, 10, 16), str(tmp_path)
+    )
+    assert latest_checkpoint_before(
+        DAY, str(tmp_path), "_shard_1_of_2"
+    ) == checkpoint_path(date(2026, 10, 17), str(tmp_path), "_shard_1_of_2")
+    assert latest_checkpoint_before(DAY, str(tmp_path / "none")) is None
+
+
+def test_records_after_close_are_dropped(tmp_path):
+    # Fetches a deadline left running may finish after the scan closed the file
+    path = checkpoint_path(DAY, str(tmp_path))
+    writer = CheckpointWriter(path)
+    writer.record("SBIN", "ok")
+    writer.close()
+    writer.record("TCS", "ok")
+    writer.close()
+    assert list(load_checkpoint(path)) == ["SBIN"]
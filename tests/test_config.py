@@ -0,0 +1,67 @@
+"""
+Universe files of utils/config.py.
+"""
+
+# Import Dependencies
+from utils.config import read_universe, read_symbols, yahoo_symbol_for
+
+
+def write(tmp_path, text: str) -> str:
+    path = tmp_path / "symbols.csv"
+    path.write_text(text)
+    return str(path)
+
+
+def test_exchanges_map_to_yahoo_suffixes(tmp_path):
+    path = write(
+        tmp_path,
+        "symbol,exchange,yahoo_symbol,isin\n"
+        "SBIN,NSE,,INE062A01020\n"
+        "500325,bse,,INE002A01018\n"
+        "TCS,,,INE467B01029\n",
+    )
+    assert read_universe(path) == {
+        "SBIN": "SBIN.NS",
+        "500325": "500325.BO",  # Exchanges are case-insensitive
+        "TCS": "TCS.NS",  # No exchange: the suffix applies
+    }
+    assert read_symbols(path) == ["SBIN", "500325", "TCS"]
+
+
+def test_an_explicit_yahoo_symbol_takes_precedence(tmp_path):
+    path = write(
+        tmp_path,
+        "symbol,exchange,yahoo_symbol,isin\n"
+        "M&M,NSE, M%26M.NS ,INE101A01026\n"
+        "TATAMOTORS,BSE,TATAMOTORS.NS,INE155A01022\n",
+    )
+    assert read_universe(path) == {"M&M": "M%26M.NS", "TATAMOTORS": "TATAMOTORS.NS"}
+
+
+def test_legacy_headerless_files_get_the_suffix(tmp_path):
+    path = write(tmp_path, "SBIN\n TCS \n\nINFY\n")
+    assert read_universe(path) == {
+        "SBIN": "SBIN.NS",
+        "TCS": "TCS.NS",
+        "INFY": "INFY.NS",
+    }
+    assert read_universe(path, suffix=".BO") == {
+        "SBIN": "SBIN.BO",
+        "TCS": "TCS.BO",
+        "INFY": "INFY.BO",
+    }
+
+
+def test_the_suffix_only_fills_unknown_exchanges(tmp_path):
+    path = write(tmp_path, "symbol,exchange\nSBIN,NSE\nWIPRO,\nIBM,NYSE\n")
+    assert read_universe(path, suffix="") == {
+        "SBIN": "SBIN.NS",
+        "WIPRO": "WIPRO",
+        "IBM": "IBM",  # Exchanges without a Yahoo suffix fall back too
+    }
+    assert yahoo_symbol_for("SBIN", {"universe": {"suffix": ".BO"}}) == "SBIN.BO"
+    assert yahoo_symbol_for("SBIN", {}) == "SBIN.NS"
+
+
+def test_a_missing_file_is_an_empty_universe(tmp_path):
+    assert read_universe(str(tmp_path / "missing.csv")) == {}
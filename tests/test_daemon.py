@@ -0,0 +1,99 @@
+"""
+Scheduled scans and the health endpoint of utils/daemon.py.
+"""
+
+# Import Dependencies
+import json
+import signal
+import threading
+import urllib.error
+import urllib.request
+import pytest
+import utils.daemon
+from utils.cache import ScanCache
+from utils.daemon import DaemonState, run_daemon, start_health_server
+
+
+def get(server, path: str):
+    host, port = server.server_address[:2]
+    with urllib.request.urlopen(f"http://{host}:{port}{path}", timeout=5) as response:
+        return response.headers["Content-Type"], response.read().decode()
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = {
+        "config": tmp_path / "config.json",
+        "credentials": tmp_path / "credentials.json",
+        "symbols": tmp_path / "symbols.csv",
+    }
+    daemon_cfg = {"health_port": 0, "fundamentals_ttl_hours": 2}
+    paths["config"].write_text(json.dumps({"daemon": daemon_cfg}))
+    paths["credentials"].write_text(json.dumps({"telegram": {"bot_token": "x"}}))
+    paths["symbols"].write_text("symbol,exchange\nSBIN,NSE\n500325,BSE\n")
+    return {name: str(path) for name, path in paths.items()}
+
+
+def test_health_and_metrics_endpoints():
+    cache = ScanCache()
+    cache.set_fundamentals("SBIN.NS", {"pe": 9.5})
+    state = DaemonState(cache)
+    state.metrics["scans_total"] = 3
+    server = start_health_server(state, "127.0.0.1", 0)
+    try:
+        content_type, body = get(server, "/health")
+        assert content_type == "application/json"
+        health = json.loads(body)
+        assert health["status"] == "ok" and health["scanning"] is False
+
+        content_type, body = get(server, "/metrics")
+        assert content_type.startswith("text/plain")
+        lines = body.splitlines()
+        assert "quantastic_scans_total 3" in lines
+        assert "quantastic_cache_fundamentals_entries 1" in lines
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            get(server, "/other")
+        assert error.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_run_daemon_scans_on_schedule_and_survives_a_failed_scan(files, monkeypatch):
+    servers, calls, reports = [], [], []
+    stop = threading.Event()
+
+    def start(state, host, port):
+        servers.append(start_health_server(state, host, port))
+        return servers[-1]
+
+    def scan(cfg, creds, universe, cache):
+        calls.append((universe, cache))
+        if len(calls) == 1:
+            raise RuntimeError("Yahoo is down")
+        # What the endpoint reports while the second scan runs
+        reports.append(json.loads(get(servers[0], "/health")[1]))
+        reports.append(get(servers[0], "/metrics")[1].splitlines())
+        stop.set()
+        return [{"symbol": "SBIN"}]
+
+    # Every check finds a scan due, so the daemon scans back to back
+    monkeypatch.setattr(utils.daemon, "next_run", lambda cron, now, cfg: now)
+    monkeypatch.setattr(utils.daemon, "start_health_server", start)
+    handler = signal.getsignal(signal.SIGTERM)
+    try:
+        run_daemon(scan, files["config"], files["credentials"], files["symbols"], stop)
+    finally:
+        signal.signal(signal.SIGTERM, handler)
+
+    assert len(calls) == 2
+    health, metrics = reports
+    assert health["scanning"] and health["last_scan"] is not None
+    assert "quantastic_scans_total 1" in metrics
+    assert "quantastic_scan_failures_total 1" in metrics
+    assert calls[0][0] == {"SBIN": "SBIN.NS", "500325": "500325.BO"}
+    assert calls[0][1] is calls[1][1]  # The cache stays warm between scans
+    assert calls[0][1].fundamentals_ttl == 2 * 3600
+    with pytest.raises(OSError):
+        get(servers[0], "/health")  # Closed with the daemon
@@ -0,0 +1,95 @@
+"""
+Deadline parsing and deadline-bounded work of utils/deadline.py.
+"""
+
+# Import Dependencies
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import pytest
+from utils.exceptions import ConfigError
+from utils.deadline import (
+    Deadline,
+    MIN_BUDGET_SECONDS,
+    parse_deadline,
+    prioritize_symbols,
+    map_until_deadline,
+)
+
+NOW = datetime(2026, 10, 19, 9, 0, tzinfo=ZoneInfo("Asia/Kolkata"))
+
+
+def test_parse_deadline_clock_and_durations():
+    assert parse_deadline("09:10", NOW).at == NOW.timestamp() + 600
+    assert parse_deadline("09:10", NOW, reserve_seconds=30).at == NOW.timestamp() + 570
+    assert parse_deadline("45m", NOW).at == NOW.timestamp() + 2700
+    assert parse_deadline("1.5h", NOW).at == NOW.timestamp() + 5400
+    assert parse_deadline("90s", NOW).at == NOW.timestamp() + 90
+
+
+@pytest.mark.parametrize("value", ["soon", "25:00", "m", ""])
+def test_invalid_deadlines_are_config_errors(value):
+    with pytest.raises(ConfigError):
+        parse_deadline(value, NOW)
+
+
+@pytest.mark.parametrize("value", ["08:30", "09:00", "20s"])
+def test_a_passed_deadline_still_leaves_a_minimal_budget(value):
+    deadline = parse_deadline(value, NOW, reserve_seconds=30)
+    assert deadline.at == NOW.timestamp() + MIN_BUDGET_SECONDS
+
+
+def test_split_keeps_a_share_in_reserve():
+    deadline = Deadline(time.time() + 100)
+    assert 69 < deadline.split(0.3).remaining() <= 70
+    assert Deadline().split(0.3).at is None
+
+
+def test_prioritize_symbols_by_previous_scores():
+    previous = {
+        "A": {"final_score": 40, "tech_score": 60},
+        "B": {"final_score": 70, "tech_score": 50},
+        "C": {"final_score": None, "tech_score": 90},
+        "D": {"final_score": 40, "tech_score": 80},
+    }
+    assert prioritize_symbols(["N1", "A", "B", "N2", "C", "D"], previous) == [
+        "B",
+        "D",
+        "A",
+        "C",
+        "N1",
+        "N2",
+    ]
+
+
+def test_map_keeps_the_input_order_without_a_deadline():
+    results, timed_out = map_until_deadline(
+        lambda n: n * n, list(range(20)), Deadline(), 4, "squares"
+    )
+    assert results == [n * n for n in range(20)] and not timed_out
+
+
+def test_map_stops_at_the_deadline():
+    def slow(n):
+        time.sleep(0.05)
+        return n
+
+    started = time.time()
+    results, timed_out = map_until_deadline(
+        slow, list(range(100)), Deadline(time.time() + 0.2), 2, "slow"
+    )
+    assert timed_out and 0 < len(results) < 100
+    assert time.time() - started < 1
+
+
+def test_map_stops_when_asked_and_keeps_running_items():
+    def slow(n):
+        time.sleep(0.02)
+        return n
+
+    results, timed_out = map_until_deadline(
+        slow, list(range(100)), Deadline(), 2, "slow", stop_when=lambda i, n: n == 5
+    )
+    assert not timed_out
+    assert 5 in results and len(results) < 10
+    assert results == sorted(results)
@@ -0,0 +1,90 @@
+"""
+Correlation-aware pick selection of utils/diversification.py.
+"""
+
+# Import Dependencies
+import numpy as np
+import pytest
+import pandas as pd
+from utils.diversification import (
+    return_matrix,
+    correlation_matrix,
+    select_diversified,
+)
+from utils.messaging import compose_message
+
+DAYS = pd.bdate_range("2026-01-01", periods=80)
+
+
+def walk(seed: int) -> pd.Series:
+    steps = np.random.default_rng(seed).normal(0, 0.01, len(DAYS))
+    return pd.Series(100 * np.exp(steps.cumsum()), index=DAYS)
+
+
+def twin(series: pd.Series, seed: int, noise: float = 0.001) -> pd.Series:
+    # Follows `series` day by day with a little independent noise
+    wiggle = np.random.default_rng(seed).normal(0, noise, len(series))
+    return series * np.exp(wiggle.cumsum())
+
+
+def candidates(*symbols):
+    return [{"symbol": s, "final_score": 90 - i} for i, s in enumerate(symbols)]
+
+
+def test_correlations_match_numpy_on_complete_data():
+    closes = {s: walk(seed) for seed, s in enumerate("ABCD")}
+    returns = return_matrix(closes, list("ABCD"), 60)
+    assert returns.shape == (60, 4)
+    np.testing.assert_allclose(
+        correlation_matrix(returns), np.corrcoef(returns.to_numpy().T), atol=1e-12
+    )
+
+
+def test_short_or_flat_histories_count_as_uncorrelated():
+    closes = {
+        "A": walk(1),
+        "B": walk(1).iloc[-10:],  # Identical, but only ten shared days
+        "C": pd.Series(100.0, index=DAYS),
+    }
+    correlations = correlation_matrix(return_matrix(closes, list("ABC"), 60))
+    assert correlations[0, 0] == pytest.approx(1)
+    assert correlations[0, 1] == 0
+    assert correlations[0, 2] == 0
+
+
+def test_a_pick_tracking_a_better_one_is_passed_over():
+    bank = walk(1)
+    closes = {"SBIN": bank, "PNB": twin(bank, 2), "TCS": walk(3), "INFY": walk(4)}
+    picks, skipped = select_diversified(
+        candidates("SBIN", "PNB", "TCS", "INFY"), closes, top_n=3, max_correlation=0.8
+    )
+    assert [p["symbol"] for p in picks] == ["SBIN", "TCS", "INFY"]
+    assert skipped["PNB"][0] == "SBIN" and skipped["PNB"][1] > 0.9
+
+
+def test_selection_stops_at_top_n_and_admits_stocks_without_closes():
+    bank = walk(1)
+    closes = {"SBIN": bank, "PNB": twin(bank, 2)}
+    picks, skipped = select_diversified(
+        candidates("SBIN", "NEW", "PNB", "TCS", "INFY"), closes, 3, 0.8
+    )
+    assert [p["symbol"] for p in picks] == ["SBIN", "NEW", "TCS"]
+    assert list(skipped) == ["PNB"]
+
+
+def test_message_lists_diversified_picks(cfg):
+    cfg = {**cfg, "diversification": {"max_correlation": 0.8}}
+    cfg["scoring"] = {**cfg["scoring"], "top_n_watch": 2}
+    bank = walk(1)
+    closes = {"SBIN": bank, "PNB": twin(bank, 2), "TCS": walk(3)}
+    results = [
+        {**c, "tech_score": 80, "fund_score": 80, "last_close": 1, "avg_price": 1}
+        for c in candidates("SBIN", "PNB", "TCS")
+    ]
+    message = compose_message(results, cfg, [], closes=closes)
+    assert "<b>SBIN</b>" in message and "<b>TCS</b>" in message
+    assert "<b>PNB</b>" not in message
+    assert "PNB (" in message  # Named as passed over
+
+    # Without closes the plain top N are listed
+    assert "<b>PNB</b>" in compose_message(results, cfg, [])
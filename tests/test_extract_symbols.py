@@ -0,0 +1,54 @@
+"""
+Merging of the NSE and BSE listings in src/extract_symbols.py.
+"""
+
+# Import Dependencies
+import pandas as pd
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("splinter")
+from extract_symbols import merge_and_save_unique
+
+
+def listings(*rows) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["symbol", "isin"])
+
+
+def test_merge_collapses_dual_listings_and_keeps_clashing_tickers(tmp_path, capsys):
+    nse = listings(
+        ("SBIN", "INE062A01020"),
+        ("ABC", "INE111A01011"),
+        ("OLD", "n/a"),
+    )
+    bse = listings(
+        ("SBIN", "ine062a01020"),  # The same company on BSE
+        ("RELI", " INE002A01018 "),  # Same ISIN as the NSE listing below
+        ("ABC", "INE999Z01019"),  # BSE-only, its Security Id is an NSE symbol
+        ("OLD", ""),  # No ISIN on either side: a duplicate
+        ("BSEONLY", "INE555B01012"),
+    )
+    nse = pd.concat([nse, listings(("RELIANCE", "INE002A01018"))])
+    output = tmp_path / "symbols.csv"
+    merge_and_save_unique(nse, bse, str(output))
+
+    saved = pd.read_csv(output, dtype=str).set_index("symbol")
+    assert sorted(saved.index) == [
+        "ABC",
+        "ABC.BO",
+        "BSEONLY",
+        "OLD",
+        "RELIANCE",
+        "SBIN",
+    ]
+    assert saved.loc["ABC", "isin"] == "INE111A01011"
+    assert saved.loc["ABC.BO", "yahoo_symbol"] == "ABC.BO"
+    assert saved.loc["ABC.BO", "isin"] == "INE999Z01019"
+    assert saved.loc["SBIN", "yahoo_symbol"] == "SBIN.NS"
+    assert saved.loc["BSEONLY", "yahoo_symbol"] == "BSEONLY.BO"
+    assert pd.isna(saved.loc["OLD", "isin"])
+
+    out = capsys.readouterr().out
+    assert "Total unique: 6 (NSE: 4, BSE only: 2)" in out
+    assert "Removed 2 dual-listed duplicate(s) by ISIN and 1 by ticker: OLD.BO." in out
+    assert "Kept 1 listing(s)" in out and "ABC.BO" in out
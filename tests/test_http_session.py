@@ -0,0 +1,61 @@
+"""
+Pooled HTTP session of utils/http_session.py.
+"""
+
+# Import Dependencies
+import pytest
+from curl_cffi import CurlInfo
+from curl_cffi import requests as curl_requests
+from utils.http_session import CountingSession
+
+
+class FakeResponse:
+    def __init__(self, connects: int):
+        self.infos = {CurlInfo.NUM_CONNECTS: connects}
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    # Answers requests without a network: NUM_CONNECTS comes from the URL
+    calls = []
+
+    def request(self, method, url, **kwargs):
+        calls.append(kwargs)
+        if url.endswith("/fail"):
+            raise ConnectionError("connection refused")
+        return FakeResponse(int(url.rsplit("/", 1)[1]))
+
+    monkeypatch.setattr(curl_requests.Session, "request", request)
+    return calls
+
+
+def test_requests_over_pooled_connections_are_counted(sent):
+    session = CountingSession()
+    session.request("GET", "https://example.test/1")
+    session.request("GET", "https://example.test/0")
+    session.request("GET", "https://example.test/0")
+    assert session.stats == {
+        "requests": 3,
+        "new_connections": 1,
+        "reused_connections": 2,
+        "errors": 0,
+    }
+
+
+def test_failed_requests_are_counted_and_raised(sent):
+    session = CountingSession()
+    with pytest.raises(ConnectionError):
+        session.request("GET", "https://example.test/fail")
+    assert session.stats["requests"] == 1 and session.stats["errors"] == 1
+
+
+def test_the_configured_timeout_caps_per_request_timeouts(sent):
+    # yfinance passes 10 s or 30 s with every request
+    session = CountingSession(max_timeout=5)
+    session.request("GET", "https://example.test/0", timeout=30)
+    session.request("GET", "https://example.test/0", timeout=2)
+    session.request("GET", "https://example.test/0", timeout=(10, 30))
+    session.request("GET", "https://example.test/0")
+    assert [call["timeout"] for call in sent] == [5, 2, (5, 5), 5]
+    CountingSession().request("GET", "https://example.test/0", timeout=30)
+    assert sent[-1]["timeout"] == 30
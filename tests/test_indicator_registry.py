@@ -0,0 +1,124 @@
+"""
+Execution plans and multi-timeframe indicators of utils/indicator_registry.py.
+"""
+
+# Import Dependencies
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import random_walk
+from utils.exceptions import ConfigError
+from utils.indicators import ema, rsi
+from utils.indicator_registry import (
+    compile_plan,
+    evaluate_plan,
+    ema_warmup,
+    history_window,
+    technical_score,
+    _bars_needed,
+)
+
+
+def daily_closes(length: int = 400, seed: int = 3) -> pd.Series:
+    closes = random_walk(length, seed)
+    closes.index = pd.bdate_range("2025-01-01", periods=length, tz="Asia/Kolkata")
+    return closes
+
+
+def plan_for(weights: dict, timeframes: dict = None) -> dict:
+    return compile_plan(
+        {"scoring": {"weights": weights, "timeframes": timeframes or {}}}
+    )
+
+
+def test_zero_weight_indicators_are_not_planned():
+    plan = plan_for({"momentum": 1, "rsi": 0, "macd": 0})
+    assert [indicator["name"] for indicator in plan["indicators"]] == ["momentum"]
+    assert all(key[0] in ("field", "sma") for key in plan["series"])
+
+
+def test_shared_series_are_planned_once():
+    plan = plan_for({"momentum": 1, "rsi": 1, "macd": 1})
+    assert len(plan["series"]) == len(set(plan["series"]))
+    assert plan["series"].count(("field", "Close")) == 1
+
+
+def test_weekly_macd_matches_resampled_closes():
+    closes = daily_closes()
+    plan = plan_for({"macd": 1}, {"macd": "weekly"})
+    weekly = closes.resample("W-FRI").last().dropna()
+    macd = ema(weekly, 12) - ema(weekly, 26)
+    expected = float(macd.iloc[-1] > ema(macd, 9).iloc[-1])
+    assert evaluate_plan(plan, pd.DataFrame({"Close": closes}))["macd"] == expected
+
+
+def test_monthly_rsi_matches_resampled_closes():
+    closes = daily_closes()
+    plan = plan_for({"rsi": 1}, {"rsi": "monthly"})
+    value = rsi(closes.resample("ME").last().dropna(), 14).iloc[-1]
+    expected = float(30 < value < 70)
+    assert evaluate_plan(plan, pd.DataFrame({"Close": closes}))["rsi"] == expected
+
+
+def test_timeframes_work_on_panels():
+    closes = pd.DataFrame({f"S{seed}": daily_closes(seed=seed) for seed in range(3)})
+    closes.iloc[-3:, 0] = np.nan  # One symbol stopped trading
+    plan = plan_for({"momentum": 1, "macd": 1}, {"macd": "weekly"})
+    panel = evaluate_plan(plan, pd.concat({"Close": closes}, axis=1))
+    for symbol in closes:
+        single = evaluate_plan(plan, pd.DataFrame({"Close": closes[symbol].dropna()}))
+        assert panel["macd"][symbol] == single["macd"]
+
+
+def test_unknown_timeframe_is_a_config_error():
+    with pytest.raises(ConfigError):
+        plan_for({"macd": 1}, {"macd": "hourly"})
+
+
+# -----------------------------
+# Lookback Planner
+# -----------------------------
+def test_technical_score_broadcasts_over_symbols_and_profiles():
+    # Volume has no registered indicator but still counts towards the total
+    weights = {"momentum": 50, "rsi": 30, "volume": 20}
+    assert technical_score({"momentum": 1, "rsi": 0}, weights) == 50
+    per_symbol = technical_score({"momentum": pd.Series([1, 0]), "rsi": 1}, weights)
+    assert per_symbol.tolist() == [80, 30]
+    per_profile = technical_score(
+        {"momentum": np.array([[1], [0]]), "rsi": np.array([[0], [1]])},
+        {"momentum": np.array([1, 0]), "rsi": np.array([1, 1])},
+    )
+    assert per_profile.tolist() == [[50, 0], [50, 100]]
+
+
+def test_bars_needed_per_series(cfg):
+    plan = compile_plan(cfg)
+    needed = {
+        indicator["name"]: max(_bars_needed(key, 0.01) for key in indicator["inputs"])
+        for indicator in plan["indicators"]
+    }
+    # SMA 20; RSI 14 on 15 closes; MACD: EMA 26 warm-up (60) + signal EMA 9 (21) - 1
+    assert needed == {"momentum": 20, "rsi": 15, "macd": 80}
+
+
+def test_ema_warmup_shrinks_the_seed_below_the_tolerance():
+    bars = ema_warmup(26, 0.01)
+    alpha = 2 / 27
+    assert (1 - alpha) ** bars < 0.01 <= (1 - alpha) ** (bars - 1)
+
+
+def test_history_window_covers_the_slowest_indicator(cfg):
+    daily = history_window(cfg)
+    weekly = history_window(
+        {"scoring": {**cfg["scoring"], "timeframes": {"macd": "weekly"}}}
+    )
+    assert pd.Timedelta(days=112) < daily < pd.Timedelta(days=183)
+    assert weekly > pd.Timedelta(days=81 * 7)
+
+
+def test_planned_window_keeps_the_signals(cfg):
+    closes = daily_closes(length=600)
+    plan = compile_plan(cfg)
+    full = evaluate_plan(plan, pd.DataFrame({"Close": closes}))
+    trimmed = closes[closes.index >= closes.index[-1] - history_window(cfg)]
+    assert evaluate_plan(plan, pd.DataFrame({"Close": trimmed})) == full
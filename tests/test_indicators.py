@@ -0,0 +1,100 @@
+"""
+Reference values and edge cases for utils/indicators.py.
+"""
+
+# Import Dependencies
+import numpy as np
+import pandas as pd
+import pytest
+from utils.indicators import sma, ema, rsi, rsi_from_delta, clamp
+
+
+# -----------------------------
+# SMA
+# -----------------------------
+def test_sma_reference_values():
+    result = sma(pd.Series([1.0, 2.0, 3.0, 4.0, 5.0]), 3)
+    np.testing.assert_allclose(result, [np.nan, np.nan, 2.0, 3.0, 4.0])
+
+
+def test_sma_short_history_is_all_nan():
+    assert sma(pd.Series([1.0, 2.0]), 3).isna().all()
+
+
+def test_sma_window_with_nan_is_nan():
+    result = sma(pd.Series([1.0, 2.0, np.nan, 4.0, 5.0, 6.0]), 2)
+    np.testing.assert_allclose(result, [np.nan, 1.5, np.nan, np.nan, 4.5, 5.5])
+
+
+def test_sma_works_column_wise_on_frames():
+    frame = pd.DataFrame({"A": [1.0, 2.0, 3.0], "B": [3.0, 2.0, 1.0]})
+    np.testing.assert_allclose(sma(frame, 2).iloc[-1], [2.5, 1.5])
+
+
+# -----------------------------
+# EMA
+# -----------------------------
+def test_ema_reference_values():
+    # span 3 -> alpha 0.5, seeded with the first value (adjust=False)
+    np.testing.assert_allclose(ema(pd.Series([2.0, 4.0, 8.0]), 3), [2.0, 3.0, 5.5])
+
+
+def test_ema_carries_the_last_value_over_nans():
+    np.testing.assert_allclose(ema(pd.Series([1.0, np.nan, 3.0]), 3), [1.0, 1.0, 2.5])
+
+
+def test_ema_of_flat_series_is_flat():
+    np.testing.assert_allclose(ema(pd.Series([5.0] * 10), 4), [5.0] * 10)
+
+
+# -----------------------------
+# RSI
+# -----------------------------
+def test_rsi_reference_values():
+    result = rsi(pd.Series([10.0, 11.0, 10.5, 11.5, 12.0]), 3)
+    np.testing.assert_allclose(result, [np.nan, np.nan, 200 / 3, 80.0, 75.0])
+
+
+def test_rsi_flat_prices_divide_by_zero_to_nan():
+    # No gains and no losses: 0 / 0 leaves the RSI undefined
+    assert np.isnan(rsi(pd.Series([5.0] * 20), 14).iloc[-1])
+
+
+@pytest.mark.parametrize(
+    "prices, expected",
+    [(np.arange(1.0, 31.0), 100.0), (np.arange(30.0, 0.0, -1.0), 0.0)],
+    ids=["only-gains", "only-losses"],
+)
+def test_rsi_saturates_on_one_sided_moves(prices, expected):
+    assert rsi(pd.Series(prices), 14).iloc[-1] == expected
+
+
+def test_rsi_short_history_is_all_nan():
+    assert rsi(pd.Series([1.0, 2.0, 3.0]), 14).isna().all()
+
+
+def test_rsi_with_nans_does_not_raise():
+    result = rsi(pd.Series([1.0, 2.0, np.nan, 4.0, 5.0, 6.0]), 2)
+    np.testing.assert_allclose(result, [np.nan, 100, 100, np.nan, 100, 100])
+
+
+def test_rsi_matches_rsi_from_delta():
+    prices = pd.Series(np.linspace(10, 20, 40) + np.sin(np.arange(40)))
+    pd.testing.assert_series_equal(rsi(prices, 14), rsi_from_delta(prices.diff(), 14))
+
+
+# -----------------------------
+# Clamp
+# -----------------------------
+@pytest.mark.parametrize(
+    "value, expected",
+    [(-150, -100), (-100, -100), (42.5, 42.5), (100, 100), (1e9, 100)],
+)
+def test_clamp_default_bounds(value, expected):
+    assert clamp(value) == expected
+
+
+def test_clamp_custom_bounds():
+    assert clamp(1.5, 0, 1) == 1
+    assert clamp(-0.5, 0, 1) == 0
+    assert clamp(0.25, 0, 1) == 0.25
@@ -0,0 +1,127 @@
+"""
+Intraday scan mode of utils/intraday.py.
+"""
+
+# Import Dependencies
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import pandas as pd
+import utils.intraday as intraday
+from utils.indicator_registry import compile_plan, evaluate_plan
+from conftest import random_walk
+
+IST = ZoneInfo("Asia/Kolkata")
+
+
+def test_a_pre_open_launch_waits_for_the_session(cfg, monkeypatch):
+    # Just before the open on a Monday, then the open, then after the close
+    moments = iter(
+        [
+            datetime(2026, 10, 19, 9, 14, 59, 900000, IST),
+            datetime(2026, 10, 19, 9, 15, tzinfo=IST),
+            datetime(2026, 10, 19, 15, 31, tzinfo=IST),
+        ]
+    )
+    polls = []
+    monkeypatch.setattr(intraday, "market_now", lambda daemon_cfg: next(moments))
+    monkeypatch.setattr(
+        intraday.IntradayScanner, "poll", lambda self, now: polls.append(now) or []
+    )
+    cfg = {**cfg, "intraday": {"poll_seconds": 1, "bar_delay_seconds": 0}}
+
+    intraday.run_intraday(cfg, {"SBIN": "SBIN.NS"}, lambda c: None, "5m")
+    assert [p.strftime("%H:%M") for p in polls] == ["09:15"]
+
+
+def test_a_launch_after_the_close_stops(cfg, monkeypatch):
+    monkeypatch.setattr(
+        intraday,
+        "market_now",
+        lambda daemon_cfg: datetime(2026, 10, 19, 16, 0, tzinfo=IST),
+    )
+    stop = threading.Event()
+    intraday.run_intraday(cfg, {}, lambda c: None, "5m", stop)
+    assert not stop.is_set()
+
+
+def test_incremental_signals_match_the_registry(cfg):
+    plan = compile_plan(cfg)
+    closes = random_walk(80, seed=3)
+    indicators = intraday.IncrementalIndicators(cfg["scoring"])
+    for n, close in enumerate(closes, 1):
+        indicators.update(float(close))
+        expected = evaluate_plan(plan, pd.DataFrame({"Close": closes[:n]}))
+        assert indicators.signals() == {
+            name: expected[name] for name in intraday.INCREMENTAL_INDICATORS
+        }, f"bar {n}"
+
+
+def test_unsupported_indicators_are_reported(cfg, capsys, monkeypatch):
+    plan = compile_plan(
+        {**cfg, "scoring": {**cfg["scoring"], "timeframes": {"rsi": "weekly"}}}
+    )
+    # An indicator registered later without an incremental counterpart
+    adx = {"name": "adx", "timeframe": "daily"}
+    monkeypatch.setattr(
+        intraday,
+        "compile_plan",
+        lambda cfg: {**plan, "indicators": plan["indicators"] + [adx]},
+    )
+    intraday.IntradayScanner(cfg, {}, "5m")
+    out = capsys.readouterr().out
+    assert "adx count as 0" in out and "rsi use 5m bars" in out
+
+
+def test_poll_fetches_deltas_and_alerts_once_per_new_crossing(cfg, monkeypatch):
+    # Momentum only: the latest close above its 20-bar average crosses the threshold
+    cfg = {
+        **cfg,
+        "scoring": {**cfg["scoring"], "weights": {"momentum": 1}},
+        "thresholds": {**cfg["thresholds"], "intraday_alert_score": 50},
+    }
+    open_at = pd.Timestamp("2026-10-19 09:15", tz=IST)
+    bar = lambda k: open_at + pd.Timedelta(minutes=5 * k)
+    # 30 falling bars, bar 30 still forming at the first poll
+    market = {
+        "A.NS": [100.0 - k for k in range(30)] + [200.0, 50.0, 300.0],
+        "C.NS": [100.0 - k for k in range(29)],  # Lags one bar behind
+    }
+    calls = []
+
+    def fetch(tickers, interval, start=None, period=None, session=None):
+        calls.append((sorted(tickers), start, period))
+        bars = {}
+        for ticker in tickers:
+            if ticker in market:
+                index = pd.DatetimeIndex([bar(k) for k in range(len(market[ticker]))])
+                frame = pd.DataFrame({"Close": market[ticker]}, index=index)
+                bars[ticker] = frame[frame.index >= (start or index[0])]
+        return bars
+
+    monkeypatch.setattr(intraday, "fetch_intraday_bars", fetch)
+    scanner = intraday.IntradayScanner(
+        cfg, {"A": "A.NS", "B": "B.NS", "C": "C.NS"}, "5m"
+    )
+
+    # Warm-up: above or not, nothing alerts, and the forming bar is left out
+    assert scanner.poll(bar(30) + pd.Timedelta(minutes=2)) == []
+    assert calls == [(["A.NS", "B.NS", "C.NS"], None, "5d")]
+    assert scanner.state["A"].last_bar == bar(29)
+    assert "B" in scanner.retry_at
+
+    # The delta starts at the oldest last bar; B is backed off, not refetched
+    crossings = scanner.poll(bar(31) + pd.Timedelta(minutes=1))
+    assert calls[-1] == (["A.NS", "C.NS"], bar(28), "5d")
+    assert [(c["symbol"], c["bar_time"]) for c in crossings] == [("A", bar(30))]
+    assert list(scanner.state["A"].losses)[-2] == 1.0  # Bar 29 was not fed twice
+
+    # Falling back below and crossing again on the same day does not alert again
+    assert scanner.poll(bar(32) + pd.Timedelta(minutes=1)) == []
+    assert not scanner.above["A"]
+    assert scanner.poll(bar(33) + pd.Timedelta(minutes=1)) == []
+    assert scanner.above["A"]
+
+    # After the back-off the symbol without bars is tried again
+    scanner.poll(bar(33) + pd.Timedelta(minutes=31))
+    assert (["B.NS"], None, "5d") in calls[-2:]
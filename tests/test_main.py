@@ -0,0 +1,145 @@
+"""
+Lazy fundamentals fetching of src/main.py.
+"""
+
+# Import Dependencies
+import time
+import numpy as np
+import pandas as pd
+import main
+from utils.cache import ScanCache
+from utils.diversification import select_diversified
+from utils.indicator_registry import technical_score
+from utils.scoring import finalize_scores, fundamentals_cutoff
+
+DAYS = pd.bdate_range("2026-01-01", periods=80)
+# Fundamentals scoring 100, so only the technical score separates the stocks
+BEST_FUNDAMENTALS = {
+    "pe": 1.0,
+    "roe": 10.0,
+    "debt_to_equity": 0.0,
+    "revenue_latest": 1e9,
+    "revenue_previous": 1.0,
+    "net_income_latest": 1e9,
+    "net_income_previous": 1.0,
+}
+
+
+def walk(seed: int, noise_seed: int = None) -> pd.Series:
+    steps = np.random.default_rng(seed).normal(0, 0.01, len(DAYS))
+    if noise_seed is not None:
+        steps += np.random.default_rng(noise_seed).normal(0, 0.0005, len(DAYS))
+    return pd.Series(100 * np.exp(np.cumsum(steps)), index=DAYS)
+
+
+def pending_row(symbol: str, signals: dict, cfg: dict) -> dict:
+    return {
+        "symbol": symbol,
+        "yahoo_symbol": f"{symbol}.NS",
+        "tech_score": technical_score(signals, cfg["scoring"]["weights"]),
+        "signals": signals,
+        "last_close": 100.0,
+        "avg_price": 100.0,
+        "fundamentals": None,
+        "fund_status": "pending",
+    }
+
+
+def test_lazy_fetch_skips_hopeless_stocks_and_stops_early(cfg, monkeypatch, capsys):
+    # A buy threshold of 70 needs a technical score of at least 40
+    cfg = {**cfg, "thresholds": {**cfg["thresholds"], "buy_threshold": 70}}
+    rows = (
+        [
+            pending_row(f"H{i}", {"momentum": 1, "rsi": 1, "macd": 1}, cfg)
+            for i in range(6)
+        ]
+        + [pending_row(f"M{i}", {"momentum": 1, "macd": 1}, cfg) for i in range(10)]
+        + [pending_row(f"X{i}", {"rsi": 1}, cfg) for i in range(10)]
+    )
+    assert rows[-1]["tech_score"] < fundamentals_cutoff(70) < rows[6]["tech_score"]
+    fetched = []
+
+    def fetch(row, cfg, cache=None):
+        time.sleep(0.02)
+        fetched.append(row["symbol"])
+        return {**row, "fundamentals": BEST_FUNDAMENTALS, "fund_status": "ok"}
+
+    monkeypatch.setattr(main, "collect_fundamentals", fetch)
+    monkeypatch.setattr(main, "MAX_WORKERS", 1)  # Fetch in rank order
+    merged, timed_out = main.fetch_fundamentals_lazily(rows, cfg)
+
+    # Once the 6 leaders hold the top 5 at 93.5, M (at most 80.4) cannot displace them
+    assert not timed_out
+    assert fetched[:6] == [f"H{i}" for i in range(6)]
+    assert len(fetched) <= 7  # The fetch already running when the stop came
+    assert not any(symbol.startswith("X") for symbol in fetched)
+    assert sum(row["fund_status"] == "ok" for row in merged) == len(fetched)
+    assert f"Skipped {26 - len(fetched)} of 26" in capsys.readouterr().out
+
+
+def test_lazy_fetch_keeps_fetching_until_the_diversified_top_n_is_full(
+    cfg, monkeypatch
+):
+    cfg = {**cfg, "diversification": {"max_correlation": 0.8, "lookback_days": 60}}
+    cache = ScanCache()
+    rows = []
+
+    def add(symbol: str, signals: dict, closes: pd.Series) -> None:
+        cache.set_history(f"{symbol}.NS", pd.DataFrame({"Close": closes}))
+        rows.append(pending_row(symbol, signals, cfg))
+
+    # 8 leaders moving together, 30 uncorrelated qualifiers, then a weak tail
+    for i in range(8):
+        add(f"L{i}", {"momentum": 1, "rsi": 1, "macd": 1}, walk(0, noise_seed=i))
+    for i in range(30):
+        add(f"Q{i}", {"momentum": 1, "rsi": 1, "macd": 0}, walk(100 + i))
+    for i in range(100):
+        add(f"T{i}", {"momentum": 0, "rsi": 0, "macd": 1}, walk(200 + i))
+
+    def fetch(row, cfg, cache=None):
+        time.sleep(0.02)  # Requests are slow next to the stop check
+        return {**row, "fundamentals": BEST_FUNDAMENTALS, "fund_status": "ok"}
+
+    monkeypatch.setattr(main, "collect_fundamentals", fetch)
+    monkeypatch.setattr(main, "MAX_WORKERS", 1)  # Fetch in rank order
+    rows, _ = main.fetch_fundamentals_lazily(rows, cfg, cache)
+
+    results = sorted(
+        (r for r in finalize_scores(rows, cfg) if r["final_score"] is not None),
+        key=lambda r: r["final_score"],
+        reverse=True,
+    )
+    closes = cache.closes({row["symbol"]: row["yahoo_symbol"] for row in rows})
+    picks, skipped = select_diversified(results, closes, 5, 0.8)
+    assert [p["symbol"][0] for p in picks] == ["L", "Q", "Q", "Q", "Q"]
+    assert set(skipped) == {f"L{i}" for i in range(1, 8)}
+    tail_fetched = sum(r["fund_status"] == "ok" for r in rows if r["symbol"][0] == "T")
+    assert tail_fetched < 10  # The tail cannot displace a pick and is skipped
+
+
+def test_fetches_finishing_after_the_deadline_leave_the_rows_alone(cfg, monkeypatch):
+    rows = [
+        {
+            "symbol": f"S{i}",
+            "tech_score": 60.0,
+            "signals": None,
+            "last_close": 100.0,
+            "avg_price": 100.0,
+            "fundamentals": None,
+            "fund_status": "pending",
+        }
+        for i in range(4)
+    ]
+
+    def fetch(row, cfg, cache=None):
+        time.sleep(0.3)  # Still running when the deadline passes
+        return {**row, "fundamentals": BEST_FUNDAMENTALS, "fund_status": "ok"}
+
+    monkeypatch.setattr(main, "collect_fundamentals", fetch)
+    merged, timed_out = main.fetch_fundamentals_lazily(
+        rows, cfg, deadline=main.Deadline(time.time() + 0.1)
+    )
+    time.sleep(0.4)  # Let the abandoned fetches finish
+    assert timed_out
+    assert [row["fund_status"] for row in merged] == ["pending"] * 4
+    assert all(row["fundamentals"] is None for row in rows + merged)
@@ -0,0 +1,48 @@
+"""
+Incremental history fetches of utils/market_data.py, against a fake ticker.
+"""
+
+# Import Dependencies
+import pandas as pd
+from utils.cache import ScanCache
+from utils.market_data import fetch_history
+
+
+class FakeTicker:
+    # Serves daily bars from a fixed frame and records every request
+    def __init__(self, bars: pd.DataFrame):
+        self.ticker = "FAKE.NS"
+        self.bars = bars
+        self.requests = []
+
+    def history(self, start=None, **kwargs):
+        self.requests.append(pd.Timestamp(start))
+        return self.bars[self.bars.index.date >= start]
+
+
+def daily_bars(days: int = 400) -> pd.DataFrame:
+    end = pd.Timestamp.now(tz="Asia/Kolkata").normalize()
+    index = pd.bdate_range(end=end, periods=days, tz="Asia/Kolkata")
+    return pd.DataFrame({"Close": range(days)}, index=index, dtype=float)
+
+
+def test_cold_fetch_requests_only_the_window():
+    ticker = FakeTicker(daily_bars())
+    data = fetch_history(ticker, window=pd.Timedelta(days=120))
+    assert data.index[0] >= data.index[-1] - pd.Timedelta(days=120)
+    assert len(data) < 100
+
+
+def test_warm_fetch_requests_only_new_bars():
+    ticker, cache = FakeTicker(daily_bars()), ScanCache()
+    fetch_history(ticker, cache, window=pd.Timedelta(days=120))
+    fetch_history(ticker, cache, window=pd.Timedelta(days=120))
+    assert ticker.requests[1] == pd.Timestamp(ticker.bars.index[-1].date())
+
+
+def test_longer_window_refetches_the_full_history():
+    ticker, cache = FakeTicker(daily_bars()), ScanCache()
+    short = fetch_history(ticker, cache, window=pd.Timedelta(days=60))
+    longer = fetch_history(ticker, cache, window=pd.Timedelta(days=200))
+    assert ticker.requests[1] < ticker.requests[0]
+    assert len(longer) > len(short)
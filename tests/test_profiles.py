@@ -0,0 +1,118 @@
+"""
+Subscriber profiles of utils/profiles.py.
+"""
+
+# Import Dependencies
+import pytest
+from utils.exceptions import ConfigError
+from utils.indicator_registry import history_window, technical_score
+from utils.profiles import (
+    resolve_profiles,
+    signal_config,
+    profile_tech_scores,
+    rescore_for_profiles,
+    subscribers,
+)
+
+
+@pytest.fixture
+def profile_cfg(cfg):
+    return {
+        **cfg,
+        "profiles": {
+            "macd_fans": {"weights": {"macd": 1}, "top_n": 1},
+            "banks": {"sectors": ["Financial Services"], "max_price": 1000},
+        },
+    }
+
+
+def result(symbol, signals, fund_score=50.0, last_close=100.0, sector=None):
+    return {
+        "symbol": symbol,
+        "signals": signals,
+        "tech_score": None,
+        "fund_score": fund_score,
+        "last_close": last_close,
+        "sector": sector,
+    }
+
+
+def test_profiles_inherit_the_global_settings(profile_cfg):
+    profiles = resolve_profiles(profile_cfg)
+    assert list(profiles) == ["default", "macd_fans", "banks"]
+    assert profiles["banks"]["weights"] == profile_cfg["scoring"]["weights"]
+    assert profiles["macd_fans"]["buy_threshold"] == 20
+
+
+def test_unknown_profile_setting_is_a_config_error(cfg):
+    with pytest.raises(ConfigError):
+        resolve_profiles({**cfg, "profiles": {"odd": {"buy_treshold": 10}}})
+
+
+def test_profile_weights_adding_up_to_zero_are_a_config_error(cfg):
+    with pytest.raises(ConfigError):
+        resolve_profiles({**cfg, "profiles": {"none": {"weights": {"rsi": 0}}}})
+
+
+def test_signal_config_evaluates_every_weighted_indicator(cfg):
+    cfg = {**cfg, "scoring": {**cfg["scoring"], "weights": {"momentum": 1, "rsi": 0}}}
+    cfg["profiles"] = {"rsi_only": {"weights": {"rsi": 2}}}
+    assert signal_config(cfg)["scoring"]["weights"] == {"momentum": 1, "rsi": 2}
+
+
+def test_a_profile_only_indicator_lengthens_the_history_window(cfg):
+    cfg = {**cfg, "scoring": {**cfg["scoring"], "weights": {"momentum": 1, "macd": 0}}}
+    cfg["profiles"] = {"macd_fans": {"weights": {"macd": 20}}}
+    macd_only = {**cfg, "scoring": {**cfg["scoring"], "weights": {"macd": 20}}}
+    assert history_window(signal_config(cfg)) > history_window(cfg)
+    assert history_window(signal_config(cfg)) >= history_window(macd_only)
+
+
+def test_profile_scores_match_scoring_each_profile_alone(profile_cfg):
+    profiles = resolve_profiles(profile_cfg)
+    rows = [
+        {"signals": {"momentum": 1.0, "rsi": 0.0, "macd": 1.0}},
+        {"signals": {"momentum": 0.0, "rsi": 1.0, "macd": 0.0}},
+    ]
+    scores = profile_tech_scores(rows, profiles)
+    for name, profile in profiles.items():
+        expected = [technical_score(row["signals"], profile["weights"]) for row in rows]
+        assert scores[name].tolist() == expected
+
+
+def test_rows_without_signals_keep_their_score(profile_cfg):
+    scores = profile_tech_scores([{"tech_score": 42.0}], resolve_profiles(profile_cfg))
+    assert scores.iloc[0].tolist() == [42.0, 42.0, 42.0]
+
+
+def test_rescoring_applies_price_and_sector_filters(profile_cfg):
+    results = [
+        result("BANK", {"macd": 1.0}, sector="Financial Services"),
+        result("PRICEY", {"macd": 1.0}, last_close=5000, sector="Financial Services"),
+        result("TECH", {"macd": 1.0}, sector="Technology"),
+    ]
+    rescored = rescore_for_profiles(results, resolve_profiles(profile_cfg))
+    finals = {
+        name: {r["symbol"]: r["final_score"] for r in ranked}
+        for name, ranked in rescored.items()
+    }
+    assert finals["macd_fans"] == {"BANK": 75.0, "PRICEY": 75.0, "TECH": 75.0}
+    assert finals["banks"]["BANK"] is not None
+    assert finals["banks"]["PRICEY"] is None and finals["banks"]["TECH"] is None
+
+
+def test_subscribers_are_grouped_by_profile(profile_cfg):
+    creds = {
+        "telegram": {
+            "chat_ids": ["1", "2", 3],
+            "subscribers": {"2": "banks", "4": "macd_fans"},
+        }
+    }
+    audiences = subscribers(creds, resolve_profiles(profile_cfg))
+    assert audiences == {"default": ["1", "3"], "banks": ["2"], "macd_fans": ["4"]}
+
+
+def test_subscribing_to_an_unknown_profile_is_a_config_error(profile_cfg):
+    creds = {"telegram": {"chat_ids": [], "subscribers": {"9": "nope"}}}
+    with pytest.raises(ConfigError):
+        subscribers(creds, resolve_profiles(profile_cfg))
@@ -0,0 +1,30 @@
+"""
+Stage profiling of utils/profiling.py across worker threads.
+"""
+
+# Import Dependencies
+import os
+import pstats
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from utils.profiling import ScanProfiler
+
+
+def busy_worker(n):
+    return sum(i * i for i in range(n))
+
+
+@pytest.mark.parametrize("mode", ["sample", "cprofile"])
+def test_worker_pools_are_profiled_by_stage(mode, tmp_path):
+    profiler = ScanProfiler(mode, output_dir=str(tmp_path), interval=0.001)
+    profiler.start()
+    with profiler.stage("technicals"):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert len(list(executor.map(busy_worker, [300_000] * 8))) == 8
+    directory = profiler.stop()
+
+    hottest = [function for function, _, _ in profiler.hottest("technicals")]
+    assert any(function.startswith("busy_worker") for function in hottest)
+    if mode == "cprofile":
+        stats = pstats.Stats(os.path.join(directory, "technicals.pstats")).stats
+        assert any(function == "busy_worker" for _, _, function in stats)
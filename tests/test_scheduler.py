@@ -0,0 +1,92 @@
+"""
+Cron parsing and trading calendar of utils/scheduler.py.
+"""
+
+# Import Dependencies
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+import pytest
+from utils.exceptions import ConfigError
+from utils.scheduler import (
+    parse_cron,
+    cron_matches,
+    is_trading_day,
+    is_market_open,
+    next_run,
+)
+
+IST = ZoneInfo("Asia/Kolkata")
+HOLIDAYS = {"holidays": ["2026-10-20"]}  # A Tuesday
+
+
+def at(day: int, hour: int, minute: int = 0) -> datetime:
+    # October 2026; the 19th is a Monday
+    return datetime(2026, 10, day, hour, minute, tzinfo=IST)
+
+
+def test_cron_fields_support_ranges_lists_and_steps():
+    minute, hour, day, month, weekday = parse_cron("*/15 9-11,14 1 * 1-5")
+    assert minute == {0, 15, 30, 45}
+    assert hour == {9, 10, 11, 14}
+    assert day == {1} and month == set(range(1, 13))
+    assert weekday == {1, 2, 3, 4, 5}
+
+
+def test_seven_is_an_alias_for_sunday():
+    cron = parse_cron("0 10 * * 7")
+    assert cron[4] == {0}
+    assert cron_matches(cron, at(18, 10))  # Sunday
+    assert not cron_matches(cron, at(19, 10))
+    assert parse_cron("0 10 * * 5-7")[4] == {0, 5, 6}
+    assert parse_cron("0 10 * * *")[4] == set(range(7))
+
+
+def test_restricted_day_of_month_and_weekday_match_either():
+    # The 1st of the month or any Monday, as in standard cron
+    cron = parse_cron("0 10 1 * 1")
+    assert cron_matches(cron, at(1, 10))  # A Thursday
+    assert cron_matches(cron, at(19, 10))  # A Monday
+    assert not cron_matches(cron, at(20, 10))
+    # With one of the two unrestricted, both must still match
+    assert not cron_matches(parse_cron("0 10 1 * *"), at(19, 10))
+    assert not cron_matches(parse_cron("0 10 * * 1"), at(1, 10))
+    # A range covering every day is unrestricted too
+    assert not cron_matches(parse_cron("0 10 1-31 * 1"), at(20, 10))
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["0 10 * *", "60 10 * * *", "0 10 * * 1-8", "0 x * * *", "*/0 * * * *"],
+)
+def test_invalid_cron_expressions_are_config_errors(expression):
+    with pytest.raises(ConfigError):
+        parse_cron(expression)
+
+
+def test_weekends_and_holidays_are_not_trading_days():
+    assert is_trading_day(date(2026, 10, 19))
+    assert not is_trading_day(date(2026, 10, 18))
+    assert not is_trading_day(date(2026, 10, 20), HOLIDAYS["holidays"])
+
+
+def test_market_hours_include_the_open_and_the_close():
+    assert not is_market_open(at(19, 9, 14), {})
+    assert is_market_open(at(19, 9, 15), {})
+    assert is_market_open(at(19, 15, 30), {})
+    assert not is_market_open(at(19, 15, 31), {})
+    assert not is_market_open(at(20, 12), HOLIDAYS)
+    assert is_market_open(at(19, 9, 0), {"market_open": "09:00"})
+
+
+def test_next_run_skips_holidays_and_closed_hours():
+    cron = parse_cron("0 * * * 1-5")
+    assert next_run(cron, at(19, 10, 30), HOLIDAYS) == at(19, 11)
+    # After the last session hour of Monday comes Wednesday's first, past the holiday
+    assert next_run(cron, at(19, 15), HOLIDAYS) == at(21, 10)
+    anytime = {**HOLIDAYS, "market_hours_only": False}
+    assert next_run(cron, at(19, 23, 30), anytime) == at(21, 0)
+
+
+def test_next_run_gives_up_when_nothing_matches():
+    # The 31st of February never comes
+    assert next_run(parse_cron("0 10 31 2 *"), at(19, 10), {}) is None
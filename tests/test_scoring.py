@@ -0,0 +1,127 @@
+"""
+Reference values and edge cases for the scoring helpers in utils/scoring.py.
+"""
+
+# Import Dependencies
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import random_walk
+from utils.scoring import (
+    compute_macd,
+    compute_technical_score,
+    normalize_0_1,
+    score_fundamentals,
+)
+from utils.indicator_registry import compile_plan, evaluate_plan
+
+
+def frame(prices) -> pd.DataFrame:
+    return pd.DataFrame({"Close": np.asarray(prices, dtype=float)})
+
+
+# -----------------------------
+# normalize_0_1
+# -----------------------------
+@pytest.mark.parametrize(
+    "value, expected", [(5, 0.5), (0, 0), (10, 1), (-3, 0), (15, 1)]
+)
+def test_normalize_0_1_reference_values(value, expected):
+    assert normalize_0_1(value, 0, 10) == expected
+
+
+def test_normalize_0_1_empty_range_is_zero():
+    assert normalize_0_1(5, 10, 10) == 0
+    assert normalize_0_1(5, 10, 0) == 0
+
+
+def test_normalize_0_1_invalid_value_is_zero():
+    assert normalize_0_1(None, 0, 10) == 0
+
+
+# -----------------------------
+# compute_macd
+# -----------------------------
+def test_compute_macd_rising_prices_are_bullish(cfg):
+    assert compute_macd(frame(np.linspace(10, 20, 60)), cfg) == 1
+
+
+def test_compute_macd_falling_prices_are_bearish(cfg):
+    assert compute_macd(frame(np.linspace(20, 10, 60)), cfg) == 0
+
+
+def test_compute_macd_flat_prices_are_not_bullish(cfg):
+    assert compute_macd(frame([5.0] * 60), cfg) == 0
+
+
+def test_compute_macd_without_close_is_zero(cfg):
+    assert compute_macd(pd.DataFrame({"Open": [1.0, 2.0]}), cfg) == 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compute_macd_matches_the_registry(cfg, seed):
+    data = frame(random_walk(seed=seed))
+    plan = compile_plan({"scoring": {**cfg["scoring"], "weights": {"macd": 1}}})
+    assert compute_macd(data.copy(), cfg) == evaluate_plan(plan, data)["macd"]
+
+
+# -----------------------------
+# Technical Score
+# -----------------------------
+def test_technical_score_of_rising_prices(cfg):
+    # Momentum and MACD fire, RSI is saturated at 100: (50 + 20) / 115
+    score = compute_technical_score(frame(np.linspace(10, 20, 60)), cfg)
+    assert score == round(70 / 115 * 100, 2)
+
+
+def test_technical_score_of_flat_prices_is_zero(cfg):
+    assert compute_technical_score(frame([5.0] * 60), cfg) == 0
+
+
+def test_technical_score_of_short_history_stays_in_range(cfg):
+    score = compute_technical_score(frame([10.0, 10.5, 10.2]), cfg)
+    assert 0 <= score <= 100
+
+
+def test_technical_score_scores_panels_like_single_series(cfg):
+    closes = pd.DataFrame({f"S{seed}": random_walk(seed=seed) for seed in range(4)})
+    plan = compile_plan(cfg)
+    signals = evaluate_plan(plan, pd.concat({"Close": closes}, axis=1))
+    for symbol in closes:
+        single = evaluate_plan(plan, frame(closes[symbol]))
+        assert {name: value[symbol] for name, value in signals.items()} == single
+
+
+# -----------------------------
+# Fundamental Score
+# -----------------------------
+def test_score_fundamentals_reference_and_defaults(cfg):
+    fundamentals = pd.DataFrame(
+        [
+            {  # Cheap, profitable, unlevered and growing: the best possible score
+                "pe": 10,
+                "roe": 0.3,
+                "debt_to_equity": 0,
+                "revenue_latest": 1e9,
+                "revenue_previous": 1,
+                "net_income_latest": 1e9,
+                "net_income_previous": 1,
+            },
+            {},  # Nothing known: configured defaults apply
+            {  # Expensive, loss-making, levered and shrinking: growth pulls below 0
+                "pe": 80,
+                "roe": -0.1,
+                "debt_to_equity": 5,
+                "revenue_latest": 1,
+                "revenue_previous": 1e9,
+                "net_income_latest": -1e9,
+                "net_income_previous": 1,
+            },
+        ]
+    )
+    scores = score_fundamentals(fundamentals, cfg)["fund_score"]
+    assert scores.iloc[0] == 100
+    # P/E 50 (0.5), ROE 0.15 (0.5), D/E 0.5 (0.75) and no growth (0): 1.75 / 5
+    assert scores.iloc[1] == 35.0
+    assert scores.iloc[2] == 0  # Floored, not negative
+    assert not scores.isna().any()
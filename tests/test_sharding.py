@@ -0,0 +1,69 @@
+"""
+Universe sharding and shard merging of utils/sharding.py.
+"""
+
+# Import Dependencies
+import argparse
+from datetime import date
+import pytest
+from utils.sharding import (
+    parse_shard,
+    shard_of,
+    select_shard,
+    shard_results_path,
+    write_shard_results,
+    merge_shard_results,
+)
+
+DAY = date(2026, 10, 19)
+UNIVERSE = [f"S{i}" for i in range(500)] + ["SBIN", "TCS", "INFY", "RELIANCE"]
+
+
+def result(symbol, final_score=50.0):
+    return {"symbol": symbol, "tech_score": 50.0, "final_score": final_score}
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    for value in ("0/4", "5/4", "1/0", "2", "a/b"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(value)
+
+
+def test_crc32_partition_is_fixed_and_complete():
+    # CRC32 values, so every host and Python run agrees on the owner
+    assert [shard_of(s, 4) for s in ("SBIN", "TCS", "INFY", "RELIANCE")] == [2, 3, 3, 1]
+    shards = [select_shard(UNIVERSE, i, 4) for i in range(1, 5)]
+    assert sorted(sum(shards, [])) == sorted(UNIVERSE)
+    assert all(len(shard) > 100 for shard in shards)  # Roughly even
+
+
+def test_merge_combines_every_shard(tmp_path):
+    paths = []
+    for index in (1, 2):
+        path = shard_results_path(index, 2, DAY, str(tmp_path))
+        write_shard_results(
+            path, index, 2, DAY, [result(f"S{index}")], [f"X{index}"], total=3
+        )
+        paths.append(path)
+
+    results, skipped, coverage = merge_shard_results(paths)
+    assert [r["symbol"] for r in results] == ["S1", "S2"]
+    assert skipped == ["X1", "X2"]
+    assert coverage is None
+
+
+def test_missing_and_partial_shards_report_coverage(tmp_path):
+    path = shard_results_path(1, 3, DAY, str(tmp_path))
+    write_shard_results(path, 1, 3, DAY, [result("A"), result("B", None)], [], total=4)
+    results, _, coverage = merge_shard_results([path])
+    assert len(results) == 2
+    # Shards 2 and 3 never reported; only what shard 1 owned is counted
+    assert coverage == {"scored": 1, "total": 4}
+
+    cut = shard_results_path(2, 2, DAY, str(tmp_path))
+    write_shard_results(cut, 2, 2, DAY, [result("C")], [], total=5, partial=True)
+    whole = shard_results_path(1, 2, DAY, str(tmp_path))
+    write_shard_results(whole, 1, 2, DAY, [result("D")], [], total=1)
+    _, _, coverage = merge_shard_results([whole, cut])
+    assert coverage == {"scored": 2, "total": 6}